@@ -3,6 +3,7 @@ import datetime
 import typer
 from pathlib import Path
 from functools import wraps
+from contextlib import closing
 from rich.console import Console
 from rich.panel import Panel
 from rich.spinner import Spinner
@@ -813,7 +814,8 @@ def run_analysis():
     # Now start the display layout
     layout = create_layout()
 
-    with Live(layout, refresh_per_second=4) as live:
+    # Release the agents' memory stores when the analysis ends, however it ends
+    with closing(graph), Live(layout, refresh_per_second=4) as live:
         # Initial display
         update_display(layout)
 
@@ -849,15 +851,14 @@ def run_analysis():
         )
         update_display(layout, spinner_text)
 
-        # Initialize state and get graph args
+        # Initialize state
         init_agent_state = graph.propagator.create_initial_state(
             selections["ticker"], selections["analysis_date"]
         )
-        args = graph.propagator.get_graph_args()
 
         # Stream the analysis
         trace = []
-        for chunk in graph.graph.stream(init_agent_state, **args):
+        for chunk in graph.stream(init_agent_state):
             if len(chunk["messages"]) > 0:
                 # Get the last message from the chunk
                 last_message = chunk["messages"][-1]
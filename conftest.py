@@ -0,0 +1,21 @@
+import pytest
+
+import tradingagents.dataflows.config as dataflows_config
+
+
+@pytest.fixture
+def data_config(tmp_path, monkeypatch, request):
+    """Dataflows config for one test, with its caches under ``tmp_path / "cache"``.
+
+    Parametrise indirectly with a dict to override more keys. Anything the
+    test changes through ``set_config`` is undone afterwards. Returns the
+    resulting config.
+    """
+    monkeypatch.setattr(dataflows_config, "_config", dataflows_config.get_config())
+    monkeypatch.setattr(dataflows_config, "DATA_DIR", dataflows_config.DATA_DIR)
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    overrides = {"data_cache_dir": str(cache_dir)}
+    overrides.update(getattr(request, "param", None) or {})
+    dataflows_config.set_config(overrides)
+    return dataflows_config.get_config()
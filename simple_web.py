@@ -119,6 +119,7 @@ def get_status(session_id):
 
 def run_analysis_background(session_id: str, config: Dict):
     """Run the trading analysis in background thread"""
+    graph = None
     try:
         buffer = analysis_sessions[session_id]['buffer']
         
@@ -150,14 +151,11 @@ def run_analysis_background(session_id: str, config: Dict):
         buffer.add_message("System", f"Starting analysis for {config['ticker']} on {config['analysis_date']}")
         buffer.update_progress(10, "Initializing analysis...")
         
-        # Get graph args
-        args = graph.propagator.get_graph_args()
-        
         # Stream the analysis
         step_count = 0
         total_steps = len(config['analysts']) * 2 + 5
         
-        for chunk in graph.graph.stream(init_state, **args):
+        for chunk in graph.stream(init_state):
             step_count += 1
             progress = min(90, (step_count / total_steps) * 80 + 10)
             
@@ -216,6 +214,10 @@ def run_analysis_background(session_id: str, config: Dict):
         buffer.add_message("Error", f"Analysis failed: {str(e)}")
         buffer.update_progress(0, "Analysis failed")
         analysis_sessions[session_id]['status'] = 'failed'
+    finally:
+        # Release the session's memory stores
+        if graph is not None:
+            graph.close()
 
 if __name__ == '__main__':
     # Create templates directory if it doesn't exist
@@ -0,0 +1,43 @@
+import time
+
+import pytest
+
+from tradingagents.dataflows.cassette import CassetteMiss, cassette_call
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.disk_cache import MISSING, DiskCache
+
+
+@pytest.mark.parametrize("data_config", [{"cassette_path": None}], indirect=True)
+def test_record_then_replay(data_config):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"price": 42.0}
+
+    set_config({"data_mode": "record"})
+    assert cassette_call("coingecko", {"endpoint": "/global"}, fetch) == {"price": 42.0}
+
+    set_config({"data_mode": "replay"})
+    assert cassette_call("coingecko", {"endpoint": "/global"}, fetch) == {"price": 42.0}
+    assert len(calls) == 1
+
+    with pytest.raises(CassetteMiss):
+        cassette_call("coingecko", {"endpoint": "/search/trending"}, fetch)
+
+
+def test_disk_cache_evicts_expired_then_oldest(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"))
+    for i in range(5):
+        cache.set(f"k{i}", "x" * 1000)
+        time.sleep(0.01)
+    assert cache.evict(max_age=3600) == 0
+
+    # Room for two stored values keeps the newest two
+    size = len(cache._conn.execute("SELECT value FROM entries WHERE key='k4'").fetchone()[0])
+    assert cache.evict(max_bytes=2 * size) == 3
+    assert cache.get("k0") is MISSING and cache.get("k4") == "x" * 1000
+    assert len(cache) == 2
+
+    time.sleep(0.05)
+    assert cache.evict(max_age=0.01) == 2
@@ -0,0 +1,96 @@
+import threading
+
+from tradingagents.dataflows.coin_resolver import UNRANKED, CoinIdResolver
+
+
+class FakeAPI:
+    """Serves /coins/list and /coins/markets like CoinGecko, page size included."""
+
+    def __init__(self, coins, ranks):
+        self.coins = coins
+        self.ranks = ranks
+        self.calls = []
+
+    def _make_request(self, endpoint, params=None):
+        self.calls.append((endpoint, params))
+        if endpoint == "/coins/list":
+            return self.coins
+        per_page = params.get("per_page", 100)
+        if "ids" in params:
+            ids = params["ids"].split(",")
+        else:
+            ranked = sorted(self.ranks, key=self.ranks.get)
+            ids = ranked[(params["page"] - 1) * per_page:]
+        return [
+            {"id": coin_id, "market_cap_rank": self.ranks.get(coin_id)}
+            for coin_id in ids[:per_page]
+        ]
+
+
+def test_index_is_ranked_by_market_cap_and_kept_for_ttl(tmp_path):
+    coins = [
+        {"id": "abc-small", "symbol": "abc"},
+        {"id": "abc-big", "symbol": "abc"},
+        {"id": "lone", "symbol": "xyz"},
+    ]
+    api = FakeAPI(coins, {"abc-big": 3, "abc-small": 40})
+    cache_path = str(tmp_path / "coin_index.json")
+
+    resolver = CoinIdResolver(cache_path, ttl_seconds=3600, rank_pages=1)
+    assert resolver.resolve("ABC", api) == "abc-big"
+    assert resolver.resolve("xyz", api) == "lone"
+    assert resolver.resolve("nope", api) is None
+    assert [endpoint for endpoint, _ in api.calls].count("/coins/list") == 1
+
+    # A fresh resolver reads the index from disk while it is within its TTL
+    api.calls.clear()
+    assert CoinIdResolver(cache_path, ttl_seconds=3600).resolve("abc", api) == "abc-big"
+    assert api.calls == []
+
+    # Once expired, the index is downloaded again
+    api.ranks = {"abc-small": 1, "abc-big": 2}
+    assert CoinIdResolver(cache_path, ttl_seconds=0, rank_pages=1).resolve("abc", api) == "abc-small"
+    assert api.calls[0][0] == "/coins/list"
+
+
+def test_unranked_candidates_are_ranked_in_one_request(tmp_path):
+    coins = [{"id": f"dup-{i:03d}", "symbol": "dup"} for i in range(150)]
+    # Only a coin past the API's default page of 100 has a market cap rank
+    api = FakeAPI(coins, {"dup-120": 900})
+    resolver = CoinIdResolver(str(tmp_path / "coin_index.json"), rank_pages=0)
+
+    assert resolver.resolve("dup", api) == "dup-120"
+    endpoint, params = api.calls[-1]
+    assert endpoint == "/coins/markets" and params["per_page"] == 150
+    assert resolver._index["dup"][1] == ["dup-000", UNRANKED]
+
+    # The ranking is persisted, so it is not requested again
+    api.calls.clear()
+    assert resolver.resolve("dup", api) == "dup-120"
+    assert api.calls == []
+
+
+def test_lookups_use_stale_index_while_rebuilding(tmp_path):
+    cache_path = str(tmp_path / "coin_index.json")
+    api = FakeAPI([{"id": "old", "symbol": "abc"}], {})
+    CoinIdResolver(cache_path, rank_pages=0).resolve("abc", api)
+
+    started, release = threading.Event(), threading.Event()
+
+    class SlowAPI(FakeAPI):
+        def _make_request(self, endpoint, params=None):
+            started.set()
+            release.wait(5)
+            return super()._make_request(endpoint, params)
+
+    resolver = CoinIdResolver(cache_path, ttl_seconds=0, rank_pages=0)
+    slow = SlowAPI([{"id": "new", "symbol": "abc"}], {})
+    rebuild = threading.Thread(target=resolver.resolve, args=("abc", slow))
+    rebuild.start()
+    assert started.wait(5)
+
+    # The download is in progress; other lookups are answered from the old index
+    assert resolver.resolve("abc", slow) == "old"
+    release.set()
+    rebuild.join()
+    assert resolver._index["abc"] == [["new", None]]
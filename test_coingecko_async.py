@@ -0,0 +1,119 @@
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+
+import tradingagents.dataflows.coingecko_async as coingecko_async
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.crypto_price_store import get_price_store
+from tradingagents.dataflows.rate_limiter import TokenBucket
+
+HOUR = 3600
+
+
+@pytest.fixture
+def fast_api(data_config, monkeypatch):
+    """Route AsyncCoinGeckoAPI through a mock transport with a fresh price store."""
+    set_config({"crypto_price_store": True})
+    monkeypatch.setattr(
+        coingecko_async, "get_coingecko_rate_limiter",
+        lambda api_key=None: TokenBucket(rate_per_minute=60000),
+    )
+    monkeypatch.setattr(coingecko_async, "backoff_delay", lambda attempt: 0.01)
+
+    def install(handler):
+        transport = httpx.MockTransport(handler)
+        original = coingecko_async.AsyncCoinGeckoAPI
+        monkeypatch.setattr(
+            coingecko_async, "AsyncCoinGeckoAPI",
+            lambda api_key=None: original(api_key, transport=transport),
+        )
+
+    return install
+
+
+def _chart(from_ts, to_ts):
+    points = range(from_ts - from_ts % HOUR, to_ts + 1, HOUR)
+    return {
+        "prices": [[ts * 1000, float(ts % 1000)] for ts in points],
+        "total_volumes": [[ts * 1000, 1.0] for ts in points],
+        "market_caps": [[ts * 1000, 2.0] for ts in points],
+    }
+
+
+def test_calls_run_concurrently_over_one_client(fast_api):
+    in_flight = []
+    peak = []
+
+    async def handler(request):
+        in_flight.append(request)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.1)
+        in_flight.remove(request)
+        if request.url.path.endswith("/global"):
+            return httpx.Response(200, json={"data": {"active_cryptocurrencies": 9000}})
+        if request.url.path.endswith("/search/trending"):
+            return httpx.Response(200, json={"coins": [{"item": {"name": "Bitcoin", "symbol": "BTC"}}]})
+        return httpx.Response(200, json=[{"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"}])
+
+    fast_api(handler)
+    results = coingecko_async.run_crypto_data_calls([
+        ("get_crypto_news", {"symbol": "BTC", "curr_date": "2024-06-01"}),
+        ("get_crypto_market_data", {"symbol": "BTC"}),
+        ("get_crypto_market_data", {"symbol": "ETH"}),
+        ("get_crypto_news", {"symbol": "XYZ", "look_back_days": 3}),  # missing curr_date
+    ])
+
+    # All four requests (news makes two) were in flight at once
+    assert max(peak) == 4
+    assert "Active Cryptocurrencies: 9,000" in results[0]
+    assert "**Name:** Bitcoin" in results[1]
+    assert results[3].startswith("Error in get_crypto_news:")
+
+
+def test_retries_after_429(fast_api):
+    statuses = iter([429, 503, 200])
+
+    def handler(request):
+        status = next(statuses)
+        if status != 200:
+            return httpx.Response(status, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"data": {"active_cryptocurrencies": 1}})
+
+    fast_api(handler)
+
+    async def fetch_global():
+        async with coingecko_async.AsyncCoinGeckoAPI() as api:
+            return await api._make_request("/global")
+
+    assert asyncio.run(fetch_global()) == {"data": {"active_cryptocurrencies": 1}}
+    assert next(statuses, None) is None
+
+
+def test_price_series_merges_into_price_store(fast_api):
+    windows = []
+
+    def handler(request):
+        from_ts, to_ts = int(request.url.params["from"]), int(request.url.params["to"])
+        windows.append((from_ts, to_ts))
+        return httpx.Response(200, json=_chart(from_ts, to_ts))
+
+    fast_api(handler)
+    first = coingecko_async.run_crypto_data_calls([
+        ("get_crypto_price_data", {"symbol": "BTC", "start_date": "2024-01-01", "end_date": "2024-01-20"}),
+    ])[0]
+    assert len(windows) == 1 and "## BTC Price Data" in first
+
+    # A longer window fetches only the days that are not stored yet
+    windows.clear()
+    coingecko_async.run_crypto_data_calls([
+        ("get_crypto_price_data", {"symbol": "BTC", "start_date": "2024-01-01", "end_date": "2024-01-30"}),
+    ])
+    end = int(datetime(2024, 1, 30).timestamp())
+    assert len(windows) == 1 and windows[0][1] == end
+    assert windows[0][0] >= int(datetime(2024, 1, 18).timestamp())
+
+    stored = get_price_store().read("bitcoin", "hourly", int(datetime(2024, 1, 1).timestamp()), end)
+    timestamps = stored["timestamps"]
+    assert (timestamps[1:] - timestamps[:-1] == HOUR * 1000).all()
@@ -0,0 +1,166 @@
+import os
+import threading
+import time
+
+import pytest
+import requests
+
+from tradingagents.dataflows.cassette import CassetteMiss
+from tradingagents.dataflows.coingecko_utils import (
+    MAJOR_COIN_IDS,
+    fetch_market_snapshots,
+    get_coingecko_client,
+    get_crypto_indicators,
+    get_crypto_market_snapshots,
+    get_crypto_price_data,
+    get_crypto_technical_indicators,
+)
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.rate_limiter import TokenBucket
+
+
+class _Response:
+    def __init__(self, payload, status_code=200, headers=None):
+        self.payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+def test_pooled_session_is_reused_across_threads(monkeypatch):
+    client = get_coingecko_client()
+    monkeypatch.setattr(client, "rate_limiter", TokenBucket(rate_per_minute=60000))
+    sessions = []
+
+    def fake_get(self, url, params=None, timeout=None):
+        sessions.append(self)
+        return _Response({"data": {}})
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+
+    clients = []
+
+    def call():
+        api = get_coingecko_client()
+        clients.append(api)
+        api._fetch("/global")
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all(api is client for api in clients)
+    assert len(sessions) == 4 and all(session is client.session for session in sessions)
+    adapter = client.session.get_adapter("https://api.coingecko.com")
+    assert adapter._pool_maxsize == get_config()["coingecko_pool_size"]
+
+
+def test_market_snapshots_come_from_one_markets_request(monkeypatch):
+    client = get_coingecko_client()
+    requests_made = []
+
+    def fake_request(endpoint, params=None):
+        requests_made.append((endpoint, params))
+        return [
+            {
+                "id": "bitcoin",
+                "symbol": "btc",
+                "name": "Bitcoin",
+                "current_price": 60000.0,
+                "market_cap": 1.2e12,
+                "total_volume": 3e10,
+                "price_change_percentage_24h": 1.5,
+                "price_change_percentage_7d_in_currency": -2.0,
+                "price_change_percentage_30d_in_currency": None,
+                "market_cap_rank": 1,
+                "circulating_supply": 19.7e6,
+                "total_supply": 21e6,
+                "ath": 73000.0,
+                "atl": 67.8,
+                "description": {"en": "dropped"},
+            },
+            {"id": "ethereum", "symbol": "eth", "name": "Ethereum", "current_price": 3000.0},
+        ]
+
+    monkeypatch.setattr(client, "_make_request", fake_request)
+    monkeypatch.setattr(client, "get_coin_id", lambda symbol: MAJOR_COIN_IDS.get(symbol.lower()))
+
+    snapshots = fetch_market_snapshots(["btc", "ETH", "BTC", "ADA", "unknown"])
+
+    assert len(requests_made) == 1
+    endpoint, params = requests_made[0]
+    assert endpoint == "/coins/markets"
+    assert params["ids"] == "bitcoin,ethereum,cardano"
+    assert params["price_change_percentage"] == "24h,7d,30d"
+
+    assert set(snapshots) == {"BTC", "ETH"}
+    btc = snapshots["BTC"]
+    assert btc["id"] == "bitcoin" and btc["symbol"] == "BTC"
+    assert btc["price_change_24h"] == 1.5  # falls back to the plain 24h field
+    assert btc["price_change_7d"] == -2.0
+    assert btc["price_change_30d"] == 0
+    assert "description" not in btc
+    eth = snapshots["ETH"]
+    assert eth["market_cap"] == 0 and eth["market_cap_rank"] is None
+
+    table = get_crypto_market_snapshots(["BTC", "ETH", "ADA"])
+    assert "| BTC | Bitcoin | $60,000.00 | +1.50% | -2.00% | +0.00% |" in table
+    assert "| ETH | Ethereum | $3,000.00 |" in table and "#N/A" in table
+    assert "No market data available for: ADA" in table
+
+
+def test_crypto_tools_replay_what_they_recorded(data_config, tmp_path, monkeypatch):
+    client = get_coingecko_client()
+    requested = []
+
+    def fake_fetch(endpoint, params=None):
+        requested.append(endpoint)
+        if not endpoint.endswith("/market_chart/range"):
+            return {}  # how _fetch reports a failed request
+        points = range(params["from"] - params["from"] % 3600, params["to"] + 1, 3600)
+        return {
+            "prices": [[ts * 1000, 100.0 + (ts // 3600) % 50] for ts in points],
+            "total_volumes": [[ts * 1000, 1e6] for ts in points],
+            "market_caps": [[ts * 1000, 1e9] for ts in points],
+        }
+
+    def run_tools():
+        return [
+            get_crypto_price_data("BTC", "2024-01-01", "2024-01-20"),
+            get_crypto_technical_indicators("BTC", "2024-03-01", 30),
+            get_crypto_indicators("BTC", "2024-03-01", 10, ["close_10_ema", "rsi"]),
+        ]
+
+    monkeypatch.setattr(client, "_fetch", fake_fetch)
+    set_config({
+        "cassette_path": str(tmp_path / "cassette.sqlite"),
+        "crypto_price_store": True,
+        "data_mode": "record",
+        "data_cache_dir": str(tmp_path / "recorder"),
+    })
+    recorded = run_tools()
+    assert "## BTC Price Data" in recorded[0] and "| close_10_ema | rsi |" in recorded[2]
+    assert client._make_request("/global") == {}
+    # Recording bypasses the local price store
+    assert not os.path.exists(tmp_path / "recorder" / "crypto_prices")
+
+    def offline(endpoint, params=None):
+        raise AssertionError(f"replay requested {endpoint}")
+
+    monkeypatch.setattr(client, "_fetch", offline)
+    # Replay a day later, against an empty cache directory
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 86400)
+    set_config({"data_mode": "replay", "data_cache_dir": str(tmp_path / "replayer")})
+    assert run_tools() == recorded
+
+    # The failed /global answer was not archived as if it were real
+    with pytest.raises(CassetteMiss):
+        client._make_request("/global")
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows.crypto_indicators import (
+    compute_indicators,
+    parse_indicator,
+    warmup_periods,
+)
+
+
+def test_indicators_match_pandas():
+    rng = np.random.default_rng(7)
+    closes = 100 + np.cumsum(rng.normal(size=400))
+    volumes = rng.uniform(1, 5, size=400)
+    s = pd.Series(closes)
+
+    values = compute_indicators(
+        closes, volumes, ["close_10_ema", "close_50_sma", "macd", "macds", "rsi", "boll_ub", "vwma"]
+    )
+
+    macd = s.ewm(span=12).mean() - s.ewm(span=26).mean()
+    diff = s.diff().fillna(0)
+    gains = diff.clip(lower=0).ewm(alpha=1 / 14).mean()
+    losses = (-diff).clip(lower=0).ewm(alpha=1 / 14).mean()
+    vwma = (s * volumes).rolling(20).sum() / pd.Series(volumes).rolling(20).sum()
+    expected = {
+        "close_10_ema": s.ewm(span=10).mean(),
+        "close_50_sma": s.rolling(50).mean(),
+        "macd": macd,
+        "macds": macd.ewm(span=9).mean(),
+        "rsi": 100 - 100 / (1 + gains / losses),
+        "boll_ub": s.rolling(20).mean() + 2 * s.rolling(20).std(),
+        "vwma": vwma,
+    }
+    # The first bar has no price change, which pandas leaves undefined for RSI
+    for name, series in expected.items():
+        np.testing.assert_allclose(
+            values[name][1:], series.to_numpy()[1:], rtol=1e-9, atol=1e-8, err_msg=name
+        )
+
+
+def test_indicator_names():
+    assert parse_indicator("close_200_sma") == ("sma", 200)
+    assert parse_indicator("rsi") == ("rsi", 14)
+    assert parse_indicator("atr_7") == ("atr", 7)
+    assert warmup_periods(["close_50_sma", "rsi"]) == 56
+    with pytest.raises(ValueError):
+        parse_indicator("stochrsi")
+
+
+def test_missing_closes_do_not_blank_later_values():
+    rng = np.random.default_rng(3)
+    closes = 100 + np.cumsum(rng.normal(size=120))
+    volumes = rng.uniform(1, 5, size=120)
+    gappy = closes.copy()
+    gappy[:2] = np.nan  # no price yet
+    gappy[60] = np.nan  # a missing day
+    names = ["close_10_ema", "macds", "rsi", "atr", "vwma"]
+
+    values = compute_indicators(gappy, volumes, names)
+
+    filled = closes.copy()
+    filled[60] = filled[59]
+    expected = compute_indicators(filled[2:], volumes[2:], names)
+    for name in names:
+        assert np.isnan(values[name][:2]).all()
+        assert not np.isnan(values[name][-50:]).any(), name
+        np.testing.assert_allclose(values[name][2:], expected[name], err_msg=name)
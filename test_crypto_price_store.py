@@ -0,0 +1,51 @@
+from tradingagents.dataflows.crypto_price_store import CryptoPriceStore
+
+DAY = 86400
+
+
+def _fake_fetch(calls):
+    def fetch(from_ts, to_ts):
+        calls.append((from_ts, to_ts))
+        points = range(from_ts - from_ts % 3600, to_ts + 1, 3600)
+        return {
+            "prices": [[ts * 1000, float(ts)] for ts in points],
+            "total_volumes": [[ts * 1000, 1.0] for ts in points],
+            "market_caps": [[ts * 1000, 2.0] for ts in points],
+        }
+
+    return fetch
+
+
+def test_window_is_served_from_disk_after_first_fetch(tmp_path):
+    start, end = 1_600_000_000, 1_600_000_000 + 30 * DAY
+    calls = []
+    store = CryptoPriceStore(str(tmp_path))
+
+    first = store.get_range("bitcoin", start, end, _fake_fetch(calls))
+    assert len(calls) == 1
+    assert first["timestamps"][0] >= start * 1000
+    assert first["timestamps"][-1] <= end * 1000
+
+    # A fresh store instance reads the same data back without fetching
+    calls.clear()
+    second = CryptoPriceStore(str(tmp_path)).get_range(
+        "bitcoin", start + DAY, end - DAY, _fake_fetch(calls)
+    )
+    assert calls == []
+    assert len(second["prices"]) == len(first["prices"]) - 48
+
+
+def test_only_missing_range_is_fetched(tmp_path):
+    start = 1_600_000_000
+    calls = []
+    store = CryptoPriceStore(str(tmp_path))
+    store.get_range("bitcoin", start, start + 30 * DAY, _fake_fetch(calls))
+
+    calls.clear()
+    result = store.get_range("bitcoin", start, start + 40 * DAY, _fake_fetch(calls))
+    assert len(calls) == 1
+    assert calls[0][1] == start + 40 * DAY
+    assert calls[0][0] >= start + 30 * DAY - 2 * DAY
+    # No duplicated buckets where the fetches overlap
+    timestamps = result["timestamps"]
+    assert (timestamps[1:] > timestamps[:-1]).all()
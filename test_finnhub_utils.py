@@ -0,0 +1,21 @@
+import json
+import os
+
+from tradingagents.dataflows.finnhub_utils import get_data_in_range
+
+
+def test_range_keeps_file_order_and_reloads_changed_files(tmp_path):
+    folder = tmp_path / "finnhub_data" / "news_data"
+    folder.mkdir(parents=True)
+    path = folder / "TST_data_formatted.json"
+    data = {"2024-01-03": [{"h": 3}], "2024-01-01": [{"h": 1}], "2024-01-02": [], "2024-01-09": [{"h": 9}]}
+    path.write_text(json.dumps(data))
+
+    result = get_data_in_range("TST", "2024-01-01", "2024-01-05", "news_data", str(tmp_path))
+    assert list(result.items()) == [("2024-01-03", [{"h": 3}]), ("2024-01-01", [{"h": 1}])]
+
+    data["2024-01-04"] = [{"h": 4}]
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(1, 1))
+    result = get_data_in_range("TST", "2024-01-04", "2024-01-09", "news_data", str(tmp_path))
+    assert list(result) == ["2024-01-09", "2024-01-04"]
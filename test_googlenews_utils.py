@@ -0,0 +1,71 @@
+import pytest
+
+from tradingagents.dataflows import googlenews_utils
+
+ITEM = (
+    '<div class="SoaBEf"><a href="{link}"></a><div class="MBeuO">{title}</div>'
+    '<div class="GI74Re">snippet</div><div class="LfVVr">1 day ago</div>'
+    '<div class="NUnG9d"><span>Wire</span></div></div>'
+)
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content.encode()
+
+
+# Three result pages fetched at a time, results cached for six hours
+NEWS_CONFIG = {"google_news_workers": 3, "google_news_cache_ttl_hours": 6}
+
+
+@pytest.mark.parametrize("data_config", [NEWS_CONFIG], indirect=True)
+def test_pages_fetched_in_batches_and_cached(data_config, monkeypatch):
+    requested = []
+
+    def fake_request(url, headers):
+        page = int(url.rsplit("start=", 1)[1]) // 10
+        requested.append(page)
+        if page > 2:
+            return FakeResponse("<html></html>")
+        items = "".join(ITEM.format(link=f"l{page}{i}", title=f"p{page} i{i}") for i in range(2))
+        next_link = '<a id="pnnext"></a>' if page < 2 else ""
+        return FakeResponse(f"<html>{items}{next_link}</html>")
+
+    monkeypatch.setattr(googlenews_utils, "make_request", fake_request)
+
+    results = googlenews_utils.getNewsData("acme", "2024-01-01", "2024-01-07")
+    assert [r["title"] for r in results] == [f"p{p} i{i}" for p in range(3) for i in range(2)]
+    # page 0 alone, then pages 1-3 together; page 3 is past the end and is
+    # dropped (or cancelled before it starts)
+    assert requested[0] == 0 and sorted(requested)[:3] == [0, 1, 2] and max(requested) <= 3
+
+    requested.clear()
+    assert googlenews_utils.getNewsData("acme", "2024-01-01", "2024-01-07") == results
+    assert requested == []
+
+
+@pytest.mark.parametrize("data_config", [NEWS_CONFIG], indirect=True)
+def test_empty_results_are_not_cached_and_stale_rows_are_evicted(data_config, monkeypatch):
+    pages = []
+
+    def fake_request(url, headers):
+        pages.append(url)
+        return FakeResponse("<html></html>")
+
+    monkeypatch.setattr(googlenews_utils, "make_request", fake_request)
+    cache = googlenews_utils.get_result_cache()
+    cache.set("stale", ["old"])
+    cache._conn.execute("UPDATE entries SET created_at = 0 WHERE key = 'stale'")
+
+    assert googlenews_utils.getNewsData("nothing", "2024-01-01", "2024-01-07") == []
+    assert googlenews_utils.getNewsData("nothing", "2024-01-01", "2024-01-07") == []
+    assert len(pages) == 2
+    assert len(cache) == 1  # nothing written, so nothing evicted yet
+
+    monkeypatch.setattr(
+        googlenews_utils, "make_request",
+        lambda url, headers: FakeResponse(ITEM.format(link="l", title="found")),
+    )
+    assert [r["title"] for r in googlenews_utils.getNewsData("acme", "2024-01-01", "2024-01-07")] == ["found"]
+    assert "stale" not in [key for (key,) in cache._conn.execute("SELECT key FROM entries")]
+    assert len(cache) == 1
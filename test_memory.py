@@ -0,0 +1,147 @@
+from types import SimpleNamespace
+
+import pytest
+
+from tradingagents.agents.utils import memory
+from tradingagents.agents.utils.memory import FinancialSituationMemory, build_situation
+
+
+class CountingEmbeddings:
+    def __init__(self):
+        self.inputs = []
+
+    def create(self, model, input):
+        self.inputs.append(input)
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[float(len(input)), 1.0])])
+
+
+def test_situation_is_embedded_once_across_memories(data_config):
+    config = dict(data_config, api_key="test")
+    embeddings = CountingEmbeddings()
+    memories = []
+    for name in ("bull_memory", "bear_memory", "trader_memory"):
+        mem = FinancialSituationMemory(name, config)
+        mem.client = SimpleNamespace(embeddings=embeddings)
+        memories.append(mem)
+
+    state = {
+        "market_report": "market",
+        "sentiment_report": "sentiment",
+        "news_report": "news",
+        "fundamentals_report": "fundamentals",
+    }
+    situation = build_situation(state)
+    for mem in memories:
+        mem.get_memories(situation)
+    memories[0].add_situations([(situation, "hold")])
+    assert embeddings.inputs == [situation]
+
+    # A new process would still find it on disk
+    memory._embedding_cache._entries.clear()
+    assert memories[1].get_embedding(situation) == [float(len(situation)), 1.0]
+    assert len(embeddings.inputs) == 1
+
+
+class FlakyEmbeddings(CountingEmbeddings):
+    """Embeds lists too, failing any request that contains "bad"."""
+
+    def create(self, model, input):
+        texts = input if isinstance(input, list) else [input]
+        self.inputs.append(texts)
+        if any("bad" in text for text in texts):
+            raise RuntimeError("rejected")
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[float(len(text)), 1.0])
+            for i, text in reversed(list(enumerate(texts)))
+        ])
+
+
+def test_add_situations_batches_and_retries_failures(data_config):
+    config = dict(
+        data_config,
+        api_key="test",
+        embedding_cache=False,
+        embedding_batch_size=2,
+    )
+    mem = FinancialSituationMemory("batch_memory", config)
+    embeddings = FlakyEmbeddings()
+    mem.client = SimpleNamespace(embeddings=embeddings)
+
+    lessons = [(f"batch situation {i}", f"lesson {i}") for i in range(4)]
+    lessons.insert(2, ("bad situation", "lesson bad"))
+    mem.add_situations(lessons)
+
+    assert [len(texts) for texts in embeddings.inputs] == [2, 2, 1, 1, 1]
+    assert mem.situation_collection.count() == 4
+    stored = mem.situation_collection.get(include=["documents", "embeddings", "metadatas"])
+    row = stored["documents"].index("batch situation 2")
+    assert stored["metadatas"][row]["recommendation"] == "lesson 2"
+    assert list(stored["embeddings"][row]) == [float(len("batch situation 2")), 1.0]
+
+
+def test_persistent_memories_survive_and_are_namespaced(data_config, tmp_path):
+    config = dict(
+        data_config,
+        api_key="test",
+        memory_persist_dir=str(tmp_path / "memory"),
+    )
+    embeddings = CountingEmbeddings()
+
+    def open_memory():
+        mem = FinancialSituationMemory("trader_memory", config)
+        mem.client = SimpleNamespace(embeddings=embeddings)
+        return mem
+
+    first = open_memory()
+    first.set_namespace("AAPL")
+    first.add_situations([("persistent situation", "trim on strength")])
+    first.close()
+
+    second = open_memory()
+    second.set_namespace("AAPL")
+    assert [m["recommendation"] for m in second.get_memories("persistent situation")] == [
+        "trim on strength"
+    ]
+    second.set_namespace("BTC-USD")
+    assert second.get_memories("persistent situation") == []
+
+
+def test_embedding_disk_cache_is_capped(data_config):
+    config = dict(
+        data_config,
+        api_key="test",
+        embedding_cache_max_mb=100 / (1024 * 1024),
+    )
+    mem = FinancialSituationMemory("capped_memory", config)
+    mem.client = SimpleNamespace(embeddings=FlakyEmbeddings())
+
+    mem.get_embeddings([f"capped situation {i}" for i in range(5)])
+    mem.get_embedding("latest situation")
+
+    disk = mem.embedding_disk_cache
+    assert len(disk) == 3  # about 30 bytes each
+    latest = memory.EmbeddingCache.key(mem.embedding, "latest situation")
+    assert disk.get(latest) == [float(len("latest situation")), 1.0]
+
+
+@pytest.mark.parametrize("backend", ["chroma", "numpy"])
+def test_situations_added_after_a_delete_get_fresh_ids(data_config, backend):
+    config = dict(
+        data_config,
+        api_key="test",
+        embedding_cache=False,
+        memory_backend=backend,
+        session_id=f"fresh_ids_{backend}",
+    )
+    mem = FinancialSituationMemory("fresh_ids_memory", config)
+    mem.client = SimpleNamespace(embeddings=FlakyEmbeddings())
+
+    mem.add_situations([(f"first situation {i}", f"lesson {i}") for i in range(3)])
+    first_ids = mem.situation_collection.get()["ids"]
+    mem.situation_collection.delete(ids=first_ids[:1])
+    mem.add_situations([("second situation", "new lesson")])
+
+    stored = mem.situation_collection.get()
+    assert len(set(stored["ids"])) == len(stored["ids"]) == 3
+    assert "new lesson" in [m["recommendation"] for m in stored["metadatas"]]
+    mem.close()
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+import tradingagents.dataflows.stockstats_utils as stockstats_utils
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.price_columns import open_price_columns, read_price_range
+from tradingagents.dataflows.stockstats_utils import StockstatsUtils
+
+
+def test_range_matches_csv_filter(data_config, tmp_path):
+    csv_path = tmp_path / "TST-YFin-data.csv"
+    dates = pd.bdate_range("2024-01-01", "2024-03-01").strftime("%Y-%m-%d")
+    data = pd.DataFrame({"Date": dates, "Close": range(len(dates)), "Adj Close": 1.5})
+    data.to_csv(csv_path, index=False)
+
+    result = read_price_range(str(csv_path), "2024-01-06", "2024-01-31")
+    expected = data[(data["Date"] >= "2024-01-06") & (data["Date"] <= "2024-01-31")]
+    pd.testing.assert_frame_equal(result, expected, check_index_type=False)
+
+    # Rewriting the CSV rebuilds the columnar copy
+    data.iloc[:5].to_csv(csv_path, index=False)
+    assert len(read_price_range(str(csv_path))) == 5
+
+
+def test_columnar_round_trip_matches_csv(data_config, tmp_path, monkeypatch):
+    csv_path = tmp_path / "RT-YFin-data-2015-01-01-2025-03-25.csv"
+    dates = pd.bdate_range("2023-01-02", periods=300)
+    closes = 100 + np.sin(np.arange(300) / 7.0) * 5
+    data = pd.DataFrame({
+        "Date": dates.strftime("%Y-%m-%d 00:00:00-05:00"),
+        "Open": closes - 0.5,
+        "High": closes + 1,
+        "Low": closes - 1,
+        "Close": closes,
+        "Adj Close": np.where(np.arange(300) % 50 == 0, np.nan, closes),
+        "Volume": np.arange(300, dtype=np.int64) * 1000,
+    })
+    data.to_csv(csv_path, index=False)
+
+    columns = open_price_columns(str(csv_path))
+    assert isinstance(columns.column("Close"), np.memmap)
+    expected = pd.read_csv(csv_path)
+    pd.testing.assert_frame_equal(read_price_range(str(csv_path)), expected, check_index_type=False)
+
+    # The multi-indicator table is the same over the columnar copy and the CSV
+    monkeypatch.setattr(stockstats_utils, "_frame_cache", None)
+    indicators = ["close_50_sma", "rsi", "macd", "boll_ub"]
+    columnar = StockstatsUtils.get_stock_stats_table("RT", indicators, "2023-09-01", "2023-12-31", str(tmp_path))
+    monkeypatch.setattr(stockstats_utils, "_frame_cache", None)
+    set_config({"columnar_price_data": False})
+    try:
+        from_csv = StockstatsUtils.get_stock_stats_table("RT", indicators, "2023-09-01", "2023-12-31", str(tmp_path))
+    finally:
+        set_config({"columnar_price_data": True})
+    assert len(columnar) == 86 and list(columnar.columns) == indicators
+    pd.testing.assert_frame_equal(columnar, from_csv)
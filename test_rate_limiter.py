@@ -0,0 +1,72 @@
+import threading
+import time
+
+from tradingagents.dataflows.rate_limiter import (
+    AdaptiveDelay,
+    CircuitBreaker,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+def test_token_bucket_spaces_requests_across_threads():
+    limiter = TokenBucket(rate_per_minute=600, burst=1)  # 10 per second
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(6)]
+
+    start = time.time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.time() - start
+
+    assert elapsed >= 0.45
+    stats = limiter.stats()
+    assert stats["acquired"] == 6
+    assert stats["delayed"] == 5
+    assert stats["waiting"] == 0
+
+
+def test_penalize_holds_back_callers():
+    limiter = TokenBucket(rate_per_minute=6000, burst=5)
+    limiter.penalize(0.3)
+    assert limiter.acquire() >= 0.25
+
+
+def test_lock_file_shares_bucket_between_limiters(tmp_path):
+    lock_file = str(tmp_path / "coingecko.lock")
+    first = TokenBucket(rate_per_minute=600, burst=1, lock_file=lock_file)
+    second = TokenBucket(rate_per_minute=600, burst=1, lock_file=lock_file)
+
+    assert first.acquire() == 0
+    assert second.acquire() > 0.05
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("12") == 12
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_circuit_breaker_opens_and_lets_one_trial_through():
+    breaker = CircuitBreaker(threshold=2, cooldown=0.1)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.is_open and not breaker.allow()
+
+    time.sleep(0.15)
+    assert breaker.allow() and not breaker.allow()
+    breaker.record_success()
+    assert not breaker.is_open and breaker.allow()
+
+
+def test_adaptive_delay_backs_off_and_recovers():
+    delay = AdaptiveDelay(base=0.01, cap=1.0, jitter=0.0)
+    delay.wait()
+    delay.backoff()
+    assert delay.delay == 0.02
+    assert delay.wait() > 0.01
+    for _ in range(5):
+        delay.relax()
+    assert delay.delay == 0.01
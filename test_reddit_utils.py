@@ -0,0 +1,112 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+import tradingagents.dataflows.reddit_utils as reddit_utils
+from tradingagents.dataflows.config import get_config
+from tradingagents.dataflows.reddit_utils import (
+    fetch_top_from_category,
+    fetch_top_from_category_range,
+    get_query_matcher,
+    get_reddit_file_index,
+    register_aliases,
+)
+
+DAY = 86400
+JAN_1 = 1704067200  # 2024-01-01 00:00 UTC
+
+
+@pytest.fixture
+def reddit_dir(data_config, tmp_path):
+    posts = []
+    for i in range(40):
+        posts.append({
+            "created_utc": JAN_1 + (i % 4) * DAY + i,
+            "title": f"post {i}",
+            "selftext": "",
+            "url": f"u{i}",
+            "ups": i % 3,
+            # crossposts carry the parent's timestamp as well
+            "crosspost_parent_list": [{"created_utc": JAN_1 - 30 * DAY}],
+        })
+    category = tmp_path / "reddit_data" / "global_news"
+    category.mkdir(parents=True)
+    with open(category / "news.jsonl", "w") as f:
+        f.write("\n".join(json.dumps(post) for post in posts) + "\n\n")
+    return str(tmp_path / "reddit_data")
+
+
+@pytest.mark.parametrize(
+    "data_config", [{"reddit_index": True}, {"reddit_index": False}], ids=["index", "scan"], indirect=True
+)
+def test_range_matches_daily_fetch(reddit_dir):
+    by_date = fetch_top_from_category_range(
+        "global_news", "2023-12-31", "2024-01-05", 4, data_path=reddit_dir
+    )
+    assert list(by_date) == [
+        "2023-12-31", "2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"
+    ]
+    assert by_date["2023-12-31"] == [] and by_date["2024-01-05"] == []
+    for date, posts in by_date.items():
+        assert posts == fetch_top_from_category("global_news", date, 4, data_path=reddit_dir)
+
+    # Highest upvotes first, earlier posts winning ties
+    assert [post["title"] for post in by_date["2024-01-01"]] == [
+        "post 8", "post 20", "post 32", "post 4"
+    ]
+
+
+def test_concurrent_lookups_build_the_file_index_once(reddit_dir, monkeypatch):
+    builds = []
+    build = reddit_utils._build_file_index
+
+    def slow_build(path):
+        builds.append(path)
+        time.sleep(0.1)
+        return build(path)
+
+    monkeypatch.setattr(reddit_utils, "_build_file_index", slow_build)
+    path = os.path.join(reddit_dir, "global_news", "news.jsonl")
+    indexes = []
+    threads = [
+        threading.Thread(target=lambda: indexes.append(get_reddit_file_index("global_news", path)))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert builds == [path]
+    assert len(indexes) == 4 and all(index is indexes[0] for index in indexes)
+    index_dir = os.path.join(get_config()["data_cache_dir"], "reddit_index", "global_news")
+    assert os.listdir(index_dir) == ["news.jsonl.json"]
+
+
+@pytest.fixture
+def alias_table(monkeypatch):
+    """Give the test its own alias table and matcher cache."""
+    monkeypatch.setattr(reddit_utils, "_extra_aliases", {})
+    get_query_matcher.cache_clear()
+    yield
+    monkeypatch.undo()
+    get_query_matcher.cache_clear()
+
+
+def test_query_matcher_aliases_and_word_boundaries(alias_table):
+    btc = get_query_matcher("BTC-USD")
+    assert btc.search("Bitcoin ETF flows") and btc.search("long btc")
+    assert not btc.search("BTCUSDT funding")
+
+    apple = get_query_matcher("AAPL")
+    assert apple.search("apple earnings") and not apple.search("pineapple pizza")
+    assert get_query_matcher("JNJ").search("Johnson & Johnson recall")
+
+    # Unknown tickers are matched on the ticker itself instead of failing
+    assert get_query_matcher("ZZZ").search("anyone holding $ZZZ?")
+
+    register_aliases("ZZZ", "Sleep Corp")
+    assert get_query_matcher("ZZZ").search("sleep corp guidance")
@@ -0,0 +1,27 @@
+from tradingagents.dataflows.simfin_store import get_latest_statement
+
+
+def test_latest_statement_as_of_date(data_config, tmp_path):
+    csv_path = tmp_path / "us-income-quarterly.csv"
+    csv_path.write_text(
+        "Ticker;SimFinId;Report Date;Publish Date;Revenue\n"
+        "AAA;1;2020-03-31;2020-05-01;10\n"
+        "BBB;2;2020-03-31;2020-04-01;20\n"
+        "AAA;1;2020-06-30;2020-08-01;11\n"
+        "AAA;1;2020-06-30;2020-08-01;12\n"
+        "AAA;1;2020-09-30;2020-11-01;13\n"
+    )
+
+    assert get_latest_statement(str(csv_path), "AAA", "2020-04-30") is None
+    assert get_latest_statement(str(csv_path), "AAA", "2020-05-01")["Revenue"] == 10
+    # Same publish date: the first row of the bulk file wins, as with idxmax
+    latest = get_latest_statement(str(csv_path), "AAA", "2020-10-01")
+    assert latest["Revenue"] == 11 and latest.name == 2
+    assert get_latest_statement(str(csv_path), "CCC", "2021-01-01") is None
+
+    # Rewriting the bulk file rebuilds the partitions
+    csv_path.write_text(
+        "Ticker;SimFinId;Report Date;Publish Date;Revenue\n"
+        "AAA;1;2020-03-31;2020-05-01;99\n"
+    )
+    assert get_latest_statement(str(csv_path), "AAA", "2020-10-01")["Revenue"] == 99
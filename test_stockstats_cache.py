@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import tradingagents.dataflows.stockstats_utils as stockstats_utils
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.stockstats_utils import (
+    StatsFrameCache,
+    StockstatsUtils,
+    get_stats_frame_cache,
+)
+
+
+def _frame(rows):
+    return pd.DataFrame({"Date": ["2024-01-01"] * rows, "close": [1.0] * rows})
+
+
+def test_lru_evicts_least_recently_used():
+    entry_bytes = int(_frame(1000).memory_usage(deep=True).sum())
+    cache = StatsFrameCache(max_bytes=entry_bytes * 2)
+    loads = []
+
+    def loader(name):
+        def load():
+            loads.append(name)
+            return _frame(1000)
+        return load
+
+    cache.get(("A", "a.csv", 1.0), loader("A"))
+    cache.get(("B", "b.csv", 1.0), loader("B"))
+    cache.get(("A", "a.csv", 1.0), loader("A"))  # hit, A becomes most recent
+    cache.get(("C", "c.csv", 1.0), loader("C"))  # evicts B
+    cache.get(("A", "a.csv", 1.0), loader("A"))
+    cache.get(("A", "a.csv", 2.0), loader("A2"))  # new mtime reloads
+
+    assert loads == ["A", "B", "C", "A2"]
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["evictions"] == 2
+    assert stats["bytes"] <= stats["max_bytes"]
+
+
+@pytest.mark.parametrize("data_config", [{"stockstats_cache_max_mb": 256}], indirect=True)
+def test_window_reuses_cached_frame_until_evicted(data_config, tmp_path, monkeypatch):
+    monkeypatch.setattr(stockstats_utils, "_frame_cache", None)
+    dates = pd.bdate_range("2023-06-01", "2024-04-30").strftime("%Y-%m-%d")
+    for symbol, base in (("AAA", 100.0), ("BBB", 50.0)):
+        closes = base + np.sin(np.arange(len(dates)) / 5.0)
+        pd.DataFrame({
+            "Date": dates, "Open": closes, "High": closes + 1, "Low": closes - 1,
+            "Close": closes, "Adj Close": closes, "Volume": 1000,
+        }).to_csv(tmp_path / f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv", index=False)
+
+    window = StockstatsUtils.get_stock_stats_window(
+        "AAA", "close_10_ema", "2024-03-01", "2024-03-29", str(tmp_path)
+    )
+    assert len(window) == 21
+    for date, value in window.items():
+        assert StockstatsUtils.get_stock_stats("AAA", "close_10_ema", date, str(tmp_path)) == value
+    stats = get_stats_frame_cache().stats()
+    assert stats["misses"] == 1 and stats["hits"] == 21
+
+    # A cap smaller than one frame keeps only the most recent one
+    set_config({"stockstats_cache_max_mb": 0.001})
+    StockstatsUtils.get_stock_stats("BBB", "close_10_ema", "2024-03-01", str(tmp_path))
+    stats = get_stats_frame_cache().stats()
+    assert stats["evictions"] == 1 and stats["entries"] == 1
+    StockstatsUtils.get_stock_stats("AAA", "close_10_ema", "2024-03-01", str(tmp_path))
+    assert get_stats_frame_cache().stats()["misses"] == 3
@@ -0,0 +1,121 @@
+import contextvars
+import threading
+import time
+
+from tradingagents.agents.utils.tool_memo import memoized_call, tool_call_scope
+
+
+def test_concurrent_identical_calls_run_once():
+    calls = []
+
+    def fetch(symbol, days):
+        calls.append((symbol, days))
+        time.sleep(0.2)
+        return f"{symbol}:{days}"
+
+    results = []
+    with tool_call_scope() as memo:
+        # Like LangGraph's executor, hand each worker a copy of the run context
+        threads = [
+            threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(lambda: results.append(memoized_call(fetch, "BTC", 7)),),
+            )
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert memoized_call(fetch, "ETH", 7) == "ETH:7"
+
+    assert results == ["BTC:7"] * 4
+    assert calls == [("BTC", 7), ("ETH", 7)]
+    assert memo.stats()["hits"] == 3
+
+    # Outside a run every call goes through
+    memoized_call(fetch, "BTC", 7)
+    assert len(calls) == 3
+
+
+def test_failed_calls_are_not_cached():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return "ok"
+
+    with tool_call_scope():
+        try:
+            memoized_call(flaky)
+        except RuntimeError:
+            pass
+        assert memoized_call(flaky) == "ok"
+
+
+def test_error_results_are_not_cached():
+    answers = iter(["Error: rate limited", "prices"])
+    attempts = []
+
+    def fetch(symbol):
+        attempts.append(symbol)
+        return next(answers)
+
+    with tool_call_scope() as memo:
+        assert memoized_call(fetch, "BTC") == "Error: rate limited"
+        assert memoized_call(fetch, "BTC") == "prices"
+        assert memoized_call(fetch, "BTC") == "prices"
+
+    assert attempts == ["BTC", "BTC"]
+    assert memo.stats()["hits"] == 1
+
+
+def _bare_graph(fetch):
+    """A TradingAgentsGraph whose compiled graph calls ``fetch`` on every step."""
+    from tradingagents.graph.propagation import Propagator
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+    class CompiledGraph:
+        def stream(self, state, **kwargs):
+            for _ in range(3):
+                yield {"messages": [], "report": memoized_call(fetch, state["company_of_interest"])}
+
+    class Memory:
+        namespace = None
+
+        def set_namespace(self, ticker):
+            self.namespace = ticker
+
+    graph = TradingAgentsGraph.__new__(TradingAgentsGraph)
+    graph.graph = CompiledGraph()
+    graph.propagator = Propagator()
+    for name in ("bull_memory", "bear_memory", "trader_memory", "invest_judge_memory", "risk_manager_memory"):
+        setattr(graph, name, Memory())
+    return graph
+
+
+def test_graph_stream_deduplicates_tool_calls():
+    calls = []
+
+    def fetch(symbol):
+        calls.append(symbol)
+        return f"{symbol} data"
+
+    graph = _bare_graph(fetch)
+    chunks = list(graph.stream(graph.propagator.create_initial_state("BTC", "2024-05-10")))
+    assert [chunk["report"] for chunk in chunks] == ["BTC data"] * 3
+    assert calls == ["BTC"]
+    # Entry points that only stream still get per-ticker memories
+    assert all(memory.namespace == "BTC" for memory in graph._memories())
+
+
+def test_graph_stream_closed_early_from_another_context(capsys):
+    graph = _bare_graph(lambda symbol: f"{symbol} data")
+    stream = graph.stream(graph.propagator.create_initial_state("BTC", "2024-05-10"))
+    assert next(stream)["report"] == "BTC data"
+
+    # e.g. a caller that stopped reading, finalised on another thread
+    contextvars.copy_context().run(stream.close)
+    assert "Tool calls: 1, executed: 1" in capsys.readouterr().out
@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.agents.utils.vector_index import VectorIndex
+
+
+def _add(index, vectors, start=0):
+    ids = [str(start + i) for i in range(len(vectors))]
+    index.add(
+        documents=[f"doc {i}" for i in ids],
+        metadatas=[{"recommendation": f"rec {i}"} for i in ids],
+        embeddings=vectors.tolist(),
+        ids=ids,
+    )
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16"])
+def test_top_k_matches_brute_force_cosine(tmp_path, dtype):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(2500, 16))
+    index = VectorIndex("test", str(tmp_path / "index"), dtype=dtype)
+    _add(index, vectors[:1000])
+    _add(index, vectors[1000:], start=1000)  # grows past the first capacity
+
+    query = rng.normal(size=16)
+    cosine = vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+    result = index.query([query.tolist()], n_results=5)
+    assert result["ids"][0] == [str(i) for i in np.argsort(-cosine)[:5]]
+    assert np.allclose(1 - np.array(result["distances"][0]), np.sort(cosine)[::-1][:5], atol=1e-2)
+
+
+def test_reopen_delete_and_compact(tmp_path):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(40, 8))
+    index = VectorIndex("test", str(tmp_path / "index"))
+    _add(index, vectors)
+
+    reader = VectorIndex("test", str(tmp_path / "index"))
+    assert reader.count() == 40
+    best = reader.query([vectors[7].tolist()], n_results=1)
+    assert best["ids"][0] == ["7"] and best["metadatas"][0] == [{"recommendation": "rec 7"}]
+
+    index.delete(["7"])
+    assert reader.query([vectors[7].tolist()], n_results=1)["ids"][0] != ["7"]
+
+    # Deleting over a quarter of the rows rewrites the files without them
+    index.delete([str(i) for i in range(12)])
+    assert reader.count() == 28 and index._meta["rows"] == 28
+    assert reader.query([vectors[20].tolist()], n_results=1)["ids"][0] == ["20"]
+    assert sorted(p.name for p in (tmp_path / "index").iterdir()) == [
+        "meta.json", "records.1.jsonl", "vectors.1.bin"
+    ]
+
+
+def test_numpy_memory_backend(data_config, tmp_path):
+    config = dict(
+        data_config,
+        api_key="test",
+        memory_backend="numpy",
+        memory_persist_dir=str(tmp_path / "memory"),
+    )
+
+    def embed(model, input):
+        texts = input if isinstance(input, list) else [input]
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[1.0, float(len(text)), 0.0])
+            for i, text in enumerate(texts)
+        ])
+
+    def open_memory():
+        mem = FinancialSituationMemory("bull_memory", config)
+        mem.client = SimpleNamespace(embeddings=SimpleNamespace(create=embed))
+        mem.set_namespace("ETH")
+        return mem
+
+    mem = open_memory()
+    mem.add_situations([("short", "wait"), ("a much longer situation", "buy")])
+    mem.close()
+
+    matches = open_memory().get_memories("a longer situation", n_matches=2)
+    assert [m["recommendation"] for m in matches] == ["buy", "wait"]
+    assert matches[0]["similarity_score"] > matches[1]["similarity_score"]
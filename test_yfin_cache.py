@@ -0,0 +1,61 @@
+import os
+
+import pandas as pd
+
+import tradingagents.dataflows.stockstats_utils as stockstats_utils
+
+
+def _bars(dates, closes):
+    return pd.DataFrame({"Date": dates, "Close": closes, "Volume": [100] * len(dates)})
+
+
+def test_incremental_append_and_readjustment(data_config, monkeypatch):
+    history = {"2024-01-02": 10.0, "2024-01-03": 11.0}
+    downloads = []
+
+    def fake_download(symbol, start_date, end_date):
+        downloads.append(start_date)
+        dates = sorted(d for d in history if d >= start_date)
+        return _bars(dates, [history[d] for d in dates])
+
+    monkeypatch.setattr(stockstats_utils, "_download_yfin", fake_download)
+    cache_dir = data_config["data_cache_dir"]
+    stale = os.path.join(cache_dir, "SPY-YFin-data-2009-01-01-2024-01-01.csv")
+    with open(stale, "w") as f:
+        f.write("stale")
+
+    path = stockstats_utils.update_yfin_cache("SPY", cache_dir)
+    assert not os.path.exists(stale)
+    assert len(pd.read_csv(path)) == 2
+
+    def age(path):
+        os.utime(path, (0, 0))
+
+    # Next day: only bars from the last stored date are fetched and appended
+    history["2024-01-04"] = 12.0
+    age(path)
+    stockstats_utils.update_yfin_cache("SPY", cache_dir)
+    assert downloads[-1] == "2024-01-03"
+    assert pd.read_csv(path)["Close"].tolist() == [10.0, 11.0, 12.0]
+
+    # A dividend re-adjusts history: the overlap bar differs, so refetch everything
+    history.update({"2024-01-02": 9.5, "2024-01-03": 10.5, "2024-01-04": 11.5, "2024-01-05": 12.5})
+    age(path)
+    stockstats_utils.update_yfin_cache("SPY", cache_dir)
+    assert pd.read_csv(path)["Close"].tolist() == [9.5, 10.5, 11.5, 12.5]
+    assert len(downloads) == 4
+
+
+def test_current_cache_skips_lock_and_cleanup(data_config, monkeypatch):
+    monkeypatch.setattr(
+        stockstats_utils, "_download_yfin",
+        lambda symbol, start_date, end_date: _bars(["2024-01-02"], [10.0]),
+    )
+    path = stockstats_utils.update_yfin_cache("SPY", data_config["data_cache_dir"])
+
+    def fail(*args, **kwargs):
+        raise AssertionError("a cache checked today was refreshed again")
+
+    monkeypatch.setattr(stockstats_utils, "InterProcessLock", fail)
+    monkeypatch.setattr(stockstats_utils, "_remove_dated_yfin_files", fail)
+    assert stockstats_utils.update_yfin_cache("SPY", data_config["data_cache_dir"]) == path
@@ -62,9 +62,12 @@ def create_market_analyst(llm, toolkit):
         if is_crypto:
             # Use crypto-specific tools (include news and market overview)
             tools = [
+                toolkit.get_crypto_analysis_bundle,
                 toolkit.get_crypto_price_history,
                 toolkit.get_crypto_technical_analysis,
+                toolkit.get_crypto_indicators_report,
                 toolkit.get_crypto_market_analysis,
+                toolkit.get_crypto_market_snapshot,
                 toolkit.get_crypto_news_analysis,
                 toolkit.get_reddit_stock_info,
             ]
@@ -77,8 +80,11 @@ Key areas to analyze for cryptocurrency:
 - Volume patterns and market liquidity
 - Support and resistance levels
 - Market volatility and risk assessment
-- Momentum indicators and their reliability in crypto markets
+- Momentum indicators and their reliability in crypto markets (use get_crypto_indicators_report for RSI, MACD, Bollinger bands, ATR and moving averages)
 - Market sentiment and psychological levels
+- Relative performance against major coins (use get_crypto_market_snapshot to compare several symbols in one call, e.g. the coin together with BTC and ETH)
+
+Start with get_crypto_analysis_bundle, which returns market data, price history, technical analysis and news in a single call; only use the individual crypto tools when you need a different look-back window.
 
 Please write a very detailed and nuanced report of the trends you observe in the cryptocurrency market. Analyze both short-term and long-term trends. Do not simply state the trends are mixed, provide detailed and fine-grained analysis and insights that may help crypto traders make decisions. Consider the unique characteristics of cryptocurrency markets such as 24/7 trading, higher volatility, and sentiment-driven movements."""
                 + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
@@ -88,13 +94,16 @@ Please write a very detailed and nuanced report of the trends you observe in the
             if toolkit.config["online_tools"]:
                 tools = [
                     toolkit.get_YFin_data_online,
+                    toolkit.get_stockstats_indicators_table_online,
                     toolkit.get_stockstats_indicators_report_online,
                 ]
             else:
                 tools = [
                     toolkit.get_YFin_data,
+                    toolkit.get_stockstats_indicators_table,
                     toolkit.get_stockstats_indicators_report,
                 ]
+            table_tool = tools[1].name
 
             system_message = (
                 """You are a trading assistant tasked with analyzing financial markets. Your role is to select the **most relevant indicators** for a given market condition or trading strategy from the following list. The goal is to choose up to **8 indicators** that provide complementary insights without redundancy. Categories and each category's indicators are:
@@ -121,7 +130,9 @@ Volatility Indicators:
 Volume-Based Indicators:
 - vwma: VWMA: A moving average weighted by volume. Usage: Confirm trends by integrating price action with volume data. Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses.
 
-- Select indicators that provide diverse and complementary information. Avoid redundancy (e.g., do not select both rsi and stochrsi). Also briefly explain why they are suitable for the given market context. When you tool call, please use the exact name of the indicators provided above as they are defined parameters, otherwise your call will fail. Please make sure to call get_YFin_data first to retrieve the CSV that is needed to generate indicators. Write a very detailed and nuanced report of the trends you observe. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."""
+- Select indicators that provide diverse and complementary information. Avoid redundancy (e.g., do not select both rsi and stochrsi). Also briefly explain why they are suitable for the given market context. When you tool call, please use the exact name of the indicators provided above as they are defined parameters, otherwise your call will fail. Please make sure to call get_YFin_data first to retrieve the CSV that is needed to generate indicators. Then request all the indicators you selected in a single """
+                + table_tool
+                + """ call (pass them together in the indicators list) instead of one report call per indicator. Write a very detailed and nuanced report of the trends you observe. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."""
             + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
         )
 
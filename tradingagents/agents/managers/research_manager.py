@@ -1,18 +1,15 @@
 import time
 import json
+from tradingagents.agents.utils.memory import build_situation
 
 
 def create_research_manager(llm, memory):
     def research_manager_node(state) -> dict:
         history = state["investment_debate_state"].get("history", "")
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
 
         investment_debate_state = state["investment_debate_state"]
 
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
+        curr_situation = build_situation(state)
         past_memories = memory.get_memories(curr_situation, n_matches=2)
 
         past_memory_str = ""
@@ -1,5 +1,6 @@
 import time
 import json
+from tradingagents.agents.utils.memory import build_situation
 
 
 def create_risk_manager(llm, memory):
@@ -9,13 +10,9 @@ def create_risk_manager(llm, memory):
 
         history = state["risk_debate_state"]["history"]
         risk_debate_state = state["risk_debate_state"]
-        market_research_report = state["market_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["news_report"]
-        sentiment_report = state["sentiment_report"]
         trader_plan = state["investment_plan"]
 
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
+        curr_situation = build_situation(state)
         past_memories = memory.get_memories(curr_situation, n_matches=2)
 
         past_memory_str = ""
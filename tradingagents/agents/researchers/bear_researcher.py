@@ -1,6 +1,7 @@
 from langchain_core.messages import AIMessage
 import time
 import json
+from tradingagents.agents.utils.memory import build_situation
 
 
 def create_bear_researcher(llm, memory):
@@ -15,7 +16,7 @@ def create_bear_researcher(llm, memory):
         news_report = state["news_report"]
         fundamentals_report = state["fundamentals_report"]
 
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
+        curr_situation = build_situation(state)
         past_memories = memory.get_memories(curr_situation, n_matches=2)
 
         past_memory_str = ""
@@ -3,6 +3,8 @@
 from binance.client import Client
 from typing import Optional, Dict, Any
 
+from tradingagents.dataflows.cassette import cassette_call
+
 
 class BinanceTrader:
     """Wrapper around the Binance Client to handle live/paper trading and basic bracket (TP/SL)."""
@@ -52,8 +54,11 @@ class BinanceTrader:
         return float(f"{rounded:.{precision}f}")
 
     def get_last_price(self, symbol: str) -> float:
-        client = self._get_client()
-        data = client.get_symbol_ticker(symbol=symbol)
+        data = cassette_call(
+            "binance",
+            {"method": "get_symbol_ticker", "symbol": symbol, "testnet": self.testnet},
+            lambda: self._get_client().get_symbol_ticker(symbol=symbol),
+        )
         return float(data.get("price", 0.0)) if data else 0.0
 
     def cancel_open_orders(self, symbol: str):
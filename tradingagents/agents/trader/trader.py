@@ -3,6 +3,7 @@ import json
 import re
 
 from .binance_client import BinanceTrader
+from tradingagents.agents.utils.memory import build_situation
 
 
 def create_trader(llm, memory, config):
@@ -18,12 +19,8 @@ def create_trader(llm, memory, config):
         if not symbol.endswith("USDT"):
             symbol = symbol + "USDT"
         investment_plan = state["investment_plan"]
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
 
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
+        curr_situation = build_situation(state)
         past_memories = memory.get_memories(curr_situation, n_matches=2)
 
         past_memory_str = ""
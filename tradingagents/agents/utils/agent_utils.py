@@ -11,6 +11,7 @@ import os
 from dateutil.relativedelta import relativedelta
 from langchain_openai import ChatOpenAI
 import tradingagents.dataflows.interface as interface
+from tradingagents.agents.utils.tool_memo import memoized_call
 from tradingagents.default_config import DEFAULT_CONFIG
 from langchain_core.messages import HumanMessage
 
@@ -61,7 +62,9 @@ class Toolkit:
             str: A formatted dataframe containing the latest global news from Reddit in the specified time frame.
         """
         
-        global_news_result = interface.get_reddit_global_news(curr_date, 7, 5)
+        global_news_result = memoized_call(
+            interface.get_reddit_global_news, curr_date, 7, 5
+        )
 
         return global_news_result
 
@@ -91,8 +94,8 @@ class Toolkit:
         start_date = datetime.strptime(start_date, "%Y-%m-%d")
         look_back_days = (end_date - start_date).days
 
-        finnhub_news_result = interface.get_finnhub_news(
-            ticker, end_date_str, look_back_days
+        finnhub_news_result = memoized_call(
+            interface.get_finnhub_news, ticker, end_date_str, look_back_days
         )
 
         return finnhub_news_result
@@ -118,7 +121,9 @@ class Toolkit:
 
         # Accept alias 'date' for 'curr_date'
         current = curr_date or date
-        stock_news_results = interface.get_reddit_company_news(ticker, current, 7, 5)
+        stock_news_results = memoized_call(
+            interface.get_reddit_company_news, ticker, current, 7, 5
+        )
 
         return stock_news_results
 
@@ -139,7 +144,9 @@ class Toolkit:
             str: A formatted dataframe containing the stock price data for the specified ticker symbol in the specified date range.
         """
 
-        result_data = interface.get_YFin_data(symbol, start_date, end_date)
+        result_data = memoized_call(
+            interface.get_YFin_data, symbol, start_date, end_date
+        )
 
         return result_data
 
@@ -160,7 +167,9 @@ class Toolkit:
             str: A formatted dataframe containing the stock price data for the specified ticker symbol in the specified date range.
         """
 
-        result_data = interface.get_YFin_data_online(symbol, start_date, end_date)
+        result_data = memoized_call(
+            interface.get_YFin_data_online, symbol, start_date, end_date
+        )
 
         return result_data
 
@@ -187,7 +196,8 @@ class Toolkit:
             str: A formatted dataframe containing the stock stats indicators for the specified ticker symbol and indicator.
         """
 
-        result_stockstats = interface.get_stock_stats_indicators_window(
+        result_stockstats = memoized_call(
+            interface.get_stock_stats_indicators_window,
             symbol, indicator, curr_date, look_back_days, False
         )
 
@@ -216,12 +226,73 @@ class Toolkit:
             str: A formatted dataframe containing the stock stats indicators for the specified ticker symbol and indicator.
         """
 
-        result_stockstats = interface.get_stock_stats_indicators_window(
+        result_stockstats = memoized_call(
+            interface.get_stock_stats_indicators_window,
             symbol, indicator, curr_date, look_back_days, True
         )
 
         return result_stockstats
 
+    @staticmethod
+    @tool
+    def get_stockstats_indicators_table(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicators: Annotated[
+            List[str], "technical indicators to get the analysis and report of"
+        ],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 30,
+    ) -> str:
+        """
+        Retrieve several stock stats indicators for a given ticker symbol in one table.
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            indicators (List[str]): Technical indicators to get the analysis and report of, e.g. ["close_50_sma", "macd", "rsi"]
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 30
+        Returns:
+            str: A table with one row per trading day and one column per indicator, followed by a description of each indicator.
+        """
+
+        result_stockstats = memoized_call(
+            interface.get_stock_stats_indicators_table,
+            symbol, indicators, curr_date, look_back_days, False
+        )
+
+        return result_stockstats
+
+    @staticmethod
+    @tool
+    def get_stockstats_indicators_table_online(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicators: Annotated[
+            List[str], "technical indicators to get the analysis and report of"
+        ],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 30,
+    ) -> str:
+        """
+        Retrieve several stock stats indicators for a given ticker symbol in one table.
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            indicators (List[str]): Technical indicators to get the analysis and report of, e.g. ["close_50_sma", "macd", "rsi"]
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 30
+        Returns:
+            str: A table with one row per trading day and one column per indicator, followed by a description of each indicator.
+        """
+
+        result_stockstats = memoized_call(
+            interface.get_stock_stats_indicators_table,
+            symbol, indicators, curr_date, look_back_days, True
+        )
+
+        return result_stockstats
+
     @staticmethod
     @tool
     def get_finnhub_company_insider_sentiment(
@@ -240,8 +311,8 @@ class Toolkit:
             str: a report of the sentiment in the past 30 days starting at curr_date
         """
 
-        data_sentiment = interface.get_finnhub_company_insider_sentiment(
-            ticker, curr_date, 30
+        data_sentiment = memoized_call(
+            interface.get_finnhub_company_insider_sentiment, ticker, curr_date, 30
         )
 
         return data_sentiment
@@ -264,8 +335,8 @@ class Toolkit:
             str: a report of the company's insider transactions/trading information in the past 30 days
         """
 
-        data_trans = interface.get_finnhub_company_insider_transactions(
-            ticker, curr_date, 30
+        data_trans = memoized_call(
+            interface.get_finnhub_company_insider_transactions, ticker, curr_date, 30
         )
 
         return data_trans
@@ -290,7 +361,9 @@ class Toolkit:
             str: a report of the company's most recent balance sheet
         """
 
-        data_balance_sheet = interface.get_simfin_balance_sheet(ticker, freq, curr_date)
+        data_balance_sheet = memoized_call(
+            interface.get_simfin_balance_sheet, ticker, freq, curr_date
+        )
 
         return data_balance_sheet
 
@@ -314,7 +387,9 @@ class Toolkit:
                 str: a report of the company's most recent cash flow statement
         """
 
-        data_cashflow = interface.get_simfin_cashflow(ticker, freq, curr_date)
+        data_cashflow = memoized_call(
+            interface.get_simfin_cashflow, ticker, freq, curr_date
+        )
 
         return data_cashflow
 
@@ -338,8 +413,8 @@ class Toolkit:
                 str: a report of the company's most recent income statement
         """
 
-        data_income_stmt = interface.get_simfin_income_statements(
-            ticker, freq, curr_date
+        data_income_stmt = memoized_call(
+            interface.get_simfin_income_statements, ticker, freq, curr_date
         )
 
         return data_income_stmt
@@ -360,7 +435,9 @@ class Toolkit:
             str: A formatted string containing the latest news from Google News based on the query and date range.
         """
 
-        google_news_results = interface.get_google_news(query, curr_date, 7)
+        google_news_results = memoized_call(
+            interface.get_google_news, query, curr_date, 7
+        )
 
         return google_news_results
 
@@ -379,7 +456,9 @@ class Toolkit:
             str: A formatted string containing the latest news about the company on the given date.
         """
 
-        openai_news_results = interface.get_stock_news_openai(ticker, curr_date)
+        openai_news_results = memoized_call(
+            interface.get_stock_news_openai, ticker, curr_date
+        )
 
         return openai_news_results
 
@@ -396,7 +475,7 @@ class Toolkit:
             str: A formatted string containing the latest macroeconomic news on the given date.
         """
 
-        openai_news_results = interface.get_global_news_openai(curr_date)
+        openai_news_results = memoized_call(interface.get_global_news_openai, curr_date)
 
         return openai_news_results
 
@@ -415,8 +494,8 @@ class Toolkit:
             str: A formatted string containing the latest fundamental information about the company on the given date.
         """
 
-        openai_fundamentals_results = interface.get_fundamentals_openai(
-            ticker, curr_date
+        openai_fundamentals_results = memoized_call(
+            interface.get_fundamentals_openai, ticker, curr_date
         )
 
         return openai_fundamentals_results
@@ -441,7 +520,45 @@ class Toolkit:
         """
         sym = symbol or ticker
         cd = curr_date or date
-        return interface.get_crypto_market_analysis(sym, cd)
+        return memoized_call(interface.get_crypto_market_analysis, sym, cd)
+
+    @staticmethod
+    @tool
+    def get_crypto_market_snapshot(
+        symbols: Annotated[str, "Comma-separated cryptocurrency symbols, e.g. BTC,ETH,SOL"],
+    ) -> str:
+        """
+        Get a compact market snapshot (price, 24h/7d/30d change, market cap, volume, rank) for several cryptocurrencies in a single call.
+        Args:
+            symbols (str): Comma-separated crypto symbols (e.g., 'BTC,ETH,SOL'), up to 250
+        Returns:
+            str: A table with one row of key market metrics per cryptocurrency
+        """
+        return memoized_call(interface.get_crypto_market_overview, symbols)
+
+    @staticmethod
+    @tool
+    def get_crypto_analysis_bundle(
+        symbol: Annotated[str, "Cryptocurrency symbol like BTC, ETH, ADA"] = "",
+        curr_date: Annotated[str, "Current date in yyyy-mm-dd format"] = "",
+        look_back_days: Annotated[int, "How many days to look back"] = 30,
+        ticker: Annotated[str, "Alias for symbol"] = "",
+        date: Annotated[str, "Alias for curr_date (YYYY-MM-DD)"] = "",
+    ) -> str:
+        """
+        Get current market data, price history, technical analysis and market news for a cryptocurrency in a single call. Prefer this over calling the individual crypto tools one by one.
+        Args:
+            symbol (str): Crypto symbol (e.g., 'BTC', 'ETH', 'ADA')
+            curr_date (str): Current date in yyyy-mm-dd format
+            look_back_days (int): Number of days of history to include, default is 30
+        Returns:
+            str: Market data, price history, technical analysis and news reports combined
+        """
+        sym = symbol or ticker
+        cd = curr_date or date
+        return memoized_call(
+            interface.get_crypto_analysis_bundle, sym, cd, look_back_days
+        )
 
     @staticmethod
     @tool
@@ -463,7 +580,9 @@ class Toolkit:
         """
         sym = symbol or ticker
         cd = curr_date or date
-        return interface.get_crypto_price_history(sym, cd, look_back_days)
+        return memoized_call(
+            interface.get_crypto_price_history, sym, cd, look_back_days
+        )
 
     @staticmethod
     @tool
@@ -485,7 +604,35 @@ class Toolkit:
         """
         sym = symbol or ticker
         cd = curr_date or date
-        return interface.get_crypto_technical_analysis(sym, cd, look_back_days)
+        return memoized_call(
+            interface.get_crypto_technical_analysis, sym, cd, look_back_days
+        )
+
+    @staticmethod
+    @tool
+    def get_crypto_indicators_report(
+        symbol: Annotated[str, "Cryptocurrency symbol like BTC, ETH, ADA"] = "",
+        curr_date: Annotated[str, "Current date in yyyy-mm-dd format"] = "",
+        look_back_days: Annotated[int, "How many days to report"] = 30,
+        indicators: Annotated[str, "Comma-separated indicator names, empty for the default set"] = "",
+        ticker: Annotated[str, "Alias for symbol"] = "",
+        date: Annotated[str, "Alias for curr_date (YYYY-MM-DD)"] = "",
+    ) -> str:
+        """
+        Get daily technical indicators for a cryptocurrency in one table: moving averages, MACD, RSI, Bollinger bands, ATR and VWMA.
+        Args:
+            symbol (str): Crypto symbol (e.g., 'BTC', 'ETH', 'ADA')
+            curr_date (str): Current date in yyyy-mm-dd format
+            look_back_days (int): Number of days to report, default is 30
+            indicators (str): Optional comma-separated subset, e.g. 'rsi,macd,macds,close_50_sma,boll_ub,boll_lb'
+        Returns:
+            str: A table of daily closes and indicator values with a short description of each indicator
+        """
+        sym = symbol or ticker
+        cd = curr_date or date
+        return memoized_call(
+            interface.get_crypto_indicators_report, sym, cd, look_back_days, indicators
+        )
 
     @staticmethod
     @tool
@@ -507,7 +654,9 @@ class Toolkit:
         """
         sym = symbol or ticker
         cd = curr_date or date
-        return interface.get_crypto_news_analysis(sym, cd, look_back_days)
+        return memoized_call(
+            interface.get_crypto_news_analysis, sym, cd, look_back_days
+        )
 
     @staticmethod
     @tool
@@ -523,4 +672,6 @@ class Toolkit:
         Returns:
             str: Fundamental analysis including market metrics, supply data, and crypto-specific fundamentals
         """
-        return interface.get_crypto_fundamentals_analysis(symbol, curr_date)
+        return memoized_call(
+            interface.get_crypto_fundamentals_analysis, symbol, curr_date
+        )
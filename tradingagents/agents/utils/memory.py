@@ -1,7 +1,116 @@
-import chromadb
-from chromadb.config import Settings
+import hashlib
+import os
+import re
+import threading
+import uuid
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+
 from openai import OpenAI
 
+from tradingagents.dataflows.disk_cache import MISSING, DiskCache
+from tradingagents.utils.file_lock import InterProcessLock
+
+from .vector_index import VectorIndex
+
+MEMORY_BACKENDS = ("chroma", "numpy")
+
+# Upper bounds for one embeddings request; tokens are estimated as chars / 4
+DEFAULT_EMBEDDING_BATCH_SIZE = 256
+DEFAULT_EMBEDDING_BATCH_TOKENS = 250_000
+
+
+def build_situation(state) -> str:
+    """The situation text memories are matched on: the four analyst reports."""
+    return (
+        f"{state['market_report']}\n\n{state['sentiment_report']}\n\n"
+        f"{state['news_report']}\n\n{state['fundamentals_report']}"
+    )
+
+
+class EmbeddingCache:
+    """Embeddings keyed by a hash of (model, text).
+
+    Recent embeddings are kept in memory and shared by every memory in the
+    process, so the researchers, managers and trader embed the same situation
+    only once per run. With a DiskCache they also survive across runs.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{model}\0{text}".encode()).hexdigest()
+
+    def get(self, key: str, disk: Optional[DiskCache] = None) -> Optional[List[float]]:
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                return embedding
+        if disk is not None:
+            embedding = disk.get(key)
+            if embedding is not MISSING:
+                self._remember(key, embedding)
+                return embedding
+        return None
+
+    def set(self, key: str, embedding: List[float], disk: Optional[DiskCache] = None):
+        self._remember(key, embedding)
+        if disk is not None:
+            disk.set(key, embedding)
+
+    def _remember(self, key: str, embedding: List[float]):
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_embedding_cache = EmbeddingCache()
+_disk_caches: Dict[str, DiskCache] = {}
+_disk_caches_lock = threading.Lock()
+
+
+def _embedding_disk_cache(config) -> Optional[DiskCache]:
+    if not config.get("embedding_cache", True) or not config.get("data_cache_dir"):
+        return None
+    path = os.path.join(config["data_cache_dir"], "embeddings.sqlite")
+    with _disk_caches_lock:
+        if path not in _disk_caches:
+            _disk_caches[path] = DiskCache(path)
+        return _disk_caches[path]
+
+
+_persistent_clients: Dict[str, object] = {}
+_persistent_clients_lock = threading.Lock()
+
+
+def _persistent_client(path: str):
+    # chromadb is slow to import and only needed by the chroma backend
+    import chromadb
+    from chromadb.config import Settings
+
+    path = os.path.abspath(path)
+    with _persistent_clients_lock:
+        if path not in _persistent_clients:
+            os.makedirs(path, exist_ok=True)
+            _persistent_clients[path] = chromadb.PersistentClient(
+                path=path, settings=Settings(anonymized_telemetry=False)
+            )
+        return _persistent_clients[path]
+
+
+def _collection_name(name: str, namespace: str) -> str:
+    """Chroma-safe collection name for a memory role and ticker."""
+    namespace = re.sub(r"[^A-Za-z0-9_-]", "_", namespace.upper()).strip("_-") or "SHARED"
+    return f"{name}-{namespace}"[:512]
+
 
 class FinancialSituationMemory:
     def __init__(self, name, config):
@@ -13,11 +122,58 @@ class FinancialSituationMemory:
             base_url=config["backend_url"],
             api_key=config["api_key"]
         )
+        self.embedding_disk_cache = _embedding_disk_cache(config)
+        max_mb = config.get("embedding_cache_max_mb", 256)
+        self.embedding_cache_max_bytes = int(max_mb * 1024 * 1024) if max_mb else None
+        self.batch_size = config.get("embedding_batch_size", DEFAULT_EMBEDDING_BATCH_SIZE)
+        self.batch_tokens = config.get("embedding_batch_tokens", DEFAULT_EMBEDDING_BATCH_TOKENS)
+        self.name = name
+        self.session_id = config.get('session_id', 'default')
+        self.persist_dir = config.get("memory_persist_dir")
+        self.backend = config.get("memory_backend") or "chroma"
+        if self.backend not in MEMORY_BACKENDS:
+            raise ValueError(f"Unknown memory_backend '{self.backend}', expected one of {MEMORY_BACKENDS}")
+        self.vector_dtype = config.get("memory_vector_dtype", "float32")
+        self.namespace = "shared"
+        self.chroma_client = None
+        self.situation_collection = None
+        self._store_lock = None
+        self.open()
+
+    def open(self):
+        """
+        Connect to the memory store (done by __init__, and again after close)
+
+        Without memory_persist_dir memories live in a fresh in-memory
+        collection per session. With it they are kept on disk, shared by all
+        sessions and processes, in one collection per role and ticker (see
+        set_namespace). Readers share an inter-process lock and writers take
+        it exclusively, so there is a single writer at a time.
+
+        memory_backend picks Chroma or the lighter NumPy VectorIndex.
+        """
+        if self.situation_collection is not None:
+            return
+        if self.persist_dir:
+            if self.backend == "chroma":
+                self.chroma_client = _persistent_client(self.persist_dir)
+            self._store_lock = InterProcessLock(os.path.join(self.persist_dir, "memory.lock"))
+            self._open_namespace()
+            return
+
+        if self.backend == "numpy":
+            self.situation_collection = VectorIndex(
+                f"{self.name}_{self.session_id}", dtype=self.vector_dtype
+            )
+            return
+
+        import chromadb
+        from chromadb.config import Settings
+
         self.chroma_client = chromadb.Client(Settings(allow_reset=True))
         
         # Make collection name unique per session to avoid conflicts
-        session_id = config.get('session_id', 'default')
-        unique_name = f"{name}_{session_id}"
+        unique_name = f"{self.name}_{self.session_id}"
         
         # Check if collection already exists, if so delete it and create new one
         try:
@@ -31,39 +187,156 @@ class FinancialSituationMemory:
         # Create the collection (now guaranteed to be fresh and unique)
         self.situation_collection = self.chroma_client.create_collection(name=unique_name)
 
+    def close(self):
+        """Release the store. In-memory session collections are dropped."""
+        if self.situation_collection is None:
+            return
+        if isinstance(self.situation_collection, VectorIndex):
+            self.situation_collection.close()
+        elif not self.persist_dir:
+            try:
+                self.chroma_client.delete_collection(name=self.situation_collection.name)
+            except Exception:
+                pass
+        self.chroma_client = None
+        self.situation_collection = None
+
+    def set_namespace(self, ticker):
+        """Keep memories of ``ticker`` apart from other tickers' (persistent stores only)."""
+        self.namespace = ticker or "shared"
+        if self.persist_dir and self.situation_collection is not None:
+            self._open_namespace()
+
+    def _open_namespace(self):
+        name = _collection_name(self.name, self.namespace)
+        if self.situation_collection is not None and self.situation_collection.name == name:
+            return
+        if self.backend == "numpy":
+            if isinstance(self.situation_collection, VectorIndex):
+                self.situation_collection.close()
+            with self._lock(shared=True):
+                self.situation_collection = VectorIndex(
+                    name, os.path.join(self.persist_dir, "vectors", name), dtype=self.vector_dtype
+                )
+            return
+        with self._lock(shared=True):
+            self.situation_collection = self.chroma_client.get_or_create_collection(name=name)
+
+    def _lock(self, shared: bool = False):
+        if self._store_lock is None:
+            return nullcontext()
+        return self._store_lock.acquire(shared=shared)
+
     def get_embedding(self, text):
-        """Get OpenAI embedding for a text"""
+        """Get OpenAI embedding for a text, reusing any earlier embedding of it"""
+        key = EmbeddingCache.key(self.embedding, text)
+        cached = _embedding_cache.get(key, self.embedding_disk_cache)
+        if cached is not None:
+            return cached
         try:
             response = self.client.embeddings.create(
                 model=self.embedding, input=text
             )
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
         except Exception:
             # Embeddings may not be available on some providers (e.g., Groq)
             return None
+        _embedding_cache.set(key, embedding, self.embedding_disk_cache)
+        self._evict_disk_cache()
+        return embedding
+
+    def get_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Embed many texts with as few requests as possible
+
+        Cached texts are skipped and the rest are sent in batches of at most
+        batch_size texts and batch_tokens estimated tokens. Texts of a failed
+        batch are retried one by one; those that still fail map to None.
+        """
+        keys = [EmbeddingCache.key(self.embedding, text) for text in texts]
+        found: Dict[str, Optional[List[float]]] = {}
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key in found or key in missing:
+                continue
+            cached = _embedding_cache.get(key, self.embedding_disk_cache)
+            if cached is not None:
+                found[key] = cached
+            else:
+                missing[key] = text
+
+        for batch in self._batches(list(missing.items())):
+            try:
+                response = self.client.embeddings.create(
+                    model=self.embedding, input=[text for _, text in batch]
+                )
+                data = sorted(response.data, key=lambda item: item.index)
+                if len(data) != len(batch):
+                    raise ValueError("embeddings response does not match the batch")
+            except Exception:
+                for key, text in batch:
+                    found[key] = self.get_embedding(text)
+                continue
+            for (key, _), item in zip(batch, data):
+                _embedding_cache.set(key, item.embedding, self.embedding_disk_cache)
+                found[key] = item.embedding
+            self._evict_disk_cache()
+
+        return [found[key] for key in keys]
+
+    def _evict_disk_cache(self):
+        """Trim embeddings.sqlite to embedding_cache_max_mb after a write."""
+        if self.embedding_disk_cache is not None and self.embedding_cache_max_bytes:
+            self.embedding_disk_cache.evict(max_bytes=self.embedding_cache_max_bytes)
+
+    def _batches(self, items):
+        batch, tokens = [], 0
+        for key, text in items:
+            estimate = len(text) // 4 + 1
+            if batch and (len(batch) >= self.batch_size or tokens + estimate > self.batch_tokens):
+                yield batch
+                batch, tokens = [], 0
+            batch.append((key, text))
+            tokens += estimate
+        if batch:
+            yield batch
 
     def add_situations(self, situations_and_advice):
         """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
 
         situations = []
         advice = []
-        ids = []
         embeddings = []
 
-        offset = self.situation_collection.count()
+        all_embeddings = self.get_embeddings([situation for situation, _ in situations_and_advice])
 
-        for i, (situation, recommendation) in enumerate(situations_and_advice):
+        skipped = 0
+        for (situation, recommendation), embedding in zip(situations_and_advice, all_embeddings):
+            if embedding is None:
+                skipped += 1
+                continue
             situations.append(situation)
             advice.append(recommendation)
-            ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
-
-        self.situation_collection.add(
-            documents=situations,
-            metadatas=[{"recommendation": rec} for rec in advice],
-            embeddings=embeddings,
-            ids=ids,
-        )
+            embeddings.append(embedding)
+
+        if skipped:
+            print(f"Skipped {skipped} situations that could not be embedded")
+
+        with self._lock():
+            # Not derived from count(), which shrinks when memories are deleted
+            ids = [uuid.uuid4().hex for _ in situations]
+            if self.chroma_client is not None:
+                chunk_size = self.chroma_client.get_max_batch_size()
+            else:
+                chunk_size = max(1, len(ids))
+            for start in range(0, len(ids), chunk_size):
+                end = start + chunk_size
+                self.situation_collection.add(
+                    documents=situations[start:end],
+                    metadatas=[{"recommendation": rec} for rec in advice[start:end]],
+                    embeddings=embeddings[start:end],
+                    ids=ids[start:end],
+                )
 
     def get_memories(self, current_situation, n_matches=1):
         """Find matching recommendations using OpenAI embeddings"""
@@ -72,11 +345,12 @@ class FinancialSituationMemory:
             # Fallback: no memory retrieval
             return []
 
-        results = self.situation_collection.query(
-            query_embeddings=[query_embedding],
-            n_results=n_matches,
-            include=["metadatas", "documents", "distances"],
-        )
+        with self._lock(shared=True):
+            results = self.situation_collection.query(
+                query_embeddings=[query_embedding],
+                n_results=n_matches,
+                include=["metadatas", "documents", "distances"],
+            )
 
         matched_results = []
         for i in range(len(results["documents"][0])):
@@ -0,0 +1,101 @@
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+
+class ToolCallMemo:
+    """Single-flight memo for data tool calls within one graph run.
+
+    The first call for a given function and arguments runs it; identical calls
+    made while it is in flight wait on the same future, and later ones reuse
+    the result. Failed calls, whether they raise or return an "Error..."
+    message as the dataflows do, are not cached so they can be retried.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: Dict[tuple, Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def call(self, fn: Callable, *args, **kwargs) -> Any:
+        key = (fn.__module__, fn.__qualname__, repr(args), repr(sorted(kwargs.items())))
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._futures[key] = future
+                self.misses += 1
+            else:
+                self.hits += 1
+                if not future.done():
+                    self.coalesced += 1
+
+        if owner:
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                with self._lock:
+                    self._futures.pop(key, None)
+                future.set_exception(e)
+            else:
+                if isinstance(result, str) and result.startswith("Error"):
+                    # Calls already waiting share the error; later ones retry
+                    with self._lock:
+                        self._futures.pop(key, None)
+                future.set_result(result)
+
+        return future.result()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "calls": self.hits + self.misses,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+            }
+
+    def summary(self) -> str:
+        stats = self.stats()
+        return (
+            f"Tool calls: {stats['calls']}, executed: {stats['misses']}, "
+            f"deduplicated: {stats['hits']} ({stats['coalesced']} joined in flight)"
+        )
+
+
+_active_memo: ContextVar[Optional[ToolCallMemo]] = ContextVar("tool_call_memo", default=None)
+
+
+@contextmanager
+def tool_call_scope():
+    """Deduplicate identical tool calls made inside the ``with`` block.
+
+    The memo travels with the context, so tool calls executed on LangGraph's
+    worker threads during the run share it while concurrent runs in other
+    threads keep their own. The scope may also wrap a generator's body, which
+    can be closed from another context (e.g. when garbage collected).
+    """
+    memo = ToolCallMemo()
+    token = _active_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        try:
+            _active_memo.reset(token)
+        except ValueError:
+            # Closed from a context other than the one that opened the scope
+            if _active_memo.get() is memo:
+                _active_memo.set(None)
+
+
+def memoized_call(fn: Callable, *args, **kwargs) -> Any:
+    """Call ``fn`` through the active run's memo, or directly outside a run."""
+    memo = _active_memo.get()
+    if memo is None:
+        return fn(*args, **kwargs)
+    return memo.call(fn, *args, **kwargs)
@@ -0,0 +1,320 @@
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+LAYOUT_VERSION = 1
+
+# Rows converted to float32 at a time when searching a float16 matrix
+SEARCH_CHUNK_ROWS = 8192
+
+# Smallest capacity the vector file grows to
+MIN_CAPACITY = 1024
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+class VectorIndex:
+    """Cosine-similarity index over normalised embeddings in one contiguous matrix.
+
+    Implements the part of a Chroma collection FinancialSituationMemory uses
+    (count, add, query, get, delete), with distances reported as one minus
+    the cosine similarity. A query is a single matrix-vector product followed
+    by ``argpartition``.
+
+    With a ``directory`` the matrix is a memory-mapped file that only grows:
+    rows are appended in place, deleted rows are tombstoned, and ``compact``
+    rewrites the live rows once more than ``compact_ratio`` of them are dead.
+    The metadata file is replaced last on every write, so readers in other
+    processes always see a consistent prefix. Writers must be serialised by
+    the caller (FinancialSituationMemory holds its store lock). Without a
+    directory the index lives in memory.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        directory: Optional[str] = None,
+        dtype: str = "float32",
+        compact_ratio: float = 0.25,
+    ):
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported vector dtype {dtype}, use float32 or float16")
+        self.name = name
+        self.directory = directory
+        self.compact_ratio = compact_ratio
+        self._lock = threading.RLock()
+        self._meta = {
+            "version": LAYOUT_VERSION,
+            "dim": None,
+            "dtype": dtype,
+            "rows": 0,
+            "capacity": 0,
+            "generation": 0,
+            "deleted": [],
+        }
+        self._meta_signature = None
+        self._matrix: Optional[np.ndarray] = None
+        self._records: List[Dict] = []
+        self._records_offset = 0
+        self._row_of: Dict[str, int] = {}
+        self._deleted = set()
+        self._refresh()
+
+    # ----- on-disk layout -----
+
+    def _path(self, kind: str, generation: Optional[int] = None) -> str:
+        generation = self._meta["generation"] if generation is None else generation
+        suffix = {"vectors": "bin", "records": "jsonl"}[kind]
+        return os.path.join(self.directory, f"{kind}.{generation}.{suffix}")
+
+    def _meta_path(self) -> str:
+        return os.path.join(self.directory, "meta.json")
+
+    def _refresh(self):
+        """Pick up rows written by other processes since the last look."""
+        if self.directory is None:
+            return
+        try:
+            stat = os.stat(self._meta_path())
+        except FileNotFoundError:
+            return
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._meta_signature:
+            return
+        with open(self._meta_path(), "r") as f:
+            meta = json.load(f)
+        if meta.get("version") != LAYOUT_VERSION:
+            raise ValueError(f"Unsupported vector index layout in {self.directory}")
+
+        if meta["generation"] != self._meta["generation"]:
+            # Compacted elsewhere: start again from the new files
+            self._records, self._records_offset, self._row_of = [], 0, {}
+        self._meta = meta
+        self._meta_signature = signature
+        self._deleted = set(meta["deleted"])
+        self._map_matrix()
+        self._load_records()
+
+    def _map_matrix(self):
+        meta = self._meta
+        if not meta["capacity"]:
+            self._matrix = None
+            return
+        self._matrix = np.memmap(
+            self._path("vectors"),
+            dtype=meta["dtype"],
+            mode="r+",
+            shape=(meta["capacity"], meta["dim"]),
+        )
+
+    def _load_records(self):
+        if len(self._records) >= self._meta["rows"]:
+            return
+        with open(self._path("records"), "rb") as f:
+            f.seek(self._records_offset)
+            while len(self._records) < self._meta["rows"]:
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break
+                record = json.loads(line)
+                self._row_of[record["id"]] = len(self._records)
+                self._records.append(record)
+            self._records_offset = f.tell()
+
+    def _write_meta(self):
+        self._meta["deleted"] = sorted(self._deleted)
+        tmp_path = f"{self._meta_path()}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._meta, f)
+        os.replace(tmp_path, self._meta_path())
+        stat = os.stat(self._meta_path())
+        self._meta_signature = (stat.st_mtime_ns, stat.st_size)
+
+    def _ensure_capacity(self, rows: int):
+        meta = self._meta
+        if rows <= meta["capacity"]:
+            return
+        capacity = max(rows, 2 * meta["capacity"], MIN_CAPACITY)
+        if self.directory is None:
+            matrix = np.zeros((capacity, meta["dim"]), dtype=meta["dtype"])
+            if self._matrix is not None:
+                matrix[: meta["rows"]] = self._matrix[: meta["rows"]]
+            self._matrix = matrix
+            meta["capacity"] = capacity
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        itemsize = np.dtype(meta["dtype"]).itemsize
+        with open(self._path("vectors"), "ab") as f:
+            f.truncate(capacity * meta["dim"] * itemsize)
+        meta["capacity"] = capacity
+        self._map_matrix()
+
+    # ----- collection API -----
+
+    def count(self) -> int:
+        with self._lock:
+            self._refresh()
+            return self._meta["rows"] - len(self._deleted)
+
+    def add(self, documents, metadatas, embeddings, ids):
+        vectors = np.asarray(embeddings, dtype=np.float64)
+        if vectors.ndim != 2 or len(vectors) != len(ids):
+            raise ValueError("embeddings must be one vector per id")
+        with self._lock:
+            self._refresh()
+            meta = self._meta
+            if meta["dim"] is None:
+                meta["dim"] = vectors.shape[1]
+            elif vectors.shape[1] != meta["dim"]:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match index dimension {meta['dim']}"
+                )
+            duplicates = [i for i in ids if i in self._row_of and self._row_of[i] not in self._deleted]
+            if duplicates:
+                raise ValueError(f"Ids already in {self.name}: {duplicates[:5]}")
+
+            start = meta["rows"]
+            self._ensure_capacity(start + len(ids))
+            self._matrix[start : start + len(ids)] = _normalize(vectors)
+
+            records = [
+                {"id": id_, "document": document, "metadata": metadata}
+                for id_, document, metadata in zip(ids, documents, metadatas)
+            ]
+            if self.directory is not None:
+                self._matrix.flush()
+                with open(self._path("records"), "ab") as f:
+                    f.seek(0, os.SEEK_END)
+                    if f.tell() != self._records_offset:
+                        f.truncate(self._records_offset)  # drop a torn write
+                    for record in records:
+                        f.write(json.dumps(record).encode() + b"\n")
+                    self._records_offset = f.tell()
+            for record in records:
+                self._row_of[record["id"]] = len(self._records)
+                self._records.append(record)
+            meta["rows"] = start + len(ids)
+            if self.directory is not None:
+                self._write_meta()
+
+    def delete(self, ids):
+        with self._lock:
+            self._refresh()
+            for id_ in ids:
+                row = self._row_of.pop(id_, None)
+                if row is not None:
+                    self._deleted.add(row)
+            if self.directory is not None:
+                self._write_meta()
+            if len(self._deleted) > self.compact_ratio * max(1, self._meta["rows"]):
+                self.compact()
+
+    def compact(self):
+        """Rewrite the index without its deleted rows."""
+        with self._lock:
+            self._refresh()
+            meta = self._meta
+            live = [row for row in range(meta["rows"]) if row not in self._deleted]
+            vectors = (
+                np.array(self._matrix[live]) if live else np.zeros((0, meta["dim"] or 0))
+            )
+            records = [self._records[row] for row in live]
+
+            old_generation = meta["generation"]
+            self._matrix = None
+            meta.update(rows=0, capacity=0, generation=old_generation + 1)
+            self._deleted = set()
+            self._records, self._records_offset, self._row_of = [], 0, {}
+            if self.directory is not None:
+                os.makedirs(self.directory, exist_ok=True)
+                open(self._path("records"), "wb").close()
+            if live:
+                self._ensure_capacity(len(live))
+                self._matrix[: len(live)] = vectors
+                if self.directory is not None:
+                    self._matrix.flush()
+                    with open(self._path("records"), "wb") as f:
+                        for record in records:
+                            f.write(json.dumps(record).encode() + b"\n")
+                        self._records_offset = f.tell()
+                for record in records:
+                    self._row_of[record["id"]] = len(self._records)
+                    self._records.append(record)
+                meta["rows"] = len(live)
+
+            if self.directory is not None:
+                self._write_meta()
+                for kind in ("vectors", "records"):
+                    try:
+                        os.remove(self._path(kind, old_generation))
+                    except FileNotFoundError:
+                        pass
+
+    def search(self, embedding, n_results: int):
+        """Rows and cosine similarities of the ``n_results`` best live matches."""
+        with self._lock:
+            self._refresh()
+            rows = self._meta["rows"]
+            k = min(n_results, rows - len(self._deleted))
+            if k <= 0:
+                return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+            query = _normalize(np.asarray(embedding, dtype=np.float32))
+            matrix = self._matrix[:rows]
+            if matrix.dtype == np.float32:
+                scores = matrix @ query
+            else:
+                scores = np.empty(rows, dtype=np.float32)
+                for start in range(0, rows, SEARCH_CHUNK_ROWS):
+                    chunk = np.asarray(matrix[start : start + SEARCH_CHUNK_ROWS], dtype=np.float32)
+                    scores[start : start + len(chunk)] = chunk @ query
+            if self._deleted:
+                scores[list(self._deleted)] = -np.inf
+
+            best = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best], kind="stable")]
+            return best, scores[best]
+
+    def query(self, query_embeddings, n_results: int = 10, include=None):
+        result = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        with self._lock:
+            for embedding in query_embeddings:
+                rows, scores = self.search(embedding, n_results)
+                records = [self._records[row] for row in rows]
+                result["ids"].append([record["id"] for record in records])
+                result["documents"].append([record["document"] for record in records])
+                result["metadatas"].append([record["metadata"] for record in records])
+                result["distances"].append([float(1.0 - score) for score in scores])
+        return result
+
+    def get(self, ids=None, include=None):
+        with self._lock:
+            self._refresh()
+            if ids is None:
+                rows = [row for row in range(self._meta["rows"]) if row not in self._deleted]
+            else:
+                rows = [self._row_of[id_] for id_ in ids if id_ in self._row_of]
+                rows = [row for row in rows if row not in self._deleted]
+            records = [self._records[row] for row in rows]
+            return {
+                "ids": [record["id"] for record in records],
+                "documents": [record["document"] for record in records],
+                "metadatas": [record["metadata"] for record in records],
+                "embeddings": [np.array(self._matrix[row], dtype=np.float32) for row in rows],
+            }
+
+    def close(self):
+        """Flush and unmap the vector file; the index reopens it on next use."""
+        with self._lock:
+            if self.directory is None or self._matrix is None:
+                return
+            self._matrix.flush()
+            self._matrix = None
+            self._meta_signature = None
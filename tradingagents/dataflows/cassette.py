@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict
+
+from .config import get_config
+from .disk_cache import MISSING, DiskCache
+
+DATA_MODES = ("live", "record", "replay")
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode when a request was never recorded."""
+
+
+def get_data_mode() -> str:
+    """Return the configured data_mode: live, record or replay."""
+    mode = (get_config().get("data_mode") or "live").lower()
+    if mode not in DATA_MODES:
+        raise ValueError(f"Unknown data_mode '{mode}', expected one of {DATA_MODES}")
+    return mode
+
+
+_cassettes: Dict[str, DiskCache] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette() -> DiskCache:
+    """Return the archive for the configured cassette_path."""
+    config = get_config()
+    path = config.get("cassette_path") or os.path.join(
+        config["data_cache_dir"], "cassette.sqlite"
+    )
+    with _cassettes_lock:
+        if path not in _cassettes:
+            _cassettes[path] = DiskCache(path)
+        return _cassettes[path]
+
+
+def _cassette_key(source: str, request: Any) -> str:
+    payload = json.dumps([source, request], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _is_recordable(result: Any) -> bool:
+    """Whether a fetch result is an answer rather than a failure.
+
+    The dataflows report failures by returning None, an empty payload or an
+    "Error..." message instead of raising.
+    """
+    if result is None:
+        return False
+    if isinstance(result, str):
+        return bool(result) and not result.startswith("Error")
+    if isinstance(result, (dict, list, tuple)):
+        return len(result) > 0
+    return True
+
+
+def cassette_call(source: str, request: Any, fetch: Callable[[], Any]) -> Any:
+    """
+    Run a network fetch according to data_mode
+
+    Args:
+        source: Name of the data source, e.g. "coingecko"
+        request: JSON-serialisable description of the request, used as the key
+        fetch: Performs the request and returns a picklable result
+
+    In live mode ``fetch`` is simply called. In record mode its result is also
+    archived unless it is empty or an error, and in replay mode the archived
+    result is returned without calling ``fetch`` (raising CassetteMiss if
+    there is none).
+    """
+    mode = get_data_mode()
+    if mode == "live":
+        return fetch()
+
+    key = _cassette_key(source, request)
+    if mode == "replay":
+        result = get_cassette().get(key)
+        if result is MISSING:
+            raise CassetteMiss(f"No recorded {source} response for {request}")
+        return result
+
+    result = fetch()
+    if _is_recordable(result):
+        get_cassette().set(key, result)
+    return result
+
+
+async def acassette_call(
+    source: str, request: Any, fetch: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Awaitable version of ``cassette_call`` for coroutine fetches."""
+    mode = get_data_mode()
+    if mode == "live":
+        return await fetch()
+
+    key = _cassette_key(source, request)
+    if mode == "replay":
+        result = get_cassette().get(key)
+        if result is MISSING:
+            raise CassetteMiss(f"No recorded {source} response for {request}")
+        return result
+
+    result = await fetch()
+    if _is_recordable(result):
+        get_cassette().set(key, result)
+    return result
@@ -0,0 +1,175 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .config import get_config
+
+# Rank recorded for candidates that were checked and have no market cap rank
+UNRANKED = 10 ** 9
+
+
+class CoinIdResolver:
+    """Symbol to CoinGecko id lookup backed by a disk-cached hash index.
+
+    The full ``/coins/list`` is downloaded at most once per TTL and turned
+    into a ``symbol -> [[id, market_cap_rank], ...]`` index, with candidates
+    ordered by market cap rank (best first, unranked last). Lookups are then
+    a single dict access.
+    """
+
+    def __init__(self, cache_path: str, ttl_seconds: float = 86400, rank_pages: int = 4):
+        self.cache_path = cache_path
+        self.ttl_seconds = ttl_seconds
+        self.rank_pages = rank_pages
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._index: Optional[Dict[str, List[List]]] = None
+        self._fetched_at = 0.0
+        self._next_attempt = 0.0
+
+    def resolve(self, symbol: str, api) -> Optional[str]:
+        """Return the highest market cap coin id for ``symbol``, or None."""
+        index = self._ensure_index(api)
+        candidates = index.get(symbol.lower())
+        if not candidates:
+            return None
+
+        # Symbols shared only by coins outside the ranked pages get their
+        # candidates ranked once on demand, then the result is persisted.
+        if len(candidates) > 1 and candidates[0][1] is None:
+            candidates = self._rank_candidates(symbol.lower(), candidates, api)
+
+        return candidates[0][0]
+
+    def _is_fresh(self) -> bool:
+        return time.time() - self._fetched_at < self.ttl_seconds
+
+    def _current(self) -> Optional[Dict[str, List[List]]]:
+        """The index if no rebuild is due, else None. Caller holds ``_lock``."""
+        if self._index is None:
+            self._load()
+        if self._index is not None and self._is_fresh():
+            return self._index
+        if time.time() < self._next_attempt:
+            # Don't retry the multi-megabyte download on every lookup
+            return self._index or {}
+        return None
+
+    def _ensure_index(self, api) -> Dict[str, List[List]]:
+        with self._lock:
+            index = self._current()
+            if index is not None:
+                return index
+            stale = self._index
+
+        # Download outside the lookup lock. One thread rebuilds while the
+        # others keep using the stale index, or wait for it if there is none.
+        if not self._build_lock.acquire(blocking=stale is None):
+            return stale
+        try:
+            with self._lock:
+                index = self._current()
+                if index is not None:
+                    return index
+            index = self._build(api)
+            with self._lock:
+                if index is None:
+                    self._next_attempt = time.time() + 300
+                else:
+                    self._index = index
+                    self._fetched_at = time.time()
+                    self._save()
+                return self._index if self._index is not None else {}
+        finally:
+            self._build_lock.release()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, "r") as f:
+                cached = json.load(f)
+            self._index = cached["index"]
+            self._fetched_at = cached["fetched_at"]
+        except (OSError, ValueError, KeyError):
+            self._index = None
+            self._fetched_at = 0.0
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"fetched_at": self._fetched_at, "index": self._index}, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def _build(self, api) -> Optional[Dict[str, List[List]]]:
+        coins_list = api._make_request("/coins/list")
+        if not coins_list:
+            print("Could not download CoinGecko coin list; using cached index if any")
+            return None
+
+        ranks = {}
+        for page in range(1, self.rank_pages + 1):
+            markets = api._make_request(
+                "/coins/markets",
+                {
+                    "vs_currency": "usd",
+                    "order": "market_cap_desc",
+                    "per_page": 250,
+                    "page": page,
+                },
+            )
+            if not markets:
+                break
+            for coin in markets:
+                if coin.get("market_cap_rank"):
+                    ranks[coin["id"]] = coin["market_cap_rank"]
+
+        index: Dict[str, List[List]] = {}
+        for coin in coins_list:
+            symbol = coin.get("symbol", "").lower()
+            if symbol and coin.get("id"):
+                index.setdefault(symbol, []).append([coin["id"], ranks.get(coin["id"])])
+        for candidates in index.values():
+            _sort_candidates(candidates)
+        return index
+
+    def _rank_candidates(self, symbol: str, candidates: List[List], api) -> List[List]:
+        ids = [coin_id for coin_id, _ in candidates[:250]]
+        markets = api._make_request(
+            "/coins/markets",
+            {"vs_currency": "usd", "ids": ",".join(ids), "per_page": len(ids)},
+        )
+        if not markets:
+            return candidates
+
+        ranks = {coin["id"]: coin.get("market_cap_rank") for coin in markets}
+        ranked = [[coin_id, ranks.get(coin_id) or UNRANKED] for coin_id, _ in candidates]
+        _sort_candidates(ranked)
+        with self._lock:
+            if self._index is not None:
+                self._index[symbol] = ranked
+                self._save()
+        return ranked
+
+
+def _sort_candidates(candidates: List[List]):
+    candidates.sort(key=lambda c: (c[1] is None, c[1] or 0, c[0]))
+
+
+_resolvers: Dict[str, CoinIdResolver] = {}
+_resolvers_lock = threading.Lock()
+
+
+def get_coin_resolver() -> CoinIdResolver:
+    """Return the process-wide resolver for the configured cache directory."""
+    config = get_config()
+    cache_path = os.path.join(config["data_cache_dir"], "coingecko", "coin_index.json")
+    with _resolvers_lock:
+        if cache_path not in _resolvers:
+            _resolvers[cache_path] = CoinIdResolver(
+                cache_path,
+                ttl_seconds=float(config.get("coingecko_coin_list_ttl_hours", 24)) * 3600,
+                rank_pages=int(config.get("coingecko_rank_pages", 4)),
+            )
+        return _resolvers[cache_path]
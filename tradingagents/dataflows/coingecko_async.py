@@ -0,0 +1,315 @@
+import asyncio
+import os
+import threading
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Annotated, Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from .cassette import acassette_call, get_data_mode
+from .config import get_config
+from .crypto_price_store import (
+    fetch_windows,
+    get_price_store,
+    granularity_for_span,
+    merge_payloads,
+)
+from .rate_limiter import backoff_delay, parse_retry_after
+from .coingecko_utils import (
+    MAJOR_COIN_IDS,
+    MARKETS_PAGE_SIZE,
+    RETRYABLE_STATUS,
+    _columns_from_payload,
+    _end_of_day_timestamp,
+    _format_crypto_news,
+    _format_market_data,
+    _format_price_data,
+    _format_technical_indicators,
+    _parse_market_snapshot,
+    get_coingecko_client,
+    get_coingecko_rate_limiter,
+)
+
+
+class AsyncCoinGeckoAPI:
+    """Asyncio CoinGecko client sharing the sync client's quota and caches.
+
+    Use as an async context manager so the pooled ``httpx.AsyncClient`` is
+    closed with the event loop that created it. Requests go through the same
+    token bucket as :class:`CoinGeckoAPI`, and price series are read from
+    and written to the same local price store.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        config = get_config()
+        self.base_url = "https://api.coingecko.com/api/v3"
+        self.api_key = api_key or os.getenv("COINGECKO_API_KEY")
+        self.max_retries = int(config.get("coingecko_max_retries", 3))
+        self.rate_limiter = get_coingecko_rate_limiter(self.api_key)
+
+        pool_size = int(config.get("coingecko_pool_size", 10))
+        headers = {"X-Cg-Pro-Api-Key": self.api_key} if self.api_key else {}
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=float(config.get("coingecko_timeout", 15)),
+            limits=httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            ),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncCoinGeckoAPI":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
+        """Make API request with error handling and rate limiting"""
+        # Same request description as the sync client, so recordings are shared
+        return await acassette_call(
+            "coingecko",
+            {"endpoint": endpoint, "params": params},
+            lambda: self._fetch(endpoint, params),
+        )
+
+    async def _fetch(self, endpoint: str, params: Dict = None) -> Dict:
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire_async()
+            try:
+                response = await self.client.get(endpoint, params=params)
+            except httpx.TransportError as e:
+                if attempt == self.max_retries:
+                    print(f"Error making request to {self.base_url}{endpoint}: {e}")
+                    return {}
+                await asyncio.sleep(backoff_delay(attempt))
+                continue
+
+            if response.status_code == 429 or response.status_code in RETRYABLE_STATUS:
+                if attempt == self.max_retries:
+                    print(f"Giving up on {self.base_url}{endpoint} after {attempt + 1} attempts (HTTP {response.status_code})")
+                    return {}
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                delay = (retry_after if retry_after is not None else 0) + backoff_delay(attempt)
+                print(f"CoinGecko returned HTTP {response.status_code}, retrying in {delay:.1f}s")
+                await self.rate_limiter.penalize_async(delay)
+                continue
+
+            try:
+                response.raise_for_status()
+                return response.json()
+            except (httpx.HTTPError, ValueError) as e:
+                print(f"Error making request to {self.base_url}{endpoint}: {e}")
+                return {}
+        return {}
+
+    async def get_coin_id(self, symbol: str) -> Optional[str]:
+        """Get CoinGecko coin ID from symbol, prioritizing major cryptocurrencies"""
+        symbol_lower = symbol.lower()
+        if symbol_lower in MAJOR_COIN_IDS:
+            return MAJOR_COIN_IDS[symbol_lower]
+        # The resolver keeps its index on disk; building it is a rare, blocking
+        # download, so run it off the event loop.
+        return await asyncio.to_thread(get_coingecko_client(self.api_key).get_coin_id, symbol)
+
+    async def get_price_series(
+        self,
+        coin_id: str,
+        start_timestamp: int,
+        end_timestamp: int,
+        granularity: Optional[str] = None,
+    ) -> Dict[str, List]:
+        """Async counterpart of ``coingecko_utils._get_price_series``."""
+        async def fetch(from_ts: int, to_ts: int) -> Dict:
+            params = {"vs_currency": "usd", "from": from_ts, "to": to_ts}
+            return await self._make_request(f"/coins/{coin_id}/market_chart/range", params)
+
+        if not get_config().get("crypto_price_store", True):
+            if granularity == "daily":
+                days = max(1, (end_timestamp - start_timestamp) // 86400)
+                params = {"vs_currency": "usd", "days": days, "interval": "daily"}
+                data = await self._make_request(f"/coins/{coin_id}/market_chart", params)
+            else:
+                data = await fetch(start_timestamp, end_timestamp)
+            return _columns_from_payload(data)
+
+        granularity = granularity or granularity_for_span(start_timestamp, end_timestamp)
+        if get_data_mode() != "live":
+            # Same store bypass as the sync client, so recordings stay replayable
+            windows = fetch_windows(granularity, start_timestamp, end_timestamp)
+            payloads = await asyncio.gather(*(fetch(f, t) for f, t in windows))
+            columns = merge_payloads(payloads, granularity, start_timestamp, end_timestamp)
+            return {name: values.tolist() for name, values in columns.items()}
+
+        # The store reads and rewrites .npz files, so its calls run off the event loop
+        store = get_price_store()
+        windows = await asyncio.to_thread(
+            store.missing_ranges, coin_id, granularity, start_timestamp, end_timestamp
+        )
+        payloads = await asyncio.gather(*(fetch(f, t) for f, t in windows))
+        for (from_ts, to_ts), payload in zip(windows, payloads):
+            if payload:
+                await asyncio.to_thread(
+                    store.ingest, coin_id, granularity, payload, from_ts, to_ts
+                )
+
+        columns = await asyncio.to_thread(
+            store.read, coin_id, granularity, start_timestamp, end_timestamp
+        )
+        return {name: values.tolist() for name, values in columns.items()}
+
+
+@asynccontextmanager
+async def _client_scope(api: Optional[AsyncCoinGeckoAPI]):
+    """Reuse the caller's client, or open (and close) a temporary one."""
+    if api is not None:
+        yield api
+        return
+    async with AsyncCoinGeckoAPI() as owned:
+        yield owned
+
+
+async def aget_crypto_price_data(
+    symbol: Annotated[str, "Cryptocurrency symbol like BTC, ETH"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+    api: Optional[AsyncCoinGeckoAPI] = None,
+) -> str:
+    """Awaitable version of ``get_crypto_price_data``."""
+    async with _client_scope(api) as api:
+        coin_id = await api.get_coin_id(symbol)
+        if not coin_id:
+            return f"Error: Could not find coin ID for symbol {symbol}"
+
+        start_timestamp = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp())
+        end_timestamp = int(datetime.strptime(end_date, "%Y-%m-%d").timestamp())
+        series = await api.get_price_series(coin_id, start_timestamp, end_timestamp)
+        return _format_price_data(symbol, start_date, end_date, series)
+
+
+async def aget_crypto_market_data(
+    symbol: Annotated[str, "Cryptocurrency symbol like BTC, ETH"],
+    api: Optional[AsyncCoinGeckoAPI] = None,
+) -> str:
+    """Awaitable version of ``get_crypto_market_data``."""
+    async with _client_scope(api) as api:
+        coin_id = await api.get_coin_id(symbol)
+        if not coin_id:
+            return f"Error: Could not find coin ID for symbol {symbol}"
+
+        params = {
+            "vs_currency": "usd",
+            "ids": coin_id,
+            "per_page": MARKETS_PAGE_SIZE,
+            "price_change_percentage": "24h,7d,30d",
+        }
+        rows = await api._make_request("/coins/markets", params)
+        snapshot = _parse_market_snapshot(rows[0]) if rows else None
+        return _format_market_data(symbol, snapshot)
+
+
+async def aget_crypto_news(
+    symbol: Annotated[str, "Cryptocurrency symbol like BTC, ETH"],
+    curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "How many days to look back"] = 7,
+    api: Optional[AsyncCoinGeckoAPI] = None,
+) -> str:
+    """Awaitable version of ``get_crypto_news``; both endpoints are fetched concurrently."""
+    async with _client_scope(api) as api:
+        trending_data, global_data = await asyncio.gather(
+            api._make_request("/search/trending"), api._make_request("/global")
+        )
+        return _format_crypto_news(look_back_days, trending_data, global_data)
+
+
+async def aget_crypto_technical_indicators(
+    symbol: Annotated[str, "Cryptocurrency symbol like BTC, ETH"],
+    curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "How many days to look back"] = 30,
+    api: Optional[AsyncCoinGeckoAPI] = None,
+) -> str:
+    """Awaitable version of ``get_crypto_technical_indicators``."""
+    async with _client_scope(api) as api:
+        coin_id = await api.get_coin_id(symbol)
+        if not coin_id:
+            return f"Error: Could not find coin ID for symbol {symbol}"
+
+        end_timestamp = _end_of_day_timestamp(curr_date)
+        start_timestamp = end_timestamp - look_back_days * 86400
+        series = await api.get_price_series(
+            coin_id, start_timestamp, end_timestamp, granularity="daily"
+        )
+        return _format_technical_indicators(symbol, look_back_days, series)
+
+
+ASYNC_CRYPTO_FUNCTIONS = {
+    "get_crypto_price_data": aget_crypto_price_data,
+    "get_crypto_market_data": aget_crypto_market_data,
+    "get_crypto_news": aget_crypto_news,
+    "get_crypto_technical_indicators": aget_crypto_technical_indicators,
+}
+
+
+async def gather_crypto_data(calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+    """
+    Run several crypto data calls concurrently over one pooled client
+
+    Args:
+        calls: (function name, keyword arguments) pairs, where the name is one
+            of get_crypto_price_data, get_crypto_market_data, get_crypto_news
+            or get_crypto_technical_indicators
+
+    Returns:
+        The reports in the same order as ``calls``; a failing call yields its
+        error message instead of cancelling the others
+    """
+    async with AsyncCoinGeckoAPI() as api:
+        async def run(name: str, kwargs: Dict[str, Any]) -> str:
+            # Unknown names and bad arguments fail inside the task, not while gathering
+            return await ASYNC_CRYPTO_FUNCTIONS[name](**kwargs, api=api)
+
+        results = await asyncio.gather(
+            *(run(name, kwargs) for name, kwargs in calls), return_exceptions=True
+        )
+    return [
+        f"Error in {name}: {result}" if isinstance(result, Exception) else result
+        for (name, _), result in zip(calls, results)
+    ]
+
+
+def run_crypto_data_calls(calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+    """
+    Blocking wrapper around ``gather_crypto_data`` for synchronous callers
+
+    Works whether or not the calling thread already runs an event loop (in
+    which case the calls run on a helper thread).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(gather_crypto_data(calls))
+
+    results: List[str] = []
+    errors: List[BaseException] = []
+
+    def runner():
+        try:
+            results.extend(asyncio.run(gather_crypto_data(calls)))
+        except BaseException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=runner)
+    thread.start()
+    thread.join()
+    if errors:
+        raise errors[0]
+    return results
@@ -1,88 +1,168 @@
 import requests
+import threading
+from requests.adapters import HTTPAdapter
 import json
+import numpy as np
 import pandas as pd
 from typing import Annotated, Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import time
-from .config import DATA_DIR
+from .config import DATA_DIR, get_config
+from .cassette import cassette_call, get_data_mode
+from .coin_resolver import get_coin_resolver
+from .crypto_indicators import (
+    DEFAULT_INDICATORS,
+    compute_indicators,
+    describe_indicator,
+    warmup_periods,
+)
+from .crypto_price_store import fetch_range, get_price_store
+from .rate_limiter import TokenBucket, backoff_delay, get_rate_limiter, parse_retry_after
 import os
 
 
+# Direct mapping for major cryptocurrencies to avoid API calls and ambiguity
+MAJOR_COIN_IDS = {
+    'btc': 'bitcoin',
+    'eth': 'ethereum',
+    'ada': 'cardano',
+    'sol': 'solana',
+    'dot': 'polkadot',
+    'avax': 'avalanche-2',
+    'matic': 'matic-network',
+    'link': 'chainlink',
+    'uni': 'uniswap',
+    'aave': 'aave',
+    'xrp': 'ripple',
+    'ltc': 'litecoin',
+    'bch': 'bitcoin-cash',
+    'eos': 'eos',
+    'trx': 'tron',
+    'xlm': 'stellar',
+    'vet': 'vechain',
+    'algo': 'algorand',
+    'atom': 'cosmos',
+    'near': 'near',
+    'ftm': 'fantom',
+    'cro': 'crypto-com-chain',
+    'sand': 'the-sandbox',
+    'mana': 'decentraland',
+    'axs': 'axie-infinity',
+    'gala': 'gala',
+    'enj': 'enjincoin',
+    'chz': 'chiliz',
+    'bat': 'basic-attention-token',
+    'zec': 'zcash',
+    'dash': 'dash',
+    'xmr': 'monero',
+    'doge': 'dogecoin',
+    'shib': 'shiba-inu',
+    'bnb': 'binancecoin',
+    'usdt': 'tether',
+    'usdc': 'usd-coin',
+    'ton': 'the-open-network',
+    'icp': 'internet-computer',
+    'hbar': 'hedera-hashgraph',
+    'theta': 'theta-token',
+    'fil': 'filecoin',
+    'etc': 'ethereum-classic',
+    'mkr': 'maker',
+    'apt': 'aptos',
+    'ldo': 'lido-dao',
+    'op': 'optimism'
+}
+
+
+# Public API allows ~30 calls/min, paid plans start at 500 calls/min
+FREE_TIER_CALLS_PER_MIN = 30
+PRO_TIER_CALLS_PER_MIN = 500
+RETRYABLE_STATUS = {500, 502, 503, 504}
+
+
+def get_coingecko_rate_limiter(api_key: Optional[str] = None) -> TokenBucket:
+    """
+    Get the shared token bucket for CoinGecko requests
+
+    Sized to the free or pro tier quota unless coingecko_calls_per_min is set.
+    Setting coingecko_rate_limit_file shares the bucket across processes.
+    """
+    config = get_config()
+    tier = "pro" if api_key else "free"
+    default_rate = PRO_TIER_CALLS_PER_MIN if api_key else FREE_TIER_CALLS_PER_MIN
+    rate = config.get("coingecko_calls_per_min") or default_rate
+    return get_rate_limiter(
+        f"coingecko-{tier}",
+        rate,
+        burst=config.get("coingecko_rate_limit_burst"),
+        lock_file=config.get("coingecko_rate_limit_file"),
+    )
+
+
 class CoinGeckoAPI:
     """CoinGecko API utilities for cryptocurrency data"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        pool_size: int = 10,
+        timeout: float = 15,
+        max_retries: int = 3,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
         self.base_url = "https://api.coingecko.com/api/v3"
         self.api_key = api_key or os.getenv("COINGECKO_API_KEY")
+        self.timeout = timeout
         self.session = requests.Session()
+        # Keep-alive pool shared by every thread using this client
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         if self.api_key:
             self.session.headers.update({"X-Cg-Pro-Api-Key": self.api_key})
         
-        # Direct mapping for major cryptocurrencies to avoid API calls and ambiguity
-        self.major_coin_ids = {
-            'btc': 'bitcoin',
-            'eth': 'ethereum',
-            'ada': 'cardano',
-            'sol': 'solana',
-            'dot': 'polkadot',
-            'avax': 'avalanche-2',
-            'matic': 'matic-network',
-            'link': 'chainlink',
-            'uni': 'uniswap',
-            'aave': 'aave',
-            'xrp': 'ripple',
-            'ltc': 'litecoin',
-            'bch': 'bitcoin-cash',
-            'eos': 'eos',
-            'trx': 'tron',
-            'xlm': 'stellar',
-            'vet': 'vechain',
-            'algo': 'algorand',
-            'atom': 'cosmos',
-            'near': 'near',
-            'ftm': 'fantom',
-            'cro': 'crypto-com-chain',
-            'sand': 'the-sandbox',
-            'mana': 'decentraland',
-            'axs': 'axie-infinity',
-            'gala': 'gala',
-            'enj': 'enjincoin',
-            'chz': 'chiliz',
-            'bat': 'basic-attention-token',
-            'zec': 'zcash',
-            'dash': 'dash',
-            'xmr': 'monero',
-            'doge': 'dogecoin',
-            'shib': 'shiba-inu',
-            'bnb': 'binancecoin',
-            'usdt': 'tether',
-            'usdc': 'usd-coin',
-            'ton': 'the-open-network',
-            'icp': 'internet-computer',
-            'hbar': 'hedera-hashgraph',
-            'theta': 'theta-token',
-            'fil': 'filecoin',
-            'etc': 'ethereum-classic',
-            'mkr': 'maker',
-            'apt': 'aptos',
-            'ldo': 'lido-dao',
-            'op': 'optimism'
-        }
+        self.major_coin_ids = MAJOR_COIN_IDS
+        self.max_retries = max_retries
+        self.rate_limiter = rate_limiter or get_coingecko_rate_limiter(self.api_key)
     
     def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
         """Make API request with error handling and rate limiting"""
+        return cassette_call(
+            "coingecko",
+            {"endpoint": endpoint, "params": params},
+            lambda: self._fetch(endpoint, params),
+        )
+
+    def _fetch(self, endpoint: str, params: Dict = None) -> Dict:
         url = f"{self.base_url}{endpoint}"
-        try:
-            response = self.session.get(url, params=params)
-            if response.status_code == 429:
-                print("Rate limit exceeded. Please wait before making more requests.")
-                time.sleep(2)  # Wait 2 seconds before retrying
-                response = self.session.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error making request to {url}: {e}")
-            return {}
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == self.max_retries:
+                    print(f"Error making request to {url}: {e}")
+                    return {}
+                time.sleep(backoff_delay(attempt))
+                continue
+
+            if response.status_code == 429 or response.status_code in RETRYABLE_STATUS:
+                if attempt == self.max_retries:
+                    print(f"Giving up on {url} after {attempt + 1} attempts (HTTP {response.status_code})")
+                    return {}
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                delay = (retry_after if retry_after is not None else 0) + backoff_delay(attempt)
+                print(f"CoinGecko returned HTTP {response.status_code}, retrying in {delay:.1f}s")
+                # Hold back every thread sharing the limiter, not just this one
+                self.rate_limiter.penalize(delay)
+                continue
+
+            try:
+                response.raise_for_status()
+                return response.json()
+            except (requests.exceptions.RequestException, ValueError) as e:
+                print(f"Error making request to {url}: {e}")
+                return {}
+        return {}
     
     def get_coin_id(self, symbol: str) -> Optional[str]:
         """Get CoinGecko coin ID from symbol, prioritizing major cryptocurrencies"""
@@ -92,38 +172,99 @@ class CoinGeckoAPI:
         if symbol_lower in self.major_coin_ids:
             return self.major_coin_ids[symbol_lower]
         
-        # Fallback to API call for less common coins
+        # Fallback to the cached, market cap ranked coin index
         try:
-            coins_list = self._make_request("/coins/list")
-            matches = []
-            for coin in coins_list:
-                if coin.get("symbol", "").lower() == symbol_lower:
-                    matches.append(coin)
-            
-            if not matches:
-                return None
-            
-            # If multiple matches, prefer the one with a more "standard" name
-            # This helps avoid meme coins with same symbol
-            if len(matches) == 1:
-                return matches[0]["id"]
-            
-            # For multiple matches, try to pick the most legitimate one
-            # Usually the original coin has a simpler ID
-            for match in matches:
-                coin_id = match["id"]
-                # Prefer shorter, simpler IDs (usually the original coins)
-                if len(coin_id) < 20 and not any(char in coin_id for char in ['2', '3', 'token', 'coin']):
-                    return coin_id
-            
-            # If no clear winner, return the first match
-            return matches[0]["id"]
-            
+            return get_coin_resolver().resolve(symbol_lower, self)
         except Exception as e:
             print(f"Error getting coin ID for {symbol}: {e}")
             return None
 
 
+_clients: Dict[tuple, CoinGeckoAPI] = {}
+_clients_lock = threading.Lock()
+
+
+def get_coingecko_client(api_key: Optional[str] = None) -> CoinGeckoAPI:
+    """
+    Get the process-wide CoinGecko client for an API key
+
+    Clients are created once and reused across threads so tool calls share
+    pooled keep-alive connections instead of opening a new session each time.
+    Pool size and timeout come from the coingecko_pool_size and
+    coingecko_timeout config values.
+    """
+    config = get_config()
+    api_key = api_key or os.getenv("COINGECKO_API_KEY")
+    pool_size = int(config.get("coingecko_pool_size", 10))
+    timeout = float(config.get("coingecko_timeout", 15))
+    max_retries = int(config.get("coingecko_max_retries", 3))
+    key = (api_key, pool_size, timeout, max_retries)
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = CoinGeckoAPI(
+                api_key, pool_size=pool_size, timeout=timeout, max_retries=max_retries
+            )
+            _clients[key] = client
+        return client
+
+
+def _get_price_series(
+    api: CoinGeckoAPI,
+    coin_id: str,
+    start_timestamp: int,
+    end_timestamp: int,
+    granularity: Optional[str] = None,
+) -> Dict[str, List]:
+    """
+    Get aligned timestamp/price/volume/market cap columns for a coin
+
+    Served from the local price store when enabled, so only time ranges that
+    have not been fetched before hit the API. When recording or replaying,
+    the store is bypassed so the requests depend only on the arguments.
+    """
+    def fetch(from_ts: int, to_ts: int) -> Dict:
+        params = {"vs_currency": "usd", "from": from_ts, "to": to_ts}
+        return api._make_request(f"/coins/{coin_id}/market_chart/range", params)
+
+    if get_config().get("crypto_price_store", True):
+        if get_data_mode() == "live":
+            columns = get_price_store().get_range(
+                coin_id, start_timestamp, end_timestamp, fetch, granularity
+            )
+        else:
+            columns = fetch_range(start_timestamp, end_timestamp, fetch, granularity)
+        return {name: values.tolist() for name, values in columns.items()}
+
+    if granularity == "daily":
+        days = max(1, (end_timestamp - start_timestamp) // 86400)
+        params = {"vs_currency": "usd", "days": days, "interval": "daily"}
+        data = api._make_request(f"/coins/{coin_id}/market_chart", params)
+    else:
+        data = fetch(start_timestamp, end_timestamp)
+
+    return _columns_from_payload(data)
+
+
+def _end_of_day_timestamp(curr_date: str) -> int:
+    """Last second of curr_date; the API returns data up to now for later times."""
+    return int(datetime.strptime(curr_date, "%Y-%m-%d").timestamp()) + 86399
+
+
+def _columns_from_payload(data: Dict) -> Dict[str, List]:
+    """Align the prices/total_volumes/market_caps arrays of a market_chart payload"""
+    prices = data.get("prices", []) if data else []
+    volumes = dict(data.get("total_volumes", [])) if data else {}
+    market_caps = dict(data.get("market_caps", [])) if data else {}
+    return {
+        "timestamps": [ts for ts, _ in prices],
+        "prices": [price for _, price in prices],
+        "volumes": [volumes.get(ts, 0) for ts, _ in prices],
+        "market_caps": [market_caps.get(ts, 0) for ts, _ in prices],
+    }
+
+
 def get_crypto_price_data(
     symbol: Annotated[str, "Cryptocurrency symbol like BTC, ETH"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -140,7 +281,7 @@ def get_crypto_price_data(
     Returns:
         String representation of price data
     """
-    api = CoinGeckoAPI()
+    api = get_coingecko_client()
     coin_id = api.get_coin_id(symbol)
     
     if not coin_id:
@@ -150,32 +291,23 @@ def get_crypto_price_data(
     start_timestamp = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp())
     end_timestamp = int(datetime.strptime(end_date, "%Y-%m-%d").timestamp())
     
-    params = {
-        "vs_currency": "usd",
-        "from": start_timestamp,
-        "to": end_timestamp
-    }
-    
-    data = api._make_request(f"/coins/{coin_id}/market_chart/range", params)
+    series = _get_price_series(api, coin_id, start_timestamp, end_timestamp)
     
-    if not data:
+    return _format_price_data(symbol, start_date, end_date, series)
+
+
+def _format_price_data(symbol: str, start_date: str, end_date: str, series: Dict[str, List]) -> str:
+    """Render price columns as the price history report"""
+    if not series["timestamps"]:
         return f"No price data available for {symbol}"
     
-    # Format the data
-    prices = data.get("prices", [])
-    volumes = data.get("total_volumes", [])
-    market_caps = data.get("market_caps", [])
-    
     result_str = f"## {symbol.upper()} Price Data from {start_date} to {end_date}:\n\n"
     
-    for i, price_point in enumerate(prices[-30:]):  # Last 30 days
-        timestamp = price_point[0]
-        price = price_point[1]
+    for timestamp, price, volume, market_cap in list(zip(
+        series["timestamps"], series["prices"], series["volumes"], series["market_caps"]
+    ))[-30:]:  # Last 30 data points
         date = datetime.fromtimestamp(timestamp/1000).strftime("%Y-%m-%d")
         
-        volume = volumes[i][1] if i < len(volumes) else 0
-        market_cap = market_caps[i][1] if i < len(market_caps) else 0
-        
         result_str += f"Date: {date}\n"
         result_str += f"Price: ${price:,.2f}\n"
         result_str += f"Volume: ${volume:,.0f}\n"
@@ -184,6 +316,80 @@ def get_crypto_price_data(
     return result_str
 
 
+# Fields kept from a /coins/markets row; everything else is dropped
+SNAPSHOT_FIELDS = {
+    "name": "name",
+    "current_price": "current_price",
+    "market_cap": "market_cap",
+    "total_volume": "total_volume",
+    "price_change_24h": "price_change_percentage_24h_in_currency",
+    "price_change_7d": "price_change_percentage_7d_in_currency",
+    "price_change_30d": "price_change_percentage_30d_in_currency",
+    "market_cap_rank": "market_cap_rank",
+    "circulating_supply": "circulating_supply",
+    "total_supply": "total_supply",
+    "ath": "ath",
+    "atl": "atl",
+}
+MARKETS_PAGE_SIZE = 250
+
+
+def _parse_market_snapshot(row: Dict) -> Dict[str, Any]:
+    """Keep only the snapshot fields of a /coins/markets row, with 0 for missing numbers"""
+    snapshot = {}
+    for field, source in SNAPSHOT_FIELDS.items():
+        value = row.get(source)
+        if value is None and field == "price_change_24h":
+            value = row.get("price_change_percentage_24h")
+        if value is None and field not in ("name", "market_cap_rank"):
+            value = 0
+        snapshot[field] = value
+    snapshot["id"] = row.get("id")
+    snapshot["symbol"] = row.get("symbol", "").upper()
+    return snapshot
+
+
+def fetch_market_snapshots(
+    symbols: List[str], vs_currency: str = "usd"
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get compact market snapshots for many cryptocurrencies at once
+
+    Uses /coins/markets with up to 250 ids per request instead of one heavy
+    /coins/{id} document per coin.
+
+    Args:
+        symbols: Crypto symbols (e.g., ['BTC', 'ETH', 'ADA'])
+        vs_currency: Quote currency for prices and volumes
+
+    Returns:
+        Dict mapping each upper-cased symbol that could be resolved to its snapshot
+    """
+    api = get_coingecko_client()
+    symbol_ids = {}
+    for symbol in symbols:
+        coin_id = api.get_coin_id(symbol)
+        if coin_id:
+            symbol_ids[symbol.upper()] = coin_id
+
+    unique_ids = list(dict.fromkeys(symbol_ids.values()))
+    rows = {}
+    for i in range(0, len(unique_ids), MARKETS_PAGE_SIZE):
+        batch = unique_ids[i:i + MARKETS_PAGE_SIZE]
+        params = {
+            "vs_currency": vs_currency,
+            "ids": ",".join(batch),
+            "per_page": MARKETS_PAGE_SIZE,
+            "price_change_percentage": "24h,7d,30d",
+        }
+        for row in api._make_request("/coins/markets", params) or []:
+            rows[row.get("id")] = _parse_market_snapshot(row)
+
+    return {
+        symbol: rows[coin_id] for symbol, coin_id in symbol_ids.items() if coin_id in rows
+    }
+
+
 def get_crypto_market_data(
     symbol: Annotated[str, "Cryptocurrency symbol like BTC, ETH"],
 ) -> str:
@@ -196,32 +402,68 @@ def get_crypto_market_data(
     Returns:
         String representation of market data
     """
-    api = CoinGeckoAPI()
-    coin_id = api.get_coin_id(symbol)
-    
-    if not coin_id:
+    api = get_coingecko_client()
+    if not api.get_coin_id(symbol):
         return f"Error: Could not find coin ID for symbol {symbol}"
     
-    data = api._make_request(f"/coins/{coin_id}")
+    snapshot = fetch_market_snapshots([symbol]).get(symbol.upper())
     
-    if not data:
+    return _format_market_data(symbol, snapshot)
+
+
+def _format_market_data(symbol: str, snapshot: Optional[Dict[str, Any]]) -> str:
+    """Render a market snapshot as the current market data report"""
+    if not snapshot:
         return f"No market data available for {symbol}"
     
-    market_data = data.get("market_data", {})
-    
     result_str = f"## {symbol.upper()} Current Market Data:\n\n"
-    result_str += f"**Name:** {data.get('name', 'N/A')}\n"
-    result_str += f"**Current Price:** ${market_data.get('current_price', {}).get('usd', 0):,.2f}\n"
-    result_str += f"**Market Cap:** ${market_data.get('market_cap', {}).get('usd', 0):,.0f}\n"
-    result_str += f"**24h Volume:** ${market_data.get('total_volume', {}).get('usd', 0):,.0f}\n"
-    result_str += f"**24h Change:** {market_data.get('price_change_percentage_24h', 0):.2f}%\n"
-    result_str += f"**7d Change:** {market_data.get('price_change_percentage_7d', 0):.2f}%\n"
-    result_str += f"**30d Change:** {market_data.get('price_change_percentage_30d', 0):.2f}%\n"
-    result_str += f"**Market Cap Rank:** #{market_data.get('market_cap_rank', 'N/A')}\n"
-    result_str += f"**Circulating Supply:** {market_data.get('circulating_supply', 0):,.0f}\n"
-    result_str += f"**Total Supply:** {market_data.get('total_supply', 0):,.0f}\n"
-    result_str += f"**All Time High:** ${market_data.get('ath', {}).get('usd', 0):,.2f}\n"
-    result_str += f"**All Time Low:** ${market_data.get('atl', {}).get('usd', 0):,.2f}\n"
+    result_str += f"**Name:** {snapshot['name'] or 'N/A'}\n"
+    result_str += f"**Current Price:** ${snapshot['current_price']:,.2f}\n"
+    result_str += f"**Market Cap:** ${snapshot['market_cap']:,.0f}\n"
+    result_str += f"**24h Volume:** ${snapshot['total_volume']:,.0f}\n"
+    result_str += f"**24h Change:** {snapshot['price_change_24h']:.2f}%\n"
+    result_str += f"**7d Change:** {snapshot['price_change_7d']:.2f}%\n"
+    result_str += f"**30d Change:** {snapshot['price_change_30d']:.2f}%\n"
+    result_str += f"**Market Cap Rank:** #{snapshot['market_cap_rank'] or 'N/A'}\n"
+    result_str += f"**Circulating Supply:** {snapshot['circulating_supply']:,.0f}\n"
+    result_str += f"**Total Supply:** {snapshot['total_supply']:,.0f}\n"
+    result_str += f"**All Time High:** ${snapshot['ath']:,.2f}\n"
+    result_str += f"**All Time Low:** ${snapshot['atl']:,.2f}\n"
+    
+    return result_str
+
+
+def get_crypto_market_snapshots(
+    symbols: Annotated[List[str], "Cryptocurrency symbols like BTC, ETH"],
+) -> str:
+    """
+    Get a compact market overview table for several cryptocurrencies
+    
+    Args:
+        symbols: Crypto symbols (e.g., ['BTC', 'ETH', 'ADA'])
+    
+    Returns:
+        Markdown table with one row per cryptocurrency
+    """
+    snapshots = fetch_market_snapshots(symbols)
+    
+    if not snapshots:
+        return f"No market data available for {', '.join(s.upper() for s in symbols)}"
+    
+    result_str = "## Crypto Market Snapshot:\n\n"
+    result_str += "| Symbol | Name | Price | 24h | 7d | 30d | Market Cap | 24h Volume | Rank |\n"
+    result_str += "|---|---|---|---|---|---|---|---|---|\n"
+    for symbol, snap in snapshots.items():
+        result_str += (
+            f"| {symbol} | {snap['name'] or 'N/A'} | ${snap['current_price']:,.2f} "
+            f"| {snap['price_change_24h']:+.2f}% | {snap['price_change_7d']:+.2f}% "
+            f"| {snap['price_change_30d']:+.2f}% | ${snap['market_cap']:,.0f} "
+            f"| ${snap['total_volume']:,.0f} | #{snap['market_cap_rank'] or 'N/A'} |\n"
+        )
+    
+    missing = [s.upper() for s in symbols if s.upper() not in snapshots]
+    if missing:
+        result_str += f"\nNo market data available for: {', '.join(missing)}\n"
     
     return result_str
 
@@ -243,11 +485,19 @@ def get_crypto_news(
         String representation of news data
     """
     # Using CoinGecko's news endpoint or general crypto news
-    api = CoinGeckoAPI()
+    api = get_coingecko_client()
     
     # Get trending coins and news (CoinGecko doesn't have coin-specific news in free tier)
     trending_data = api._make_request("/search/trending")
     
+    # Get general market data as news context
+    global_data = api._make_request("/global")
+    
+    return _format_crypto_news(look_back_days, trending_data, global_data)
+
+
+def _format_crypto_news(look_back_days: int, trending_data: Dict, global_data: Dict) -> str:
+    """Render /search/trending and /global payloads as the news report"""
     result_str = f"## Crypto Market News and Trends (Past {look_back_days} days):\n\n"
     
     if trending_data and "coins" in trending_data:
@@ -257,8 +507,6 @@ def get_crypto_news(
             result_str += f"- {item.get('name', 'N/A')} ({item.get('symbol', 'N/A')}): Rank #{item.get('market_cap_rank', 'N/A')}\n"
         result_str += "\n"
     
-    # Get general market data as news context
-    global_data = api._make_request("/global")
     if global_data and "data" in global_data:
         data = global_data["data"]
         result_str += "**Global Market Overview:**\n"
@@ -286,26 +534,29 @@ def get_crypto_technical_indicators(
     Returns:
         String representation of technical analysis
     """
-    api = CoinGeckoAPI()
+    api = get_coingecko_client()
     coin_id = api.get_coin_id(symbol)
     
     if not coin_id:
         return f"Error: Could not find coin ID for symbol {symbol}"
     
-    # Get historical data
-    params = {
-        "vs_currency": "usd",
-        "days": look_back_days,
-        "interval": "daily"
-    }
+    # Get daily historical data up to the end of curr_date
+    end_timestamp = _end_of_day_timestamp(curr_date)
+    start_timestamp = end_timestamp - look_back_days * 86400
+    series = _get_price_series(
+        api, coin_id, start_timestamp, end_timestamp, granularity="daily"
+    )
     
-    data = api._make_request(f"/coins/{coin_id}/market_chart", params)
-    
-    if not data or "prices" not in data:
+    return _format_technical_indicators(symbol, look_back_days, series)
+
+
+def _format_technical_indicators(symbol: str, look_back_days: int, series: Dict[str, List]) -> str:
+    """Render daily price columns as the basic technical analysis report"""
+    if not series["prices"]:
         return f"No technical data available for {symbol}"
     
-    prices = [price[1] for price in data["prices"]]
-    volumes = [vol[1] for vol in data.get("total_volumes", [])]
+    prices = series["prices"]
+    volumes = series["volumes"]
     
     # Basic technical analysis
     current_price = prices[-1] if prices else 0
@@ -345,4 +596,68 @@ def get_crypto_technical_indicators(
     result_str += f"- Distance from 30d High: {((current_price - high_30d) / high_30d * 100):+.1f}%\n"
     result_str += f"- Distance from 30d Low: {((current_price - low_30d) / low_30d * 100):+.1f}%\n"
     
-    return result_str 
\ No newline at end of file
+    return result_str 
+
+
+def get_crypto_indicators(
+    symbol: Annotated[str, "Cryptocurrency symbol like BTC, ETH"],
+    curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "How many days to report"] = 30,
+    indicators: Optional[List[str]] = None,
+) -> str:
+    """
+    Get RSI, MACD, Bollinger bands, ATR and moving averages for a cryptocurrency
+
+    Args:
+        symbol: Crypto symbol
+        curr_date: Current date in yyyy-mm-dd format
+        look_back_days: Number of daily rows to report
+        indicators: Indicator names (stockstats style, e.g. close_50_sma, rsi);
+            defaults to the crypto_indicators config or DEFAULT_INDICATORS
+
+    Returns:
+        Markdown table of daily closes and indicator values
+    """
+    indicators = indicators or get_config().get("crypto_indicators") or DEFAULT_INDICATORS
+    try:
+        warmup = warmup_periods(indicators)
+    except ValueError as e:
+        return f"Error: {e}"
+
+    api = get_coingecko_client()
+    coin_id = api.get_coin_id(symbol)
+    if not coin_id:
+        return f"Error: Could not find coin ID for symbol {symbol}"
+
+    # Fetch enough history before the window for every indicator to settle
+    end_timestamp = _end_of_day_timestamp(curr_date)
+    start_timestamp = end_timestamp - (look_back_days + warmup) * 86400
+    series = _get_price_series(
+        api, coin_id, start_timestamp, end_timestamp, granularity="daily"
+    )
+    if not series["prices"]:
+        return f"No technical data available for {symbol}"
+
+    closes = np.asarray(series["prices"], dtype=float)
+    values = compute_indicators(closes, np.asarray(series["volumes"], dtype=float), indicators)
+    dates = (
+        np.asarray(series["timestamps"], dtype="datetime64[ms]").astype("datetime64[D]").astype(str)
+    )
+    rows = slice(max(0, len(closes) - look_back_days), len(closes))
+
+    def fmt(value: float) -> str:
+        return "N/A" if np.isnan(value) else f"{value:.6g}"
+
+    result_str = f"## {symbol.upper()} Technical Indicators (daily, past {look_back_days} days to {curr_date}):\n\n"
+    result_str += "| Date | Close | " + " | ".join(indicators) + " |\n"
+    result_str += "|" + "---|" * (len(indicators) + 2) + "\n"
+    for i in range(rows.start, rows.stop):
+        cells = [dates[i], fmt(closes[i])] + [fmt(values[name][i]) for name in indicators]
+        result_str += "| " + " | ".join(cells) + " |\n"
+
+    result_str += "\n**Indicators:**\n"
+    for name in indicators:
+        result_str += f"- {name}: {describe_indicator(name)}\n"
+    if len(closes) < warmup:
+        result_str += f"\nNote: only {len(closes)} days of history available; long-window indicators may be N/A or unsettled.\n"
+    return result_str
@@ -0,0 +1,247 @@
+import re
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Indicators computed when no explicit set is requested. Names follow the
+# stockstats conventions used by the stock market tools.
+DEFAULT_INDICATORS = [
+    "close_10_ema",
+    "close_50_sma",
+    "close_200_sma",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+]
+
+INDICATOR_DESCRIPTIONS = {
+    "sma": "Simple moving average of the close over {n} days",
+    "ema": "Exponential moving average of the close over {n} days",
+    "macd": "MACD: 12-day EMA minus 26-day EMA",
+    "macds": "MACD signal: 9-day EMA of the MACD line",
+    "macdh": "MACD histogram: MACD minus its signal line",
+    "rsi": "Relative Strength Index over {n} days (Wilder smoothing)",
+    "boll": "Bollinger middle band: {n}-day SMA",
+    "boll_ub": "Bollinger upper band: middle band + 2 standard deviations",
+    "boll_lb": "Bollinger lower band: middle band - 2 standard deviations",
+    "atr": "Average true range over {n} days, from close-to-close moves",
+    "vwma": "Volume-weighted moving average over {n} days",
+}
+
+# Relative weight below which EMA kernel taps are dropped
+_EMA_TOLERANCE = 1e-12
+
+_INDICATOR_RE = re.compile(
+    r"^(?:close_(?P<n1>\d+)_(?P<ma>sma|ema)"
+    r"|(?P<name>macds|macdh|macd|rsi|boll_ub|boll_lb|boll|atr|vwma)(?:_(?P<n2>\d+))?)$"
+)
+
+_DEFAULT_PERIODS = {
+    "macd": 26,
+    "macds": 26,
+    "macdh": 26,
+    "rsi": 14,
+    "boll": 20,
+    "boll_ub": 20,
+    "boll_lb": 20,
+    "atr": 14,
+    "vwma": 20,
+}
+
+
+def parse_indicator(name: str):
+    """Split an indicator name into (kind, period), e.g. close_50_sma -> (sma, 50)."""
+    match = _INDICATOR_RE.match(name.strip().lower())
+    if not match:
+        raise ValueError(
+            f"Indicator {name} is not supported. Use close_<n>_sma, close_<n>_ema "
+            f"or one of {sorted(_DEFAULT_PERIODS)} (optionally suffixed with _<n>)."
+        )
+    if match.group("ma"):
+        return match.group("ma"), int(match.group("n1"))
+    kind = match.group("name")
+    period = match.group("n2")
+    return kind, int(period) if period else _DEFAULT_PERIODS[kind]
+
+
+def describe_indicator(name: str) -> str:
+    kind, period = parse_indicator(name)
+    return INDICATOR_DESCRIPTIONS[kind].format(n=period)
+
+
+def warmup_periods(indicators: Iterable[str]) -> int:
+    """Bars of history needed before the first reported value of ``indicators``.
+
+    Moving averages need a full window; exponentially smoothed indicators get
+    a few time constants so their start-up bias has decayed.
+    """
+    warmup = 0
+    for name in indicators:
+        kind, period = parse_indicator(name)
+        if kind in ("ema", "macd", "macds", "macdh", "rsi", "atr"):
+            period *= 4
+        warmup = max(warmup, period)
+    return warmup
+
+
+def forward_fill(values: np.ndarray) -> np.ndarray:
+    """Replace NaNs by the last valid value before them; leading NaNs stay."""
+    valid = ~np.isnan(values)
+    last_valid = np.maximum.accumulate(np.where(valid, np.arange(len(values)), 0))
+    filled = values[last_valid]
+    filled[: int(valid.argmax()) if valid.any() else len(values)] = np.nan
+    return filled
+
+
+def sma(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean; the first ``window - 1`` entries are NaN."""
+    out = np.full(len(values), np.nan)
+    if window <= len(values):
+        csum = np.cumsum(np.insert(values, 0, 0.0))
+        out[window - 1:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+
+def ewma(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponentially weighted mean matching pandas ``ewm(alpha, adjust=True)``.
+
+    The recursion is expressed as a convolution with the geometric weight
+    kernel, truncated once weights fall below 1e-12 of the newest one, and
+    normalised by the sum of the weights in use so early values match pandas.
+    """
+    n = len(values)
+    if n == 0:
+        return np.empty(0)
+    decay = 1.0 - alpha
+    if decay <= 0:
+        return values.astype(float)
+    length = min(n, int(np.ceil(np.log(_EMA_TOLERANCE) / np.log(decay))) + 1)
+    kernel = decay ** np.arange(length)
+    numerator = np.convolve(values, kernel)[:n]
+    # Sum of the kernel taps that overlap the series so far
+    taps = np.minimum(np.arange(1, n + 1), length)
+    denominator = (1.0 - decay ** taps) / alpha
+    return numerator / denominator
+
+
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    return ewma(values, 2.0 / (span + 1))
+
+
+def smma(values: np.ndarray, window: int) -> np.ndarray:
+    """Wilder's smoothed moving average, as used by RSI and ATR."""
+    return ewma(values, 1.0 / window)
+
+
+def rsi(closes: np.ndarray, window: int = 14) -> np.ndarray:
+    diff = np.diff(closes, prepend=closes[:1])
+    gains = smma(np.clip(diff, 0, None), window)
+    losses = smma(np.clip(-diff, 0, None), window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = 100.0 - 100.0 / (1.0 + gains / losses)
+    # No losses in the window means maximum strength
+    out[(losses == 0) & (gains > 0)] = 100.0
+    out[(losses == 0) & (gains == 0)] = 50.0
+    return out
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    out = np.full(len(values), np.nan)
+    if window <= len(values) and window > 1:
+        out[window - 1:] = sliding_window_view(values, window).std(axis=1, ddof=1)
+    return out
+
+
+def vwma(closes: np.ndarray, volumes: np.ndarray, window: int) -> np.ndarray:
+    weighted = sma(closes * volumes, window)
+    total = sma(volumes, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(total > 0, weighted / total, np.nan)
+
+
+def compute_indicators(
+    closes: np.ndarray,
+    volumes: Optional[np.ndarray] = None,
+    indicators: Optional[List[str]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Compute a set of indicators over a close (and volume) series
+
+    Args:
+        closes: Closing prices, oldest first
+        volumes: Traded volume aligned with ``closes``; needed for vwma
+        indicators: Indicator names, defaults to DEFAULT_INDICATORS
+
+    Returns:
+        Indicator name -> array aligned with ``closes`` (NaN where undefined).
+        Shared intermediates such as the MACD EMAs are computed once.
+
+    Missing closes are forward-filled (a single NaN would otherwise spread
+    through every later EMA value) and missing volumes count as zero. Bars
+    before the first known close are left out and reported as NaN.
+    """
+    closes = forward_fill(np.asarray(closes, dtype=float))
+    volumes = np.zeros_like(closes) if volumes is None else np.asarray(volumes, dtype=float)
+    volumes = np.nan_to_num(volumes, nan=0.0)
+    known = ~np.isnan(closes)
+    start = int(known.argmax()) if known.any() else len(closes)
+    closes, volumes = closes[start:], volumes[start:]
+    cache: Dict[tuple, np.ndarray] = {}
+
+    def cached(key, compute):
+        if key not in cache:
+            cache[key] = compute()
+        return cache[key]
+
+    def close_sma(period):
+        return cached(("sma", period), lambda: sma(closes, period))
+
+    def close_ema(period):
+        return cached(("ema", period), lambda: ema(closes, period))
+
+    def macd_line():
+        return cached(("macd",), lambda: close_ema(12) - close_ema(26))
+
+    def macd_signal():
+        return cached(("macds",), lambda: ema(macd_line(), 9))
+
+    def boll_width(period):
+        return cached(("bollw", period), lambda: 2.0 * rolling_std(closes, period))
+
+    results: Dict[str, np.ndarray] = {}
+    for name in indicators or DEFAULT_INDICATORS:
+        kind, period = parse_indicator(name)
+        if kind == "sma":
+            value = close_sma(period)
+        elif kind == "ema":
+            value = close_ema(period)
+        elif kind == "macd":
+            value = macd_line()
+        elif kind == "macds":
+            value = macd_signal()
+        elif kind == "macdh":
+            value = macd_line() - macd_signal()
+        elif kind == "rsi":
+            value = rsi(closes, period)
+        elif kind == "boll":
+            value = close_sma(period)
+        elif kind == "boll_ub":
+            value = close_sma(period) + boll_width(period)
+        elif kind == "boll_lb":
+            value = close_sma(period) - boll_width(period)
+        elif kind == "atr":
+            # CoinGecko only provides closes, so the true range is the
+            # absolute close-to-close move
+            true_range = np.abs(np.diff(closes, prepend=closes[:1]))
+            value = smma(true_range, period)
+        else:
+            value = vwma(closes, volumes, period)
+        results[name] = np.concatenate([np.full(start, np.nan), value])
+    return results
@@ -0,0 +1,293 @@
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import get_config
+
+
+# Seconds per bucket for each granularity CoinGecko can return from
+# /market_chart/range. The API picks the granularity from the requested span:
+# up to 90 days is hourly, anything longer is daily (00:00 UTC).
+GRANULARITY_SECONDS = {
+    "hourly": 3600,
+    "daily": 86400,
+}
+
+# Spans used when fetching missing ranges so CoinGecko answers with the
+# granularity we are storing.
+_HOURLY_MIN_SPAN = 86400 + 3600
+_HOURLY_MAX_SPAN = 90 * 86400
+_DAILY_MIN_SPAN = 91 * 86400
+
+_COLUMNS = ("timestamps", "prices", "volumes", "market_caps")
+
+
+def granularity_for_span(start_ts: int, end_ts: int) -> str:
+    """Return the granularity CoinGecko would use for a range request."""
+    if end_ts - start_ts <= _HOURLY_MAX_SPAN:
+        return "hourly"
+    return "daily"
+
+
+def fetch_windows(granularity: str, start_ts: int, end_ts: int) -> List[Tuple[int, int]]:
+    """Widen or split a range so each request returns the given granularity."""
+    if granularity == "daily":
+        return [(min(start_ts, end_ts - _DAILY_MIN_SPAN), end_ts)]
+
+    windows = []
+    while end_ts > start_ts:
+        window_start = max(start_ts, end_ts - _HOURLY_MAX_SPAN)
+        windows.append((min(window_start, end_ts - _HOURLY_MIN_SPAN), end_ts))
+        end_ts = window_start
+    return windows
+
+
+def _empty_columns() -> Dict[str, np.ndarray]:
+    return {
+        "timestamps": np.empty(0, dtype=np.int64),
+        "prices": np.empty(0, dtype=np.float64),
+        "volumes": np.empty(0, dtype=np.float64),
+        "market_caps": np.empty(0, dtype=np.float64),
+    }
+
+
+def _merge_payload(
+    series: Dict[str, np.ndarray], payload: Dict, granularity: str
+) -> Dict[str, np.ndarray]:
+    """Merge a /market_chart/range payload into price columns.
+
+    Keeps one point per bucket; the payload's observation wins over the
+    stored one.
+    """
+    prices = payload.get("prices") or []
+    bucket = GRANULARITY_SECONDS[granularity]
+    volumes = dict((int(ts), v) for ts, v in payload.get("total_volumes") or [])
+    market_caps = dict((int(ts), v) for ts, v in payload.get("market_caps") or [])
+
+    new_ts = np.array([int(ts) for ts, _ in prices], dtype=np.int64)
+    new_cols = {
+        "timestamps": new_ts,
+        "prices": np.array([p if p is not None else np.nan for _, p in prices], dtype=np.float64),
+        "volumes": np.array([volumes.get(int(ts)) or 0.0 for ts, _ in prices], dtype=np.float64),
+        "market_caps": np.array([market_caps.get(int(ts)) or 0.0 for ts, _ in prices], dtype=np.float64),
+    }
+
+    combined = {
+        name: np.concatenate([series[name], new_cols[name]]) for name in _COLUMNS
+    }
+    buckets = combined["timestamps"] // (bucket * 1000)
+    order = np.lexsort((np.arange(len(buckets)), buckets))
+    buckets = buckets[order]
+    keep = np.ones(len(order), dtype=bool)
+    keep[:-1] = buckets[1:] != buckets[:-1]
+    selected = order[keep]
+    return {name: combined[name][selected] for name in _COLUMNS}
+
+
+def _slice_columns(
+    series: Dict[str, np.ndarray], start_ts: int, end_ts: int
+) -> Dict[str, np.ndarray]:
+    timestamps = series["timestamps"]
+    lo = np.searchsorted(timestamps, start_ts * 1000, side="left")
+    hi = np.searchsorted(timestamps, end_ts * 1000, side="right")
+    return {name: series[name][lo:hi] for name in _COLUMNS}
+
+
+def merge_payloads(
+    payloads: List[Dict], granularity: str, start_ts: int, end_ts: int
+) -> Dict[str, np.ndarray]:
+    """Price columns inside [start_ts, end_ts] from /market_chart/range
+    payloads, without touching the store."""
+    series = _empty_columns()
+    for payload in payloads:
+        if payload:
+            series = _merge_payload(series, payload, granularity)
+    return _slice_columns(series, start_ts, end_ts)
+
+
+def fetch_range(
+    start_ts: int,
+    end_ts: int,
+    fetch: Callable[[int, int], Dict],
+    granularity: Optional[str] = None,
+) -> Dict[str, np.ndarray]:
+    """Answer a window query straight from the API, bypassing the store.
+
+    Requests the same windows an empty store would, so the requests depend
+    only on the arguments. That is what record/replay needs: a store's gaps
+    depend on what it fetched before and on the current time.
+    """
+    granularity = granularity or granularity_for_span(start_ts, end_ts)
+    payloads = [fetch(f, t) for f, t in fetch_windows(granularity, start_ts, end_ts)]
+    return merge_payloads(payloads, granularity, start_ts, end_ts)
+
+
+def _merge_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class CryptoPriceStore:
+    """On-disk columnar store of CoinGecko price series.
+
+    Each (coin id, granularity) pair is kept as one ``.npz`` file holding the
+    timestamp, price, volume and market cap columns plus the time ranges that
+    have already been fetched. Window queries are answered from local data and
+    only the ranges not covered yet are requested from the API.
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        self._lock = threading.RLock()
+        self._series: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
+        self._mtimes: Dict[Tuple[str, str], float] = {}
+
+    def _path(self, coin_id: str, granularity: str) -> str:
+        return os.path.join(self.root_dir, coin_id, f"{granularity}.npz")
+
+    def _empty(self) -> Dict[str, np.ndarray]:
+        return dict(_empty_columns(), coverage=np.empty((0, 2), dtype=np.int64))
+
+    def _load(self, coin_id: str, granularity: str) -> Dict[str, np.ndarray]:
+        key = (coin_id, granularity)
+        path = self._path(coin_id, granularity)
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return self._series.setdefault(key, self._empty())
+
+        if key in self._series and self._mtimes.get(key) == mtime:
+            return self._series[key]
+
+        try:
+            with np.load(path) as data:
+                series = {name: data[name] for name in _COLUMNS + ("coverage",)}
+        except Exception as e:
+            print(f"Error reading price store {path}: {e}")
+            series = self._empty()
+
+        self._series[key] = series
+        self._mtimes[key] = mtime
+        return series
+
+    def _save(self, coin_id: str, granularity: str, series: Dict[str, np.ndarray]):
+        path = self._path(coin_id, granularity)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **series)
+        os.replace(tmp_path, path)
+
+        key = (coin_id, granularity)
+        self._series[key] = series
+        self._mtimes[key] = os.path.getmtime(path)
+
+    def missing_ranges(
+        self, coin_id: str, granularity: str, start_ts: int, end_ts: int
+    ) -> List[Tuple[int, int]]:
+        """Return the (from, to) windows, in seconds, that must be fetched to
+        answer a query for [start_ts, end_ts]."""
+        with self._lock:
+            coverage = self._load(coin_id, granularity)["coverage"]
+
+        gaps = []
+        cursor = start_ts
+        for cov_start, cov_end in coverage.tolist():
+            if cov_end < cursor:
+                continue
+            if cov_start > end_ts:
+                break
+            if cov_start > cursor:
+                gaps.append((cursor, cov_start))
+            cursor = max(cursor, cov_end)
+        if cursor < end_ts:
+            gaps.append((cursor, end_ts))
+
+        return [w for gap in gaps for w in fetch_windows(granularity, *gap)]
+
+    def ingest(
+        self,
+        coin_id: str,
+        granularity: str,
+        payload: Dict,
+        from_ts: int,
+        to_ts: int,
+    ):
+        """Merge a /market_chart/range payload fetched for [from_ts, to_ts]."""
+        bucket = GRANULARITY_SECONDS[granularity]
+
+        # Only completed buckets are final; the current one keeps moving.
+        covered_to = min(to_ts, int(time.time()) - bucket)
+
+        with self._lock:
+            series = self._load(coin_id, granularity)
+            # One point per bucket, the most recently fetched observation wins.
+            updated = _merge_payload(series, payload, granularity)
+
+            coverage = [tuple(c) for c in series["coverage"].tolist()]
+            if covered_to > from_ts:
+                coverage.append((from_ts, covered_to))
+            updated["coverage"] = np.array(
+                _merge_intervals(coverage), dtype=np.int64
+            ).reshape(-1, 2)
+
+            self._save(coin_id, granularity, updated)
+
+    def read(
+        self, coin_id: str, granularity: str, start_ts: int, end_ts: int
+    ) -> Dict[str, np.ndarray]:
+        """Return the stored columns with timestamps inside [start_ts, end_ts]."""
+        with self._lock:
+            series = self._load(coin_id, granularity)
+        return _slice_columns(series, start_ts, end_ts)
+
+    def get_range(
+        self,
+        coin_id: str,
+        start_ts: int,
+        end_ts: int,
+        fetch: Callable[[int, int], Dict],
+        granularity: Optional[str] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Answer a window query, fetching only the ranges not stored yet.
+
+        Args:
+            coin_id: CoinGecko coin id
+            start_ts: Window start as a unix timestamp in seconds
+            end_ts: Window end as a unix timestamp in seconds
+            fetch: Callable taking (from_ts, to_ts) and returning the raw
+                /market_chart/range payload
+            granularity: "hourly" or "daily"; defaults to what CoinGecko would
+                return for the window
+        """
+        granularity = granularity or granularity_for_span(start_ts, end_ts)
+        for from_ts, to_ts in self.missing_ranges(coin_id, granularity, start_ts, end_ts):
+            payload = fetch(from_ts, to_ts)
+            if payload:
+                self.ingest(coin_id, granularity, payload, from_ts, to_ts)
+        return self.read(coin_id, granularity, start_ts, end_ts)
+
+
+_stores: Dict[str, CryptoPriceStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_price_store(root_dir: Optional[str] = None) -> CryptoPriceStore:
+    """Return the process-wide price store for ``root_dir``.
+
+    Defaults to ``crypto_prices`` under the configured data cache directory.
+    """
+    if root_dir is None:
+        root_dir = os.path.join(get_config()["data_cache_dir"], "crypto_prices")
+    with _stores_lock:
+        if root_dir not in _stores:
+            _stores[root_dir] = CryptoPriceStore(root_dir)
+        return _stores[root_dir]
@@ -0,0 +1,86 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Optional
+
+# Returned by DiskCache.get when a key is absent, since None is a valid value
+MISSING = object()
+
+
+class DiskCache:
+    """Small persistent key/value store kept in a single SQLite file.
+
+    Values are pickled and zlib-compressed. The cache may be shared by the
+    threads of one process and, through SQLite's own locking, by several
+    processes pointing at the same file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str, default: Any = MISSING, max_age: Optional[float] = None) -> Any:
+        """Return the value stored under ``key``, or ``default`` if absent or
+        older than ``max_age`` seconds."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return default
+        value, created_at = row
+        if max_age is not None and time.time() - created_at > max_age:
+            return default
+        return pickle.loads(zlib.decompress(value))
+
+    def set(self, key: str, value: Any):
+        blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, created_at) VALUES (?, ?, ?)",
+                (key, blob, time.time()),
+            )
+            self._conn.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def evict(self, max_age: Optional[float] = None, max_bytes: Optional[int] = None) -> int:
+        """Delete entries older than ``max_age`` seconds, then the oldest ones
+        until the stored values fit in ``max_bytes``. Returns the number removed."""
+        removed = 0
+        with self._lock:
+            if max_age is not None:
+                removed += self._conn.execute(
+                    "DELETE FROM entries WHERE created_at < ?", (time.time() - max_age,)
+                ).rowcount
+            if max_bytes is not None:
+                removed += self._conn.execute(
+                    "DELETE FROM entries WHERE key IN ("
+                    "SELECT key FROM (SELECT key, SUM(LENGTH(value)) OVER "
+                    "(ORDER BY created_at DESC, key) AS kept FROM entries) WHERE kept > ?)",
+                    (max_bytes,),
+                ).rowcount
+            self._conn.commit()
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
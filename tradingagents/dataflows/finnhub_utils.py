@@ -1,5 +1,51 @@
 import json
 import os
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Tuple
+
+
+class FinnhubFile:
+    """A parsed ``*_data_formatted.json`` file with its date keys kept sorted."""
+
+    def __init__(self, signature: Tuple[int, int], data: Dict[str, list]):
+        self.signature = signature
+        self.data = data
+        positions = {key: position for position, key in enumerate(data)}
+        self.keys: List[str] = sorted(data)
+        # file position of each sorted key, so ranges come back in file order
+        self.positions: List[int] = [positions[key] for key in self.keys]
+
+    def range(self, start_date: str, end_date: str) -> Dict[str, list]:
+        lo = bisect_left(self.keys, start_date)
+        hi = bisect_right(self.keys, end_date)
+        in_range = sorted(range(lo, hi), key=self.positions.__getitem__)
+        filtered_data = {}
+        for index in in_range:
+            key = self.keys[index]
+            if len(self.data[key]) > 0:
+                filtered_data[key] = self.data[key]
+        return filtered_data
+
+
+_loaded_files: Dict[str, FinnhubFile] = {}
+_loaded_files_lock = threading.Lock()
+
+
+def load_finnhub_file(data_path: str) -> FinnhubFile:
+    """Parse a finnhub data file, reusing the parsed copy until the file changes."""
+    stat = os.stat(data_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _loaded_files_lock:
+        loaded = _loaded_files.get(data_path)
+    if loaded is not None and loaded.signature == signature:
+        return loaded
+
+    with open(data_path, "r") as f:
+        loaded = FinnhubFile(signature, json.load(f))
+    with _loaded_files_lock:
+        _loaded_files[data_path] = loaded
+    return loaded
 
 
 def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
@@ -11,6 +57,9 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
         data_type (str): Type of data from finnhub to fetch. Can be insider_trans, SEC_filings, news_data, insider_senti, or fin_as_reported.
         data_dir (str): Directory where the data is saved.
         period (str): Default to none, if there is a period specified, should be annual or quarterly.
+
+    The returned lists are shared with the in-memory copy of the file and
+    must not be modified.
     """
 
     if period:
@@ -25,12 +74,5 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
             data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
         )
 
-    data = open(data_path, "r")
-    data = json.load(data)
-
     # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
-    filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
-    return filtered_data
+    return load_finnhub_file(data_path).range(start_date, end_date)
@@ -1,16 +1,23 @@
 import json
+import os
+import threading
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import time
-import random
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    retry_if_result,
-)
+from typing import Dict, List, Optional
+
+from .cassette import cassette_call, get_data_mode
+from .config import get_config
+from .disk_cache import MISSING, DiskCache
+from .rate_limiter import AdaptiveDelay, CircuitBreaker, parse_retry_after
+
+# Attempts per page before giving up on it
+MAX_ATTEMPTS = 4
+
+
+class GoogleNewsBlocked(RuntimeError):
+    """Raised while Google keeps answering with 429s or captcha pages."""
 
 
 def is_rate_limited(response):
@@ -18,17 +25,97 @@ def is_rate_limited(response):
     return response.status_code == 429
 
 
-@retry(
-    retry=(retry_if_result(is_rate_limited)),
-    wait=wait_exponential(multiplier=1, min=4, max=60),
-    stop=stop_after_attempt(5),
-)
+def is_captcha(response):
+    """Check if Google answered with its "unusual traffic" captcha page"""
+    return (
+        "/sorry/" in response.url
+        or b'id="captcha-form"' in response.content
+        or b"unusual traffic from your computer network" in response.content
+    )
+
+
+_politeness: Optional[AdaptiveDelay] = None
+_breaker: Optional[CircuitBreaker] = None
+_result_caches: Dict[str, DiskCache] = {}
+_state_lock = threading.Lock()
+
+
+def get_politeness():
+    """Return the delay and circuit breaker shared by all Google News requests."""
+    global _politeness, _breaker
+    with _state_lock:
+        if _politeness is None:
+            config = get_config()
+            _politeness = AdaptiveDelay(config.get("google_news_delay", 2.0))
+            _breaker = CircuitBreaker(
+                cooldown=config.get("google_news_breaker_cooldown", 300)
+            )
+        return _politeness, _breaker
+
+
+def get_result_cache() -> DiskCache:
+    path = os.path.join(get_config()["data_cache_dir"], "google_news.sqlite")
+    with _state_lock:
+        if path not in _result_caches:
+            _result_caches[path] = DiskCache(path)
+        return _result_caches[path]
+
+
 def make_request(url, headers):
-    """Make a request with retry logic for rate limiting"""
-    # Random delay before each request to avoid detection
-    time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
-    return response
+    """Make a request, spaced out and backed off together with concurrent ones"""
+    delay, breaker = get_politeness()
+    for attempt in range(MAX_ATTEMPTS):
+        if not breaker.allow():
+            raise GoogleNewsBlocked(
+                "Google News is refusing requests, not scraping until the cooldown has passed"
+            )
+        delay.wait()
+        response = requests.get(url, headers=headers, timeout=30)
+        if not is_rate_limited(response) and not is_captcha(response):
+            delay.relax()
+            breaker.record_success()
+            return response
+        delay.backoff(parse_retry_after(response.headers.get("Retry-After")))
+        breaker.record_failure()
+    raise GoogleNewsBlocked(f"Google News still rate limiting after {MAX_ATTEMPTS} attempts")
+
+
+def _fetch_page(query, start_date, end_date, page, headers):
+    offset = page * 10
+    url = (
+        f"https://www.google.com/search?q={query}"
+        f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+        f"&tbm=nws&start={offset}"
+    )
+    content = cassette_call(
+        "google_news", {"url": url}, lambda: make_request(url, headers).content
+    )
+    return BeautifulSoup(content, "html.parser")
+
+
+def _parse_results(results_on_page) -> List[dict]:
+    news_results = []
+    for el in results_on_page:
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            news_results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+    return news_results
 
 
 def getNewsData(query, start_date, end_date):
@@ -37,6 +124,10 @@ def getNewsData(query, start_date, end_date):
     query: str - search query
     start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
     end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+
+    Complete results are cached for google_news_cache_ttl_hours in live mode.
+    After the first page, pages are fetched google_news_workers at a time and
+    anything past the last page is discarded.
     """
     if "-" in start_date:
         start_date = datetime.strptime(start_date, "%Y-%m-%d")
@@ -53,56 +144,64 @@ def getNewsData(query, start_date, end_date):
         )
     }
 
+    config = get_config()
+    ttl_hours = config.get("google_news_cache_ttl_hours")
+    use_cache = bool(ttl_hours) and get_data_mode() == "live"
+    cache_key = json.dumps(["google_news", query, start_date, end_date])
+    if use_cache:
+        cached = get_result_cache().get(cache_key, max_age=ttl_hours * 3600)
+        if cached is not MISSING:
+            return cached
+
+    workers = max(1, int(config.get("google_news_workers", 3)))
     news_results = []
+    complete = True
     page = 0
-    while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
-
-        try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
-
-            if not results_on_page:
-                break  # No more results found
-
-            for el in results_on_page:
+    batch = 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            futures = [
+                pool.submit(_fetch_page, query, start_date, end_date, p, headers)
+                for p in range(page, page + batch)
+            ]
+            finished = False
+            for future in futures:
                 try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
+                    soup = future.result()
+                    results_on_page = soup.select("div.SoaBEf")
 
-            # Update the progress bar with the current count of results scraped
+                    if not results_on_page:
+                        finished = True  # No more results found
+                        break
 
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
-                break
+                    news_results.extend(_parse_results(results_on_page))
 
-            page += 1
+                    # Check for the "Next" link (pagination)
+                    if not soup.find("a", id="pnnext"):
+                        finished = True
+                        break
 
-        except Exception as e:
-            print(f"Failed after multiple retries: {e}")
-            break
+                except Exception as e:
+                    print(f"Failed after multiple retries: {e}")
+                    complete = False
+                    finished = True
+                    break
+
+            if finished:
+                for future in futures:
+                    future.cancel()
+                break
 
+            page += batch
+            batch = workers
+
+    # An empty answer may be a transient block, so it is fetched again next time
+    if use_cache and complete and news_results:
+        cache = get_result_cache()
+        cache.set(cache_key, news_results)
+        max_mb = config.get("google_news_cache_max_mb")
+        cache.evict(
+            max_age=ttl_hours * 3600,
+            max_bytes=int(max_mb * 1024 * 1024) if max_mb else None,
+        )
     return news_results
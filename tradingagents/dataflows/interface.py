@@ -1,5 +1,5 @@
-from typing import Annotated, Dict
-from .reddit_utils import fetch_top_from_category
+from typing import Annotated, Dict, List
+from .reddit_utils import fetch_top_from_category_range
 from .yfin_utils import *
 from .stockstats_utils import *
 from .googlenews_utils import *
@@ -7,16 +7,23 @@ from .finnhub_utils import get_data_in_range
 from .coingecko_utils import (
     get_crypto_price_data,
     get_crypto_market_data,
+    get_crypto_market_snapshots,
     get_crypto_news,
+    get_crypto_indicators,
     get_crypto_technical_indicators
 )
+from .coingecko_async import run_crypto_data_calls
+from .cassette import cassette_call, get_data_mode
+from .disk_cache import MISSING, DiskCache
+from .price_columns import read_price_range
+from .simfin_store import get_latest_statement
 from dateutil.relativedelta import relativedelta
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 import os
+import threading
 import pandas as pd
-from tqdm import tqdm
 import yfinance as yf
 from openai import OpenAI
 from .config import get_config, set_config, DATA_DIR
@@ -91,12 +98,13 @@ def get_finnhub_company_insider_sentiment(
         return ""
 
     result_str = ""
-    seen_dicts = []
+    seen_dicts = set()
     for date, senti_list in data.items():
         for entry in senti_list:
-            if entry not in seen_dicts:
+            entry_key = json.dumps(entry, sort_keys=True, default=str)
+            if entry_key not in seen_dicts:
                 result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
-                seen_dicts.append(entry)
+                seen_dicts.add(entry_key)
 
     return (
         f"## {ticker} Insider Sentiment Data for {before} to {curr_date}:\n"
@@ -133,12 +141,13 @@ def get_finnhub_company_insider_transactions(
 
     result_str = ""
 
-    seen_dicts = []
+    seen_dicts = set()
     for date, senti_list in data.items():
         for entry in senti_list:
-            if entry not in seen_dicts:
+            entry_key = json.dumps(entry, sort_keys=True, default=str)
+            if entry_key not in seen_dicts:
                 result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
-                seen_dicts.append(entry)
+                seen_dicts.add(entry_key)
 
     return (
         f"## {ticker} insider transactions from {before} to {curr_date}:\n"
@@ -164,26 +173,14 @@ def get_simfin_balance_sheet(
         "us",
         f"us-balance-{freq}.csv",
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    # Get the most recent balance sheet by selecting the row with the latest Publish Date
+    latest_balance_sheet = get_latest_statement(data_path, ticker, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_balance_sheet is None:
         print("No balance sheet available before the given current date.")
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
 
@@ -211,26 +208,14 @@ def get_simfin_cashflow(
         "us",
         f"us-cashflow-{freq}.csv",
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
+    latest_cash_flow = get_latest_statement(data_path, ticker, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_cash_flow is None:
         print("No cash flow statement available before the given current date.")
         return ""
 
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_cash_flow = latest_cash_flow.drop("SimFinId")
 
@@ -258,26 +243,14 @@ def get_simfin_income_statements(
         "us",
         f"us-income-{freq}.csv",
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    # Get the most recent income statement by selecting the row with the latest Publish Date
+    latest_income = get_latest_statement(data_path, ticker, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_income is None:
         print("No income statement available before the given current date.")
         return ""
 
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_income = latest_income.drop("SimFinId")
 
@@ -332,26 +305,16 @@ def get_reddit_global_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(desc=f"Getting Global News on {start_date}", total=total_iterations)
-
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "global_news",
-            curr_date_str,
-            max_limit_per_day,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-        pbar.update(1)
-
-    pbar.close()
+    # every day from before to start_date, read in one pass per subreddit
+    posts_by_date = fetch_top_from_category_range(
+        "global_news",
+        before,
+        start_date.strftime("%Y-%m-%d"),
+        max_limit_per_day,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
+    )
+    posts = [post for day_posts in posts_by_date.values() for post in day_posts]
+    curr_date = start_date + relativedelta(days=1)
 
     if len(posts) == 0:
         return ""
@@ -386,31 +349,17 @@ def get_reddit_company_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(
-        desc=f"Getting Company News for {ticker} on {start_date}",
-        total=total_iterations,
+    # every day from before to start_date, read in one pass per subreddit
+    posts_by_date = fetch_top_from_category_range(
+        "company_news",
+        before,
+        start_date.strftime("%Y-%m-%d"),
+        max_limit_per_day,
+        ticker,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
     )
-
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "company_news",
-            curr_date_str,
-            max_limit_per_day,
-            ticker,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-
-        pbar.update(1)
-
-    pbar.close()
+    posts = [post for day_posts in posts_by_date.values() for post in day_posts]
+    curr_date = start_date + relativedelta(days=1)
 
     if len(posts) == 0:
         return ""
@@ -425,6 +374,81 @@ def get_reddit_company_news(
     return f"##{ticker} News Reddit, from {before} to {curr_date}:\n\n{news_str}"
 
 
+# Supported stockstats indicators and the guidance shown alongside their values
+STOCKSTATS_INDICATOR_DESCRIPTIONS = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
+
+
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -435,129 +459,103 @@ def get_stock_stats_indicators_window(
     online: Annotated[bool, "to fetch data online or offline"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
-
-    if indicator not in best_ind_params:
+    if indicator not in STOCKSTATS_INDICATOR_DESCRIPTIONS:
         raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
+            f"Indicator {indicator} is not supported. Please choose from: {list(STOCKSTATS_INDICATOR_DESCRIPTIONS.keys())}"
         )
 
     end_date = curr_date
     curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date - relativedelta(days=look_back_days)
 
-    if not online:
-        # read from YFin data
-        data = pd.read_csv(
-            os.path.join(
-                DATA_DIR,
-                f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-            )
+    # Load the history and compute the indicator once for the whole window
+    try:
+        values = StockstatsUtils.get_stock_stats_window(
+            symbol,
+            indicator,
+            before.strftime("%Y-%m-%d"),
+            end_date,
+            os.path.join(DATA_DIR, "market_data", "price_data"),
+            online=online,
         )
-        data["Date"] = pd.to_datetime(data["Date"], utc=True)
-        dates_in_df = data["Date"].astype(str).str[:10]
+        failed = False
+    except Exception as e:
+        if not online:
+            raise
+        print(f"Error getting stockstats indicator data for indicator {indicator}: {e}")
+        values, failed = {}, True
+
+    ind_string = ""
+    while curr_date >= before:
+        day = curr_date.strftime("%Y-%m-%d")
+        if day in values:
+            ind_string += f"{day}: {values[day]}\n"
+        elif online:
+            # Every calendar day is listed online; offline only trading dates
+            indicator_value = "" if failed else "N/A: Not a trading day (weekend or holiday)"
+            ind_string += f"{day}: {indicator_value}\n"
+
+        curr_date = curr_date - relativedelta(days=1)
 
-        ind_string = ""
-        while curr_date >= before:
-            # only do the trading dates
-            if curr_date.strftime("%Y-%m-%d") in dates_in_df.values:
-                indicator_value = get_stockstats_indicator(
-                    symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-                )
+    result_str = (
+        f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
+        + ind_string
+        + "\n\n"
+        + STOCKSTATS_INDICATOR_DESCRIPTIONS.get(indicator, "No description available.")
+    )
 
-                ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
+    return result_str
 
-            curr_date = curr_date - relativedelta(days=1)
-    else:
-        # online gathering
-        ind_string = ""
-        while curr_date >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-            )
 
-            ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
+def get_stock_stats_indicators_table(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[List[str], "technical indicators to get the analysis and report of"],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    look_back_days: Annotated[int, "how many days to look back"],
+    online: Annotated[bool, "to fetch data online or offline"],
+) -> str:
+    """
+    Report several stockstats indicators over a window as one table
 
-            curr_date = curr_date - relativedelta(days=1)
+    The price history is loaded once and every indicator is computed over the
+    same frame; rows are the trading days in the window, most recent first.
+    """
+    if isinstance(indicators, str):
+        indicators = indicators.split(",")
+    indicators = list(dict.fromkeys(name.strip() for name in indicators if name.strip()))
+    if not indicators:
+        raise ValueError("Please provide at least one indicator")
+    unsupported = [name for name in indicators if name not in STOCKSTATS_INDICATOR_DESCRIPTIONS]
+    if unsupported:
+        raise ValueError(
+            f"Indicators {unsupported} are not supported. Please choose from: {list(STOCKSTATS_INDICATOR_DESCRIPTIONS.keys())}"
+        )
 
-    result_str = (
-        f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
-        + ind_string
-        + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
+    before = datetime.strptime(curr_date, "%Y-%m-%d") - relativedelta(days=look_back_days)
+    table = StockstatsUtils.get_stock_stats_table(
+        symbol,
+        indicators,
+        before.strftime("%Y-%m-%d"),
+        curr_date,
+        os.path.join(DATA_DIR, "market_data", "price_data"),
+        online=online,
     )
 
+    result_str = f"## Indicator values for {symbol} from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
+    if table.empty:
+        result_str += "No trading days in this window.\n"
+    else:
+        result_str += "| Date | " + " | ".join(indicators) + " |\n"
+        result_str += "|" + "---|" * (len(indicators) + 1) + "\n"
+        for date, row in zip(table.index[::-1], table.values[::-1]):
+            cells = ["N/A" if pd.isna(value) else f"{value:.4f}" for value in row]
+            result_str += f"| {date} | " + " | ".join(cells) + " |\n"
+
+    result_str += "\n"
+    for name in indicators:
+        result_str += f"- {name}: {STOCKSTATS_INDICATOR_DESCRIPTIONS[name]}\n"
     return result_str
 
 
@@ -600,25 +598,16 @@ def get_YFin_data_window(
     before = date_obj - relativedelta(days=look_back_days)
     start_date = before.strftime("%Y-%m-%d")
 
-    # read in data
-    data = pd.read_csv(
+    # Read only the rows between the start and end dates (inclusive)
+    filtered_data = read_price_range(
         os.path.join(
             DATA_DIR,
             f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
+        ),
+        start_date,
+        curr_date,
     )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= curr_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
-
     # Set pandas display options to show the full DataFrame
     with pd.option_context(
         "display.max_rows", None, "display.max_columns", None, "display.width", None
@@ -640,11 +629,12 @@ def get_YFin_data_online(
     datetime.strptime(start_date, "%Y-%m-%d")
     datetime.strptime(end_date, "%Y-%m-%d")
 
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
-
     # Fetch historical data for the specified date range
-    data = ticker.history(start=start_date, end=end_date)
+    data = cassette_call(
+        "yfinance",
+        {"method": "history", "symbol": symbol.upper(), "start": start_date, "end": end_date},
+        lambda: yf.Ticker(symbol.upper()).history(start=start_date, end=end_date),
+    )
 
     # Check if data is empty
     if data.empty:
@@ -678,29 +668,20 @@ def get_YFin_data(
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
 ) -> str:
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-
     if end_date > "2025-03-25":
         raise Exception(
             f"Get_YFin_Data: {end_date} is outside of the data range of 2015-01-01 to 2025-03-25"
         )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    # Read only the rows between the start and end dates (inclusive)
+    filtered_data = read_price_range(
+        os.path.join(
+            DATA_DIR,
+            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
+        ),
+        start_date,
+        end_date,
+    )
 
     # remove the index from the dataframe
     filtered_data = filtered_data.reset_index(drop=True)
@@ -708,110 +689,115 @@ def get_YFin_data(
     return filtered_data
 
 
-def get_stock_news_openai(ticker, curr_date):
+_web_search_caches = {}
+_web_search_caches_lock = threading.Lock()
+
+
+def get_web_search_cache() -> DiskCache:
+    """Return the store shared by every process using the same data_cache_dir."""
+    path = os.path.join(get_config()["data_cache_dir"], "openai_web_search.sqlite")
+    with _web_search_caches_lock:
+        if path not in _web_search_caches:
+            _web_search_caches[path] = DiskCache(path)
+        return _web_search_caches[path]
+
+
+def _openai_web_search(prompt: str, tool: str, scope: str, window: str) -> str:
+    """
+    Run a web-search backed OpenAI response for ``prompt`` and return its text
+
+    In live mode answers are cached by (tool, scope, window, model) for
+    openai_search_cache_ttl_hours, so e.g. global news for a date is only
+    searched once however many tickers are analysed. ``scope`` is the ticker,
+    or "global" for ticker-independent searches.
+    """
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"], api_key=config["api_key"])
-
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search Social Media for {ticker} from 7 days before {curr_date} to {curr_date}? Make sure you only get the data posted during that period.",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
+    ttl_hours = config.get("openai_search_cache_ttl_hours")
+    use_cache = bool(ttl_hours) and get_data_mode() == "live"
+    cache_key = json.dumps([tool, scope.upper(), window, config["quick_think_llm"]])
+    if use_cache:
+        cached = get_web_search_cache().get(cache_key, max_age=ttl_hours * 3600)
+        if cached is not MISSING:
+            return cached
+
+    def fetch():
+        client = OpenAI(base_url=config["backend_url"], api_key=config["api_key"])
+        response = client.responses.create(
+            model=config["quick_think_llm"],
+            input=[
+                {
+                    "role": "system",
+                    "content": [
+                        {
+                            "type": "input_text",
+                            "text": prompt,
+                        }
+                    ],
+                }
+            ],
+            text={"format": {"type": "text"}},
+            reasoning={},
+            tools=[
+                {
+                    "type": "web_search_preview",
+                    "user_location": {"type": "approximate"},
+                    "search_context_size": "low",
+                }
+            ],
+            temperature=1,
+            max_output_tokens=4096,
+            top_p=1,
+            store=True,
+        )
+        return response.output[1].content[0].text
+
+    text = cassette_call(
+        "openai_web_search",
+        {"model": config["quick_think_llm"], "prompt": prompt},
+        fetch,
     )
+    if use_cache:
+        cache = get_web_search_cache()
+        cache.set(cache_key, text)
+        max_mb = config.get("openai_search_cache_max_mb")
+        cache.evict(
+            max_age=ttl_hours * 3600,
+            max_bytes=int(max_mb * 1024 * 1024) if max_mb else None,
+        )
+    return text
 
-    return response.output[1].content[0].text
 
+def _news_window(curr_date: str, days: int = 7) -> str:
+    before = datetime.strptime(curr_date, "%Y-%m-%d") - relativedelta(days=days)
+    return f"{before.strftime('%Y-%m-%d')}..{curr_date}"
 
-def get_global_news_openai(curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"], api_key=config["api_key"])
-
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search global or macroeconomics news from 7 days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period.",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
+
+def get_stock_news_openai(ticker, curr_date):
+    return _openai_web_search(
+        f"Can you search Social Media for {ticker} from 7 days before {curr_date} to {curr_date}? Make sure you only get the data posted during that period.",
+        "stock_news",
+        ticker,
+        _news_window(curr_date),
     )
 
-    return response.output[1].content[0].text
+
+def get_global_news_openai(curr_date):
+    return _openai_web_search(
+        f"Can you search global or macroeconomics news from 7 days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period.",
+        "global_news",
+        "global",
+        _news_window(curr_date),
+    )
 
 
 def get_fundamentals_openai(ticker, curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"], api_key=config["api_key"])
-
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
+    return _openai_web_search(
+        f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc",
+        "fundamentals",
+        ticker,
+        curr_date,
     )
 
-    return response.output[1].content[0].text
-
 
 # ===== CRYPTO TRADING FUNCTIONS =====
 
@@ -832,6 +818,53 @@ def get_crypto_market_analysis(
     return get_crypto_market_data(symbol)
 
 
+def get_crypto_market_overview(
+    symbols: Annotated[str, "Comma-separated cryptocurrency symbols like BTC,ETH,ADA"],
+) -> str:
+    """
+    Get a compact market snapshot for several cryptocurrencies in one request
+    
+    Args:
+        symbols: Comma-separated crypto symbols (e.g., 'BTC,ETH,ADA')
+    
+    Returns:
+        String containing a market snapshot table
+    """
+    symbol_list = [s.strip() for s in symbols.split(",") if s.strip()]
+    return get_crypto_market_snapshots(symbol_list)
+
+
+def get_crypto_analysis_bundle(
+    symbol: Annotated[str, "Cryptocurrency symbol like BTC, ETH, ADA"],
+    curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "How many days to look back"] = 30,
+) -> str:
+    """
+    Get market data, price history, technical analysis and news in one call
+    
+    The four CoinGecko reports are fetched concurrently, so the call takes
+    about as long as the slowest of them rather than their sum.
+    
+    Args:
+        symbol: Crypto symbol (e.g., 'BTC', 'ETH', 'ADA')
+        curr_date: Current date in yyyy-mm-dd format
+        look_back_days: Number of days of price history to include
+    
+    Returns:
+        String containing all four reports
+    """
+    curr_date_obj = datetime.strptime(curr_date, "%Y-%m-%d")
+    start_date = (curr_date_obj - relativedelta(days=look_back_days)).strftime("%Y-%m-%d")
+    
+    reports = run_crypto_data_calls([
+        ("get_crypto_market_data", {"symbol": symbol}),
+        ("get_crypto_price_data", {"symbol": symbol, "start_date": start_date, "end_date": curr_date}),
+        ("get_crypto_technical_indicators", {"symbol": symbol, "curr_date": curr_date, "look_back_days": look_back_days}),
+        ("get_crypto_news", {"symbol": symbol, "curr_date": curr_date, "look_back_days": 7}),
+    ])
+    return "\n\n".join(reports)
+
+
 def get_crypto_price_history(
     symbol: Annotated[str, "Cryptocurrency symbol like BTC, ETH, ADA"],
     curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
@@ -876,6 +909,28 @@ def get_crypto_technical_analysis(
     return get_crypto_technical_indicators(symbol, curr_date, look_back_days)
 
 
+def get_crypto_indicators_report(
+    symbol: Annotated[str, "Cryptocurrency symbol like BTC, ETH, ADA"],
+    curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "How many days to report"] = 30,
+    indicators: Annotated[str, "Comma-separated indicator names, empty for the default set"] = "",
+) -> str:
+    """
+    Get daily technical indicators (RSI, MACD, Bollinger, ATR, moving averages) for a cryptocurrency
+
+    Args:
+        symbol: Crypto symbol (e.g., 'BTC', 'ETH', 'ADA')
+        curr_date: Current date in yyyy-mm-dd format
+        look_back_days: Number of days to report
+        indicators: Comma-separated indicator names such as 'rsi,macd,close_50_sma'
+
+    Returns:
+        String containing a table of indicator values
+    """
+    indicator_list = [name.strip() for name in indicators.split(",") if name.strip()]
+    return get_crypto_indicators(symbol, curr_date, look_back_days, indicator_list or None)
+
+
 def get_crypto_news_analysis(
     symbol: Annotated[str, "Cryptocurrency symbol like BTC, ETH, ADA"],
     curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
@@ -0,0 +1,208 @@
+import json
+import os
+import shutil
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from tradingagents.utils.file_lock import InterProcessLock
+
+LAYOUT_VERSION = 1
+
+
+class PriceColumns:
+    """Read-only, memory-mapped columnar copy of one price CSV.
+
+    Every CSV column is stored as its own ``.npy`` file (strings as fixed-width
+    unicode, so the raw ``Date`` text is preserved) next to a ``date_key``
+    column of day numbers. Range queries binary-search ``date_key`` and only
+    touch the pages of the rows and columns they return, and processes that
+    open the same files share those pages through the OS cache.
+    """
+
+    def __init__(self, directory: str, meta: Dict):
+        self.directory = directory
+        self.meta = meta
+        self.columns: List[str] = meta["columns"]
+        self.date_key = np.load(os.path.join(directory, "date_key.npy"), mmap_mode="r")
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def column(self, name: str) -> np.ndarray:
+        with self._lock:
+            if name not in self._arrays:
+                index = self.columns.index(name)
+                self._arrays[name] = np.load(
+                    os.path.join(self.directory, f"col_{index}.npy"), mmap_mode="r"
+                )
+            return self._arrays[name]
+
+    def rows(self, start_date: Optional[str] = None, end_date: Optional[str] = None):
+        """Row positions with start_date <= date <= end_date (inclusive)."""
+        lo_key = _day_number(start_date) if start_date else None
+        hi_key = _day_number(end_date) if end_date else None
+        if self.meta["sorted"]:
+            lo = 0 if lo_key is None else int(np.searchsorted(self.date_key, lo_key, "left"))
+            hi = len(self.date_key) if hi_key is None else int(
+                np.searchsorted(self.date_key, hi_key, "right")
+            )
+            return slice(lo, max(lo, hi))
+        mask = np.ones(len(self.date_key), dtype=bool)
+        if lo_key is not None:
+            mask &= self.date_key >= lo_key
+        if hi_key is not None:
+            mask &= self.date_key <= hi_key
+        return np.flatnonzero(mask)
+
+    def frame(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """The rows in the date range, indexed by their row number in the CSV."""
+        rows = self.rows(start_date, end_date)
+        if isinstance(rows, slice):
+            index = pd.RangeIndex(rows.start, rows.stop)
+        else:
+            index = pd.Index(rows)
+        data = {name: np.array(self.column(name)[rows]) for name in columns or self.columns}
+        return pd.DataFrame(data, index=index)
+
+
+def _day_number(date: str) -> int:
+    return int(np.datetime64(str(date)[:10], "D").astype(np.int64))
+
+
+def _source_signature(csv_path: str) -> Tuple[int, int]:
+    stat = os.stat(csv_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def convert_csv(csv_path: str, directory: str) -> Dict:
+    """
+    Write the columnar layout of a price CSV into ``directory``
+
+    The CSV must have a ``Date`` column whose first ten characters are
+    yyyy-mm-dd. Returns the layout metadata.
+    """
+    signature = _source_signature(csv_path)
+    data = pd.read_csv(csv_path)
+    date_key = np.array(data["Date"].astype(str).str[:10].to_numpy(), dtype="datetime64[D]")
+    date_key = date_key.astype(np.int64)
+
+    tmp_dir = f"{directory}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    np.save(os.path.join(tmp_dir, "date_key.npy"), date_key)
+
+    dtypes = {}
+    for index, name in enumerate(data.columns):
+        series = data[name]
+        if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+            values = series.to_numpy()
+        else:
+            if series.isna().any():
+                raise ValueError(f"Column {name} of {csv_path} has missing text values")
+            values = series.astype(str).to_numpy(dtype=str)
+        np.save(os.path.join(tmp_dir, f"col_{index}.npy"), values)
+        dtypes[name] = values.dtype.str
+
+    meta = {
+        "version": LAYOUT_VERSION,
+        "source": os.path.abspath(csv_path),
+        "source_mtime_ns": signature[0],
+        "source_size": signature[1],
+        "rows": len(data),
+        "columns": list(data.columns),
+        "dtypes": dtypes,
+        "sorted": bool(np.all(date_key[1:] >= date_key[:-1])),
+    }
+    with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+        json.dump(meta, f)
+
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp_dir, directory)
+    return meta
+
+
+def _read_meta(directory: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(directory, "meta.json"), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _is_current(meta: Optional[Dict], signature: Tuple[int, int]) -> bool:
+    return (
+        meta is not None
+        and meta.get("version") == LAYOUT_VERSION
+        and (meta.get("source_mtime_ns"), meta.get("source_size")) == signature
+    )
+
+
+_opened: Dict[str, Tuple[Tuple[int, int], PriceColumns]] = {}
+_opened_lock = threading.Lock()
+
+
+def open_price_columns(csv_path: str) -> PriceColumns:
+    """
+    Open the columnar copy of ``csv_path``, converting it first if needed
+
+    Copies live under data_cache_dir/price_columns and are rebuilt whenever
+    the CSV's size or modification time changes.
+    """
+    signature = _source_signature(csv_path)
+    path = os.path.abspath(csv_path)
+    with _opened_lock:
+        opened = _opened.get(path)
+        if opened is not None and opened[0] == signature:
+            return opened[1]
+
+    root = os.path.join(get_config()["data_cache_dir"], "price_columns")
+    name = os.path.splitext(os.path.basename(path))[0]
+    directory = os.path.join(root, name)
+
+    meta = _read_meta(directory)
+    if not _is_current(meta, signature) or meta.get("source") != path:
+        with InterProcessLock(f"{directory}.lock").acquire():
+            meta = _read_meta(directory)
+            if not _is_current(meta, signature) or meta.get("source") != path:
+                meta = convert_csv(csv_path, directory)
+
+    columns = PriceColumns(directory, meta)
+    with _opened_lock:
+        _opened[path] = (signature, columns)
+    return columns
+
+
+def read_price_range(
+    csv_path: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Rows of a price CSV whose Date falls in [start_date, end_date]
+
+    Equivalent to reading the CSV and filtering on ``Date.str[:10]``,
+    keeping the original row numbers as the index. Served from the columnar
+    copy unless columnar_price_data is disabled.
+    """
+    if get_config().get("columnar_price_data", True):
+        try:
+            return open_price_columns(csv_path).frame(start_date, end_date)
+        except ValueError as e:
+            print(f"Columnar price data unavailable for {csv_path}: {e}")
+
+    data = pd.read_csv(csv_path)
+    dates = data["Date"].str[:10]
+    mask = pd.Series(True, index=data.index)
+    if start_date:
+        mask &= dates >= start_date
+    if end_date:
+        mask &= dates <= end_date
+    return data[mask]
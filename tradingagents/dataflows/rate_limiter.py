@@ -0,0 +1,269 @@
+import asyncio
+import json
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from tradingagents.utils.file_lock import InterProcessLock
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by all threads (and optionally processes).
+
+    Callers reserve a token and sleep until it is due, so concurrent callers
+    are spread evenly at the configured rate instead of bursting into 429s.
+    When ``lock_file`` is given the bucket state lives in that file and is
+    shared by every process using the same path.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        burst: Optional[float] = None,
+        lock_file: Optional[str] = None,
+    ):
+        self.rate = rate_per_minute / 60.0
+        # Default burst: ten seconds' worth of quota
+        self.capacity = float(burst if burst is not None else max(1.0, self.rate * 10))
+        self._lock = threading.Lock()
+        self._file_lock = InterProcessLock(lock_file) if lock_file else None
+        self._tokens = self.capacity
+        self._updated = time.time()
+
+        self._acquired = 0
+        self._delayed = 0
+        self._waiting = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._penalties = 0
+
+    def _reserve(self, tokens: float, penalty: float = 0.0) -> float:
+        """Take ``tokens`` (possibly going into debt) and return the wait time."""
+        if self._file_lock is None:
+            with self._lock:
+                self._tokens, self._updated, wait = self._update(
+                    self._tokens, self._updated, tokens, penalty
+                )
+            return wait
+
+        with self._file_lock.acquire() as f:
+            f.seek(0)
+            try:
+                state = json.loads(f.read() or b"{}")
+            except ValueError:
+                state = {}
+            tokens_left, updated, wait = self._update(
+                state.get("tokens", self.capacity),
+                state.get("updated", time.time()),
+                tokens,
+                penalty,
+            )
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps({"tokens": tokens_left, "updated": updated}).encode())
+            f.flush()
+        return wait
+
+    def _update(self, available: float, updated: float, tokens: float, penalty: float):
+        now = time.time()
+        available = min(self.capacity, available + (now - updated) * self.rate)
+        if penalty:
+            # Nobody gets a token until the penalty has elapsed
+            available = min(available, -penalty * self.rate)
+        available -= tokens
+        wait = -available / self.rate if available < 0 else 0.0
+        return available, now, wait
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until ``tokens`` are available and return the time waited."""
+        wait = self._start_wait(tokens)
+        if wait > 0:
+            time.sleep(wait)
+            self._end_wait(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Like :meth:`acquire` but sleeps without blocking the event loop."""
+        if self._file_lock is None:
+            wait = self._start_wait(tokens)
+        else:
+            # Waiting for the shared lock file would stall every coroutine
+            wait = await asyncio.to_thread(self._start_wait, tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+            self._end_wait(wait)
+        return wait
+
+    def _start_wait(self, tokens: float) -> float:
+        wait = self._reserve(tokens)
+        with self._lock:
+            self._acquired += 1
+            if wait > 0:
+                self._delayed += 1
+                self._waiting += 1
+        return wait
+
+    def _end_wait(self, wait: float):
+        with self._lock:
+            self._waiting -= 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+
+    def penalize(self, seconds: float):
+        """Hold back every caller for ``seconds``, e.g. after a 429 Retry-After."""
+        if seconds <= 0:
+            return
+        self._reserve(0.0, penalty=seconds)
+        with self._lock:
+            self._penalties += 1
+
+    async def penalize_async(self, seconds: float):
+        """Like :meth:`penalize` without blocking the event loop on the lock file."""
+        if self._file_lock is None:
+            self.penalize(seconds)
+        else:
+            await asyncio.to_thread(self.penalize, seconds)
+
+    def stats(self) -> Dict[str, float]:
+        """Queue-wait metrics since the limiter was created."""
+        with self._lock:
+            return {
+                "acquired": self._acquired,
+                "delayed": self._delayed,
+                "waiting": self._waiting,
+                "total_wait_seconds": round(self._total_wait, 3),
+                "avg_wait_seconds": round(self._total_wait / self._acquired, 3)
+                if self._acquired
+                else 0.0,
+                "max_wait_seconds": round(self._max_wait, 3),
+                "penalties": self._penalties,
+            }
+
+
+class AdaptiveDelay:
+    """Jittered spacing between request starts, shared by all threads.
+
+    Meant for sites without a published quota. Requests start roughly
+    ``base`` seconds apart; every push-back (429, captcha) doubles the
+    spacing up to ``cap`` and every success shrinks it back towards ``base``.
+    """
+
+    def __init__(self, base: float, cap: float = 60.0, jitter: float = 0.5):
+        self.base = base
+        self.cap = cap
+        self.jitter = jitter
+        self._delay = base
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def delay(self) -> float:
+        with self._lock:
+            return self._delay
+
+    def wait(self) -> float:
+        """Block until this caller's turn and return the time waited."""
+        with self._lock:
+            now = time.time()
+            start = max(now, self._next_start)
+            spacing = self._delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+            self._next_start = start + spacing
+        wait = start - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def backoff(self, seconds: Optional[float] = None):
+        """Widen the spacing and hold every caller for ``seconds`` (default: the new spacing)."""
+        with self._lock:
+            self._delay = min(self.cap, max(self.base, self._delay * 2))
+            hold = self._delay if seconds is None else seconds
+            self._next_start = max(self._next_start, time.time() + hold)
+
+    def relax(self):
+        with self._lock:
+            self._delay = max(self.base, self._delay * 0.8)
+
+
+class CircuitBreaker:
+    """Stops calls to a service that keeps refusing them.
+
+    After ``threshold`` consecutive failures the breaker opens and
+    :meth:`allow` returns False for ``cooldown`` seconds. Then a single
+    trial call is let through: success closes the breaker, failure reopens it.
+    """
+
+    def __init__(self, threshold: int = 3, cooldown: float = 300.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if not self._trial and time.time() - self._opened_at >= self.cooldown:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.threshold:
+                self._opened_at = time.time()
+                self._trial = False
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Exponential backoff with full jitter for the given retry attempt."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    name: str,
+    rate_per_minute: float,
+    burst: Optional[float] = None,
+    lock_file: Optional[str] = None,
+) -> TokenBucket:
+    """Return the process-wide limiter registered under ``name``."""
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = TokenBucket(rate_per_minute, burst, lock_file)
+            _limiters[name] = limiter
+        return limiter
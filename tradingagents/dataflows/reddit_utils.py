@@ -1,11 +1,21 @@
 import requests
 import time
 import json
+import heapq
 from datetime import datetime, timedelta
 from contextlib import contextmanager
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Dict, Iterable, Iterator, List, Optional, Tuple
 import os
 import re
+import threading
+
+try:
+    import orjson
+except ImportError:  # optional; json parses the same posts, only slower
+    orjson = None
+
+from .config import get_config
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -48,88 +58,325 @@ ticker_to_company = {
     "PINS": "Pinterest",
 }
 
+# Names crypto assets go by on Reddit, in the same "A OR B" form
+crypto_to_name = {
+    "BTC": "Bitcoin",
+    "ETH": "Ethereum OR Ether",
+    "SOL": "Solana",
+    "XRP": "Ripple",
+    "ADA": "Cardano",
+    "DOGE": "Dogecoin",
+    "SHIB": "Shiba Inu",
+    "BNB": "Binance Coin",
+    "DOT": "Polkadot",
+    "AVAX": "Avalanche",
+    "MATIC": "Polygon",
+    "LINK": "Chainlink",
+    "LTC": "Litecoin",
+    "BCH": "Bitcoin Cash",
+    "UNI": "Uniswap",
+    "ATOM": "Cosmos",
+    "XLM": "Stellar",
+    "XMR": "Monero",
+    "TRX": "Tron",
+    "TON": "Toncoin",
+    "USDT": "Tether",
+    "USDC": "USD Coin",
+}
 
-def fetch_top_from_category(
+# Ticker -> extra names registered at runtime, see register_aliases
+_extra_aliases: Dict[str, List[str]] = {}
+
+
+def register_aliases(ticker: str, *names: str):
+    """Make Reddit company news for ``ticker`` also match ``names``."""
+    ticker = ticker.upper()
+    aliases = _extra_aliases.setdefault(ticker, [])
+    aliases.extend(name for name in names if name not in aliases)
+    get_query_matcher.cache_clear()
+
+
+def get_search_terms(query: str) -> List[str]:
+    """
+    Names a ticker is searched for in Reddit posts
+
+    Combines ticker_to_company, crypto_to_name and registered aliases. Pairs
+    like BTC-USD fall back to their base symbol, and unknown tickers are
+    searched for by the ticker alone.
+    """
+    key = query.upper()
+    if key not in ticker_to_company and key not in crypto_to_name and key not in _extra_aliases:
+        key = re.split(r"[-/]", key)[0]
+
+    names = []
+    for registry in (ticker_to_company, crypto_to_name):
+        if key in registry:
+            names.extend(registry[key].split(" OR "))
+    names.extend(_extra_aliases.get(key, []))
+    names.extend([key, query])
+
+    terms = []
+    for name in names:
+        name = name.strip()
+        if name and name.lower() not in (term.lower() for term in terms):
+            terms.append(name)
+    return terms
+
+
+@lru_cache(maxsize=256)
+def get_query_matcher(query: str) -> re.Pattern:
+    """
+    One case-insensitive pattern matching any search term of ``query`` as a
+    whole word, so "Apple" no longer matches "pineapple"
+    """
+    terms = sorted(get_search_terms(query), key=len, reverse=True)
+    alternation = "|".join(re.escape(term) for term in terms)
+    return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+
+
+class RedditFileIndex:
+    """Byte offsets of the posts in one subreddit JSONL file, grouped by UTC date.
+
+    Built with one pass over the file and saved as JSON under
+    ``data_cache_dir/reddit_index``; it is rebuilt whenever the file's size
+    or modification time changes. Readers then seek straight to the posts of
+    the dates they need instead of parsing the whole file.
+    """
+
+    def __init__(self, path: str, signature: Tuple[int, int], dates: Dict[str, List[List[int]]]):
+        self.path = path
+        self.signature = signature
+        self.dates = dates
+
+    def read_range(self, dates: Iterable[str]) -> Iterator[Tuple[str, dict]]:
+        """Yield (date, post) for the posts of ``dates``, each date in file order."""
+        with open(self.path, "rb") as f:
+            for date in dates:
+                for offset, length in self.dates.get(date, ()):
+                    f.seek(offset)
+                    yield date, _loads(f.read(length))
+
+
+def _loads(line: bytes) -> dict:
+    return orjson.loads(line) if orjson is not None else json.loads(line)
+
+
+def _post_date(post: dict) -> str:
+    return datetime.utcfromtimestamp(post["created_utc"]).strftime("%Y-%m-%d")
+
+
+def _file_signature(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _build_file_index(path: str) -> Dict[str, List[List[int]]]:
+    dates: Dict[str, List[List[int]]] = {}
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            length = len(line)
+            if line.strip():
+                dates.setdefault(_post_date(_loads(line)), []).append([offset, length])
+            offset += length
+    return dates
+
+
+_file_indexes: Dict[str, RedditFileIndex] = {}
+_file_indexes_lock = threading.Lock()
+# One lock per subreddit file, so a single thread builds its index
+_file_index_build_locks: Dict[str, threading.Lock] = {}
+
+
+def _cached_file_index(path: str, signature) -> Optional[RedditFileIndex]:
+    with _file_indexes_lock:
+        index = _file_indexes.get(path)
+    if index is not None and index.signature == signature:
+        return index
+    return None
+
+
+def get_reddit_file_index(category: str, path: str) -> RedditFileIndex:
+    """Return the up-to-date date index of a subreddit file, building it if needed."""
+    signature = _file_signature(path)
+    index = _cached_file_index(path, signature)
+    if index is not None:
+        return index
+
+    with _file_indexes_lock:
+        build_lock = _file_index_build_locks.setdefault(path, threading.Lock())
+    with build_lock:
+        # Another thread may have built it while this one waited
+        index = _cached_file_index(path, signature)
+        if index is not None:
+            return index
+
+        index_path = os.path.join(
+            get_config()["data_cache_dir"], "reddit_index", category, f"{os.path.basename(path)}.json"
+        )
+        dates = None
+        try:
+            with open(index_path, "r") as f:
+                cached = json.load(f)
+            if tuple(cached["signature"]) == signature:
+                dates = cached["dates"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        if dates is None:
+            dates = _build_file_index(path)
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            tmp_path = f"{index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"signature": list(signature), "dates": dates}, f)
+            os.replace(tmp_path, index_path)
+
+        index = RedditFileIndex(path, signature, dates)
+        with _file_indexes_lock:
+            _file_indexes[path] = index
+    return index
+
+
+# Raw created_utc values of a JSONL line. Quotes inside JSON strings are
+# escaped, so only real keys match, though nested objects (e.g. crossposts)
+# can contribute values of their own.
+_CREATED_UTC_RE = re.compile(rb'"created_utc"\s*:\s*(-?[0-9][0-9.eE+-]*)')
+
+
+def _may_fall_in(line: bytes, lo: float, hi: float) -> bool:
+    """False only if the raw line shows the post was created outside [lo, hi)."""
+    values = _CREATED_UTC_RE.findall(line)
+    if not values:
+        return True
+    try:
+        return any(lo <= float(value) < hi for value in values)
+    except ValueError:
+        return True
+
+
+def _date_range(start_date: str, end_date: str) -> List[str]:
+    curr_date = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    dates = []
+    while curr_date <= end:
+        dates.append(curr_date.strftime("%Y-%m-%d"))
+        curr_date += timedelta(days=1)
+    return dates
+
+
+def _iter_posts_range(category: str, path: str, dates: List[str]) -> Iterator[Tuple[str, dict]]:
+    """(date, post) for the posts of ``path`` created on ``dates``, in file order
+    within each date. Uses the date index when enabled, otherwise one scan."""
+    if not dates:
+        return
+    if get_config().get("reddit_index", True):
+        yield from get_reddit_file_index(category, path).read_range(dates)
+        return
+
+    wanted = set(dates)
+    # Timestamp bounds of the range, padded by a second so rounding in
+    # utcfromtimestamp can never make the prefilter drop a wanted post
+    lo = (datetime.strptime(dates[0], "%Y-%m-%d") - datetime(1970, 1, 1)).total_seconds() - 1
+    hi = (datetime.strptime(dates[-1], "%Y-%m-%d") - datetime(1970, 1, 1)).total_seconds() + 86401
+    with open(path, "rb") as f:
+        for line in f:
+            # skip empty lines
+            if not line.strip() or not _may_fall_in(line, lo, hi):
+                continue
+            parsed_line = _loads(line)
+            post_date = _post_date(parsed_line)
+            if post_date in wanted:
+                yield post_date, parsed_line
+
+
+def fetch_top_from_category_range(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
     ],
-    date: Annotated[str, "Date to fetch top posts from."],
-    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
     query: Annotated[str, "Optional query to search for in the subreddit."] = None,
     data_path: Annotated[
         str,
         "Path to the data folder. Default is 'reddit_data'.",
     ] = "reddit_data",
-):
-    base_path = data_path
+) -> Dict[str, List[dict]]:
+    """
+    Top posts of every day from start_date to end_date (inclusive)
 
-    all_content = []
+    Each subreddit file is read once for the whole range, and only the best
+    posts of each (day, subreddit) are kept while reading. Returns date ->
+    the posts ``fetch_top_from_category`` gives for that date, in the same order.
+    """
+    base_path = data_path
+    data_files = os.listdir(os.path.join(base_path, category))
 
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
+    if max_limit < len(data_files):
         raise ValueError(
             "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
         )
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
+    limit_per_subreddit = max_limit // len(data_files)
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
+    dates = _date_range(start_date, end_date)
+    all_content = {date: [] for date in dates}
+    matcher = get_query_matcher(query) if "company" in category and query else None
+
+    for data_file in data_files:
         # check if data_file is a .jsonl file
         if not data_file.endswith(".jsonl"):
             continue
 
-        all_content_curr_subreddit = []
-
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
+        # per-day min-heaps of (upvotes, -position, post). The position makes
+        # earlier posts win ties, as with a stable sort by upvotes
+        top_posts: Dict[str, list] = {date: [] for date in dates}
 
-                parsed_line = json.loads(line)
+        posts = _iter_posts_range(category, os.path.join(base_path, category, data_file), dates)
+        for position, (date, parsed_line) in enumerate(posts):
+            # if is company_news, check that the title or the content has the company's name (query) mentioned
+            if matcher is not None and not (
+                matcher.search(parsed_line["title"])
+                or matcher.search(parsed_line["selftext"])
+            ):
+                continue
 
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
+            heap = top_posts[date]
+            key = (parsed_line["ups"], -position)
+            if len(heap) >= limit_per_subreddit and key <= heap[0][:2]:
+                continue
 
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
+            post = {
+                "title": parsed_line["title"],
+                "content": parsed_line["selftext"],
+                "url": parsed_line["url"],
+                "upvotes": parsed_line["ups"],
+                "posted_date": date,
+            }
+            if len(heap) < limit_per_subreddit:
+                heapq.heappush(heap, key + (post,))
+            else:
+                heapq.heapreplace(heap, key + (post,))
 
-                    search_terms.append(query)
+        for date in dates:
+            ranked = sorted(top_posts[date], reverse=True)
+            all_content[date].extend(entry[2] for entry in ranked)
 
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
-                        continue
-
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
-
-                all_content_curr_subreddit.append(post)
-
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+    return all_content
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
 
-    return all_content
+def fetch_top_from_category(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    date: Annotated[str, "Date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    return fetch_top_from_category_range(
+        category, date, date, max_limit, query, data_path
+    )[date]
@@ -0,0 +1,164 @@
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from tradingagents.utils.file_lock import InterProcessLock
+
+LAYOUT_VERSION = 1
+
+# Per-ticker frames kept in memory across lookups
+MAX_OPEN_PARTITIONS = 256
+
+
+def read_statements(csv_path: str) -> pd.DataFrame:
+    """Read a SimFin bulk statement file with its dates normalised to UTC days."""
+    df = pd.read_csv(csv_path, sep=";")
+
+    # Convert date strings to datetime objects and remove any time components
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+    return df
+
+
+def _partition_file(directory: str, ticker: str) -> str:
+    return os.path.join(directory, f"{quote(str(ticker), safe='')}.pkl")
+
+
+def _source_signature(csv_path: str) -> Tuple[int, int]:
+    stat = os.stat(csv_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def partition_statements(csv_path: str, directory: str) -> Dict:
+    """
+    Split a SimFin bulk statement file into one pickle per ticker
+
+    Each partition holds the ticker's rows with a known Publish Date, stably
+    sorted by it and keeping their row numbers in the bulk file as index.
+    Returns the layout metadata.
+    """
+    signature = _source_signature(csv_path)
+    df = read_statements(csv_path)
+    df = df[df["Publish Date"].notna()]
+
+    tmp_dir = f"{directory}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    for ticker, rows in df.groupby("Ticker", sort=False):
+        rows = rows.sort_values("Publish Date", kind="mergesort")
+        rows.to_pickle(_partition_file(tmp_dir, ticker))
+
+    meta = {
+        "version": LAYOUT_VERSION,
+        "source": os.path.abspath(csv_path),
+        "source_mtime_ns": signature[0],
+        "source_size": signature[1],
+    }
+    with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+        json.dump(meta, f)
+
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp_dir, directory)
+    return meta
+
+
+def _read_meta(directory: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(directory, "meta.json"), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _is_current(meta: Optional[Dict], csv_path: str, signature: Tuple[int, int]) -> bool:
+    return (
+        meta is not None
+        and meta.get("version") == LAYOUT_VERSION
+        and meta.get("source") == csv_path
+        and (meta.get("source_mtime_ns"), meta.get("source_size")) == signature
+    )
+
+
+def open_statement_partitions(csv_path: str) -> Tuple[str, Tuple[int, int]]:
+    """
+    Directory of the per-ticker partitions of ``csv_path``, building it if needed
+
+    Partitions live under data_cache_dir/simfin and are rebuilt whenever the
+    bulk file's size or modification time changes.
+    """
+    path = os.path.abspath(csv_path)
+    signature = _source_signature(path)
+    statement = os.path.splitext(os.path.basename(path))[0]
+    directory = os.path.join(get_config()["data_cache_dir"], "simfin", statement)
+
+    if not _is_current(_read_meta(directory), path, signature):
+        with InterProcessLock(f"{directory}.lock").acquire():
+            if not _is_current(_read_meta(directory), path, signature):
+                partition_statements(path, directory)
+    return directory, signature
+
+
+_partitions: "OrderedDict[Tuple[str, str], Tuple[Tuple[int, int], Optional[pd.DataFrame], np.ndarray]]" = OrderedDict()
+_partitions_lock = threading.Lock()
+
+
+def _load_partition(directory: str, signature: Tuple[int, int], ticker: str):
+    key = (directory, ticker)
+    with _partitions_lock:
+        cached = _partitions.get(key)
+        if cached is not None and cached[0] == signature:
+            _partitions.move_to_end(key)
+            return cached[1], cached[2]
+
+    partition_file = _partition_file(directory, ticker)
+    if os.path.exists(partition_file):
+        frame = pd.read_pickle(partition_file)
+        publish_dates = frame["Publish Date"].dt.tz_convert(None).to_numpy()
+    else:
+        frame, publish_dates = None, np.empty(0, dtype="datetime64[ns]")
+
+    with _partitions_lock:
+        _partitions[key] = (signature, frame, publish_dates)
+        _partitions.move_to_end(key)
+        while len(_partitions) > MAX_OPEN_PARTITIONS:
+            _partitions.popitem(last=False)
+    return frame, publish_dates
+
+
+def get_latest_statement(csv_path: str, ticker: str, curr_date: str) -> Optional[pd.Series]:
+    """
+    The ticker's statement with the latest Publish Date on or before curr_date
+
+    Ties go to the row that comes first in the bulk file, like ``idxmax``.
+    Returns None when nothing was published by then. Served from the
+    per-ticker partitions unless simfin_partitions is disabled.
+    """
+    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+
+    if not get_config().get("simfin_partitions", True):
+        df = read_statements(csv_path)
+        filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+        if filtered_df.empty:
+            return None
+        return filtered_df.loc[filtered_df["Publish Date"].idxmax()]
+
+    directory, signature = open_statement_partitions(csv_path)
+    frame, publish_dates = _load_partition(directory, signature, ticker)
+    if frame is None:
+        return None
+
+    curr = curr_date_dt.tz_convert(None).to_datetime64()
+    last = int(np.searchsorted(publish_dates, curr, side="right")) - 1
+    if last < 0:
+        return None
+    # first row published on that day, i.e. the earliest in the bulk file
+    first = int(np.searchsorted(publish_dates, publish_dates[last], side="left"))
+    return frame.iloc[first]
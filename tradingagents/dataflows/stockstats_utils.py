@@ -1,9 +1,225 @@
 import pandas as pd
 import yfinance as yf
 from stockstats import wrap
-from typing import Annotated
+from typing import Annotated, Any, Callable, Dict, List, Tuple
+from collections import OrderedDict
 import os
+import re
+import threading
+from .cassette import cassette_call
 from .config import get_config
+from .price_columns import read_price_range
+from tradingagents.utils.file_lock import InterProcessLock
+
+
+class _FrameEntry:
+    """A wrapped frame plus the lock guarding stockstats' in-place column adds."""
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self.dates = frame["Date"].astype(str).str[:10]
+        self.lock = threading.Lock()
+        self.nbytes = 0
+
+    def measure(self) -> int:
+        self.nbytes = int(self.frame.memory_usage(deep=True).sum())
+        return self.nbytes
+
+
+class StatsFrameCache:
+    """Process-wide LRU of stockstats-wrapped price frames.
+
+    Entries are keyed by (symbol, source file, mtime), so a rewritten file is
+    reloaded, and keep the indicator columns stockstats has already computed.
+    The least recently used frames are dropped once the total size exceeds
+    ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple, _FrameEntry]" = OrderedDict()
+        self._loading: Dict[Tuple, threading.Lock] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Tuple, load: Callable[[], pd.DataFrame]) -> _FrameEntry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            load_lock = self._loading.setdefault(key, threading.Lock())
+
+        # Only one thread parses a given file; the others wait for its result
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+            entry = _FrameEntry(load())
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = entry
+                self._loading.pop(key, None)
+                self._bytes += entry.measure()
+                self._evict()
+            return entry
+
+    def resize(self, key: Tuple, entry: _FrameEntry):
+        """Account for indicator columns added to ``entry`` since it was measured."""
+        with self._lock:
+            if self._entries.get(key) is not entry:
+                return
+            self._bytes -= entry.nbytes
+            self._bytes += entry.measure()
+            self._evict()
+
+    def _evict(self):
+        # Always keep the most recent entry, even if it alone exceeds the cap
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.nbytes
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_frame_cache = None
+_frame_cache_lock = threading.Lock()
+
+
+def get_stats_frame_cache() -> StatsFrameCache:
+    """Return the shared frame cache, sized by stockstats_cache_max_mb."""
+    global _frame_cache
+    max_bytes = int(float(get_config().get("stockstats_cache_max_mb", 256)) * 1024 * 1024)
+    with _frame_cache_lock:
+        if _frame_cache is None:
+            _frame_cache = StatsFrameCache(max_bytes)
+        _frame_cache.max_bytes = max_bytes
+        return _frame_cache
+
+
+# Relative Close difference on the overlap bar that means history was re-adjusted
+ADJUSTMENT_TOLERANCE = 1e-6
+YFIN_HISTORY_YEARS = 15
+
+
+def _download_yfin(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    data = cassette_call(
+        "yfinance",
+        {"method": "download", "symbol": symbol, "start": start_date, "end": end_date},
+        lambda: yf.download(
+            symbol,
+            start=start_date,
+            end=end_date,
+            multi_level_index=False,
+            progress=False,
+            auto_adjust=True,
+        ),
+    )
+    data = data.reset_index()
+    if not data.empty:
+        data["Date"] = pd.to_datetime(data["Date"]).dt.strftime("%Y-%m-%d")
+    return data
+
+
+def update_yfin_cache(symbol: str, cache_dir: str) -> str:
+    """
+    Bring the per-symbol daily price cache up to date and return its path
+
+    The first call downloads 15 years of history into
+    ``{symbol}-YFin-data.csv``. Later calls (at most once a day) download only
+    the bars since the last stored date and append them. The last stored bar
+    is re-fetched as an overlap: if its adjusted Close changed, a dividend or
+    split re-adjusted the history and the whole file is downloaded again.
+    Date-stamped files from the previous cache layout are removed when the
+    cache is refreshed. A file already checked today is returned without
+    taking the lock.
+    """
+    data_file = os.path.join(cache_dir, f"{symbol}-YFin-data.csv")
+    today = pd.Timestamp.today()
+    today_str = today.strftime("%Y-%m-%d")
+    if _checked_on(data_file, today):
+        return data_file
+
+    with InterProcessLock(f"{data_file}.lock").acquire():
+        # Another process may have refreshed it while we waited
+        if _checked_on(data_file, today):
+            return data_file
+        _remove_dated_yfin_files(symbol, cache_dir)
+
+        if os.path.exists(data_file):
+            stored = pd.read_csv(data_file)
+            if not stored.empty:
+                last_date = str(stored["Date"].iloc[-1])[:10]
+                fresh = _download_yfin(symbol, last_date, today_str)
+                overlap = fresh[fresh["Date"] == last_date] if not fresh.empty else fresh
+                if overlap.empty or _same_close(
+                    overlap["Close"].iloc[0], stored["Close"].iloc[-1]
+                ):
+                    new_rows = fresh[fresh["Date"] > last_date] if not fresh.empty else fresh
+                    if not new_rows.empty:
+                        new_rows.reindex(columns=stored.columns).to_csv(
+                            data_file, mode="a", header=False, index=False
+                        )
+                    else:
+                        # Nothing new (weekend or holiday); remember we checked today
+                        os.utime(data_file)
+                    return data_file
+                print(f"Adjusted prices for {symbol} changed since {last_date}; refetching full history")
+
+        start_date = (today - pd.DateOffset(years=YFIN_HISTORY_YEARS)).strftime("%Y-%m-%d")
+        data = _download_yfin(symbol, start_date, today_str)
+        if data.empty:
+            print(f"No Yahoo Finance data downloaded for {symbol}")
+            return data_file
+        tmp_file = f"{data_file}.{os.getpid()}.tmp"
+        data.to_csv(tmp_file, index=False)
+        os.replace(tmp_file, data_file)
+        return data_file
+
+
+def _checked_on(data_file: str, day: pd.Timestamp) -> bool:
+    try:
+        checked = pd.Timestamp.fromtimestamp(os.path.getmtime(data_file))
+    except OSError:
+        return False
+    return checked.normalize() == day.normalize()
+
+
+def _same_close(fresh: float, stored: float) -> bool:
+    return abs(float(fresh) - float(stored)) <= ADJUSTMENT_TOLERANCE * max(abs(float(stored)), 1e-12)
+
+
+def _remove_dated_yfin_files(symbol: str, cache_dir: str):
+    date = r"\d{4}-\d{2}-\d{2}"
+    pattern = re.compile(rf"^{re.escape(symbol)}-YFin-data-{date}-{date}\.csv$")
+    for name in os.listdir(cache_dir):
+        if pattern.match(name):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
 
 
 class StockstatsUtils:
@@ -25,63 +241,177 @@ class StockstatsUtils:
             "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
         ] = False,
     ):
-        df = None
-        data = None
+        if online:
+            curr_date = pd.to_datetime(curr_date).strftime("%Y-%m-%d")
 
-        if not online:
-            try:
-                data = pd.read_csv(
-                    os.path.join(
-                        data_dir,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
-                df = wrap(data)
-            except FileNotFoundError:
-                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+        dates, values = StockstatsUtils.get_indicator_column(
+            symbol, indicator, data_dir, online
+        )
+        matching_rows = values[dates.str.startswith(curr_date)]
+
+        if not matching_rows.empty:
+            indicator_value = matching_rows.values[0]
+            return indicator_value
         else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
-
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            config = get_config()
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
+            return "N/A: Not a trading day (weekend or holiday)"
+
+    @staticmethod
+    def get_stock_stats_window(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[str, "first date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "last date of the window, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> Dict[str, Any]:
+        """Indicator values for every trading date in [start_date, end_date].
+
+        Loads the data and computes the indicator once, then slices the date
+        range; returns a date string -> value mapping (first row per date, as
+        in get_stock_stats).
+        """
+        dates, column = StockstatsUtils.get_indicator_column(
+            symbol, indicator, data_dir, online
+        )
+
+        in_window = (dates >= start_date) & (dates <= end_date)
+        values: Dict[str, Any] = {}
+        for date, value in zip(dates[in_window].values, column[in_window].values):
+            values.setdefault(date, value)
+        return values
+
+    @staticmethod
+    def get_indicator_column(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> Tuple[pd.Series, pd.Series]:
+        """Return the (YYYY-mm-dd date, indicator value) series for ``symbol``.
+
+        The wrapped frame comes from the shared frame cache, so the CSV is
+        parsed once per file version and each indicator is computed once.
+        """
+        dates, columns = StockstatsUtils.get_indicator_columns(
+            symbol, [indicator], data_dir, online
+        )
+        return dates, columns[indicator]
+
+    @staticmethod
+    def get_indicator_columns(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicators: Annotated[
+            List[str], "quantitative indicators based off of the stock data for the company"
+        ],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> Tuple[pd.Series, pd.DataFrame]:
+        """Like get_indicator_column for several indicators over one loaded frame."""
+        data_file = StockstatsUtils.get_data_file(symbol, data_dir, online)
+        try:
+            key = (symbol, data_file, os.path.getmtime(data_file))
+        except FileNotFoundError:
+            raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+
+        cache = get_stats_frame_cache()
+        entry = cache.get(key, lambda: StockstatsUtils.load_stats_frame(data_file, online))
+        with entry.lock:
+            missing = [name for name in indicators if name not in entry.frame.columns]
+            # stockstats computes each indicator on first access
+            columns = pd.DataFrame({name: entry.frame[name] for name in indicators})
+        if missing:
+            cache.resize(key, entry)
+        return entry.dates, columns
+
+    @staticmethod
+    def get_stock_stats_table(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicators: Annotated[
+            List[str], "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[str, "first date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "last date of the window, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.DataFrame:
+        """Indicator values for each trading date in [start_date, end_date], one column per indicator."""
+        dates, columns = StockstatsUtils.get_indicator_columns(
+            symbol, indicators, data_dir, online
+        )
+        in_window = (dates >= start_date) & (dates <= end_date)
+        table = columns[in_window.values]
+        table.index = pd.Index(dates[in_window].values, name="Date")
+        return table[~table.index.duplicated(keep="first")]
+
+    @staticmethod
+    def get_data_file(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> str:
+        """Path of the price CSV for ``symbol``, downloading it first when online."""
+        if not online:
+            return os.path.join(
+                data_dir,
+                f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
             )
 
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
-
-            df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
+        # Get config and ensure cache directory exists
+        config = get_config()
+        os.makedirs(config["data_cache_dir"], exist_ok=True)
 
-        df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
+        return update_yfin_cache(symbol, config["data_cache_dir"])
 
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
-            return indicator_value
+    @staticmethod
+    def load_stats_frame(
+        data_file: Annotated[str, "price CSV written by get_data_file"],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.DataFrame:
+        """Read a price CSV and wrap it as a stockstats frame."""
+        if online:
+            data = pd.read_csv(data_file)
+            data["Date"] = pd.to_datetime(data["Date"])
         else:
-            return "N/A: Not a trading day (weekend or holiday)"
+            # The offline datasets are static, so read their columnar copy
+            data = read_price_range(data_file).reset_index(drop=True)
+        df = wrap(data)
+        if online:
+            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
+        return df
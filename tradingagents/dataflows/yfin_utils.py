@@ -6,6 +6,7 @@ from pandas import DataFrame
 import pandas as pd
 from functools import wraps
 
+from .cassette import cassette_call
 from .utils import save_output, SavePathType, decorate_all_methods
 
 
@@ -14,8 +15,11 @@ def init_ticker(func: Callable) -> Callable:
 
     @wraps(func)
     def wrapper(symbol: Annotated[str, "ticker symbol"], *args, **kwargs) -> Any:
-        ticker = yf.Ticker(symbol)
-        return func(ticker, *args, **kwargs)
+        return cassette_call(
+            "yfinance",
+            {"method": func.__name__, "symbol": symbol, "args": args, "kwargs": kwargs},
+            lambda: func(yf.Ticker(symbol), *args, **kwargs),
+        )
 
     return wrapper
 
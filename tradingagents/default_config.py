@@ -17,8 +17,39 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    "memory_persist_dir": os.getenv("TRADINGAGENTS_MEMORY_DIR"),  # keep agent memories on disk, shared by all sessions
+    "memory_backend": os.getenv("TRADINGAGENTS_MEMORY_BACKEND", "chroma"),  # chroma, or numpy for the memory-mapped VectorIndex
+    "memory_vector_dtype": "float32",  # float16 halves the size of the numpy backend's index
+    "embedding_cache": True,  # keep memory embeddings in data_cache_dir/embeddings.sqlite across runs
+    "embedding_cache_max_mb": 256,  # oldest cached embeddings are evicted beyond this size
+    "embedding_batch_size": 256,  # texts per embeddings request when bulk-adding memories
+    "embedding_batch_tokens": 250000,  # estimated tokens (chars / 4) per embeddings request
     # Tool settings
     "online_tools": True,
+    # Data settings
+    "data_mode": os.getenv("TRADINGAGENTS_DATA_MODE", "live"),  # live, record or replay
+    "cassette_path": os.getenv("TRADINGAGENTS_CASSETTE"),  # defaults to data_cache_dir/cassette.sqlite
+    "crypto_price_store": True,  # keep fetched CoinGecko series on disk under data_cache_dir
+    "coingecko_pool_size": int(os.getenv("COINGECKO_POOL_SIZE", "10")),
+    "coingecko_timeout": float(os.getenv("COINGECKO_TIMEOUT", "15")),
+    "coingecko_max_retries": 3,
+    "coingecko_calls_per_min": None,  # None picks the free/pro tier quota from the API key
+    "coingecko_rate_limit_burst": None,
+    "coingecko_rate_limit_file": os.getenv("COINGECKO_RATE_LIMIT_FILE"),  # share the limiter across processes
+    "coingecko_coin_list_ttl_hours": 24,
+    "coingecko_rank_pages": 4,  # /coins/markets pages (250 coins each) used to rank symbol matches
+    "crypto_indicators": None,  # indicator names for get_crypto_indicators_report, None for the default set
+    "stockstats_cache_max_mb": 256,  # memory cap for cached stockstats frames and their indicator columns
+    "columnar_price_data": True,  # serve offline price CSVs from memory-mapped column files
+    "reddit_index": True,  # read Reddit posts through per-file date indexes in data_cache_dir
+    "simfin_partitions": True,  # split SimFin bulk statements into per-ticker files in data_cache_dir
+    "google_news_cache_ttl_hours": 6,  # reuse scraped Google News results, 0 disables
+    "google_news_cache_max_mb": 64,  # oldest scraped results are evicted beyond this size
+    "google_news_workers": 3,  # result pages fetched concurrently after the first one
+    "google_news_delay": 2.0,  # seconds between request starts, widened when Google pushes back
+    "google_news_breaker_cooldown": 300,  # seconds without scraping once Google keeps refusing
+    "openai_search_cache_ttl_hours": 24,  # reuse OpenAI web-search answers, 0 disables
+    "openai_search_cache_max_mb": 64,  # oldest answers are evicted beyond this size
     # Trading settings
     "trading_mode": os.getenv("TRADING_MODE", "paper"),
     "binance_api_key": os.getenv("BINANCE_API_KEY", ""),
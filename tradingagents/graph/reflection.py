@@ -3,6 +3,8 @@
 from typing import Dict, Any
 from langchain_openai import ChatOpenAI
 
+from tradingagents.agents.utils.memory import build_situation
+
 
 class Reflector:
     """Handles reflection on decisions and updating memory."""
@@ -48,12 +50,7 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
 
     def _extract_current_situation(self, current_state: Dict[str, Any]) -> str:
         """Extract the current market situation from the state."""
-        curr_market_report = current_state["market_report"]
-        curr_sentiment_report = current_state["sentiment_report"]
-        curr_news_report = current_state["news_report"]
-        curr_fundamentals_report = current_state["fundamentals_report"]
-
-        return f"{curr_market_report}\n\n{curr_sentiment_report}\n\n{curr_news_report}\n\n{curr_fundamentals_report}"
+        return build_situation(current_state)
 
     def _reflect_on_component(
         self, component_type: str, report: str, situation: str, returns_losses
@@ -16,6 +16,7 @@ from langgraph.prebuilt import ToolNode
 from tradingagents.agents import *
 from tradingagents.default_config import DEFAULT_CONFIG
 from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.agents.utils.tool_memo import tool_call_scope
 from tradingagents.agents.utils.agent_states import (
     AgentState,
     InvestDebateState,
@@ -151,14 +152,19 @@ class TradingAgentsGraph:
         market_tools = [
             # Stock tools (online)
             self.toolkit.get_YFin_data_online,
+            self.toolkit.get_stockstats_indicators_table_online,
             self.toolkit.get_stockstats_indicators_report_online,
             # Stock tools (offline)
             self.toolkit.get_YFin_data,
+            self.toolkit.get_stockstats_indicators_table,
             self.toolkit.get_stockstats_indicators_report,
             # Crypto tools
+            self.toolkit.get_crypto_analysis_bundle,
             self.toolkit.get_crypto_price_history,
             self.toolkit.get_crypto_technical_analysis,
+            self.toolkit.get_crypto_indicators_report,
             self.toolkit.get_crypto_market_analysis,
+            self.toolkit.get_crypto_market_snapshot,
             self.toolkit.get_crypto_news_analysis,
             self.toolkit.get_reddit_stock_info,
         ]
@@ -215,12 +221,11 @@ class TradingAgentsGraph:
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
         )
-        args = self.propagator.get_graph_args()
 
         if self.debug:
             # Debug mode with tracing
             trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
+            for chunk in self.stream(init_agent_state):
                 if len(chunk["messages"]) == 0:
                     pass
                 else:
@@ -230,7 +235,8 @@ class TradingAgentsGraph:
             final_state = trace[-1]
         else:
             # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+            for final_state in self.stream(init_agent_state):
+                pass
 
         # Store current state for reflection
         self.curr_state = final_state
@@ -241,6 +247,26 @@ class TradingAgentsGraph:
         # Return decision and processed signal
         return final_state, self.process_signal(final_state["final_trade_decision"])
 
+    def stream(self, init_state):
+        """Stream the graph's state after each step for an initial state.
+
+        Entry points that show progress (web app, CLI) use this instead of
+        ``graph.stream`` so identical tool calls within the run are executed
+        only once. The agents' memories are switched to the state's ticker.
+        """
+        for memory in self._memories():
+            memory.set_namespace(init_state["company_of_interest"])
+        args = self.propagator.get_graph_args()
+
+        # Analysts often request the same data; run each distinct tool call once
+        with tool_call_scope() as tool_memo:
+            try:
+                yield from self.graph.stream(init_state, **args)
+            finally:
+                # Also reached when the caller stops early or the stream is closed
+                if tool_memo.stats()["calls"]:
+                    print(tool_memo.summary())
+
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
         self.log_states_dict[str(trade_date)] = {
@@ -283,6 +309,20 @@ class TradingAgentsGraph:
         ) as f:
             json.dump(self.log_states_dict, f, indent=4)
 
+    def _memories(self):
+        return [
+            self.bull_memory,
+            self.bear_memory,
+            self.trader_memory,
+            self.invest_judge_memory,
+            self.risk_manager_memory,
+        ]
+
+    def close(self):
+        """Release the agents' memory stores."""
+        for memory in self._memories():
+            memory.close()
+
     def reflect_and_remember(self, returns_losses):
         """Reflect on decisions and update memory based on returns."""
         self.reflector.reflect_bull_researcher(
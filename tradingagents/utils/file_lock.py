@@ -0,0 +1,39 @@
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+
+class InterProcessLock:
+    """Exclusive/shared lock on a file, usable across threads and processes.
+
+    Threads of the same process are serialised with a regular lock first, so
+    the file lock is only contended between processes. On platforms without
+    ``fcntl`` the lock degrades to in-process locking.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    @contextmanager
+    def acquire(self, shared: bool = False):
+        """Hold the lock for the duration of the ``with`` block.
+
+        Yields the open file object so callers can keep small state in it.
+        """
+        with self._thread_lock:
+            with open(self.path, "a+b") as f:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+                try:
+                    yield f
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -123,6 +123,12 @@ class WebMessageBuffer:
 
 def cleanup_session_collections(session_id):
     """Clean up ChromaDB collections for a specific session to prevent memory leaks"""
+    if DEFAULT_CONFIG.get("memory_persist_dir"):
+        # Persistent memories are shared by all sessions and must survive them
+        return
+    if DEFAULT_CONFIG.get("memory_backend") == "numpy":
+        # NumPy indexes live in the session's graph and go away with it
+        return
     try:
         import chromadb
         from chromadb.config import Settings
@@ -183,6 +189,7 @@ def start_analysis():
 def run_analysis_background(session_id: str, config: Dict):
     """Run the trading analysis in background thread"""
     import traceback
+    graph = None
     try:
         if not is_production():
             print(f"[DEBUG] Starting analysis for session {session_id}")
@@ -234,14 +241,11 @@ def run_analysis_background(session_id: str, config: Dict):
             'analysis_date': config['analysis_date']
         }, room=session_id)
         
-        # Get graph args
-        args = graph.propagator.get_graph_args()
-        
         # Stream the analysis
         step_count = 0
         total_steps = len(config['analysts']) * 2 + 5  # Rough estimate
         
-        for chunk in graph.graph.stream(init_state, **args):
+        for chunk in graph.stream(init_state):
             step_count += 1
             progress = min(90, (step_count / total_steps) * 80 + 10)
             
@@ -382,6 +386,10 @@ def run_analysis_background(session_id: str, config: Dict):
         
         # Clean up ChromaDB collections even if analysis failed
         cleanup_session_collections(session_id)
+    finally:
+        # Release the session's memory stores
+        if graph is not None:
+            graph.close()
 
 @socketio.on('connect')
 def handle_connect():